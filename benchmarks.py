@@ -3,6 +3,7 @@ import time
 import csv
 import pathlib
 import random
+import tempfile
 from statistics import mean
 
 import arcade
@@ -15,6 +16,15 @@ WINDOW = arcade.Window(800, 600, title="Bench (hidden)", visible=False)
 
 from src.game.gameview import GameView
 from src.entities.bat import Bat
+from src.entities.blob import Blob
+from src.entities.bat_flock import BatFlock
+from src.entities.blob_patrol import BlobPatrol
+from src.map_builder.level_builder import LevelBuilder
+from src.map_builder import level_cache
+from src.map_builder.tile_grid import TileGrid
+from src.game.tile_physics import TileGridPhysicsEngine
+from src.game.player import Player
+from src import helper, textures
 
 # Dossier de sortie
 OUTPUT = pathlib.Path("benchmarks")
@@ -23,6 +33,8 @@ OUTPUT.mkdir(exist_ok=True)
 # Paramètres à explorer
 WALL_STEPS  = [1, 10, 50, 100, 500, 1_000, 5_000, 10_000]
 ENEMY_STEPS = [1, 3, 5, 10, 50, 100, 500, 1_000]
+BUILD_STEPS = [1_000, 5_000, 10_000, 50_000]     # cases de la grille
+BAT_STEPS   = [100, 1_000, 10_000]
 
 FRAME_COUNT = 200      # appels on_update() par cas
 DT          = 1 / 60   # delta fixe (60 fps)
@@ -77,6 +89,33 @@ def measure_case(n_walls: int, n_enemies: int) -> tuple[float, float]:
 
     return load_time, mean(frame_times)
 
+# ---------------------------------------------------------------------
+# Résultats : CSV + graphique log-log
+# ---------------------------------------------------------------------
+def _write_results(name: str, results: list[dict[str, float]], x_label: str,
+                   series: dict[str, str], x_key: str = "count") -> None:
+    """Écrit `name`.csv et trace `name`.png : une courbe par clé de `series`
+    (clé → légende), en fonction de `x_key`."""
+    csv_path = OUTPUT / f"{name}.csv"
+    with csv_path.open("w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=results[0].keys())
+        writer.writeheader()
+        writer.writerows(results)
+    print("CSV →", csv_path)
+
+    xs = [r[x_key] for r in results]
+    fig, ax = plt.subplots()
+    ax.set_xscale("log"); ax.set_yscale("log")
+    for key, label in series.items():
+        ax.plot(xs, [r[key] for r in results], "o-", label=label)
+    ax.set_xlabel(x_label)
+    ax.legend(); ax.grid(True, which="both", linestyle=":")
+    png_path = OUTPUT / f"{name}.png"
+    fig.savefig(png_path, dpi=150)
+    plt.close(fig)
+    print("PNG →", png_path, "\n")
+
+
 # ---------------------------------------------------------------------
 # Campagne de mesures
 # ---------------------------------------------------------------------
@@ -96,29 +135,236 @@ def run_bench(param_name: str, values: list[int], fixed: int) -> None:
         print(f"{param_name}={val:>6} | load={load_t*1e3:7.2f} ms"
               f" | update={upd_t*1e6:7.2f} µs")
 
-    # CSV ----------------------------------------------------------------
-    csv_path = OUTPUT / f"{param_name}.csv"
-    with csv_path.open("w", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=results[0].keys())
-        writer.writeheader()
-        writer.writerows(results)
-    print("CSV →", csv_path)
+    _write_results(param_name, results, f"Number of {param_name}",
+                   {"load_time": "Load time (s)", "update_time": "Mean on_update (s)"})
 
-    # Graphique log-log ---------------------------------------------------
-    xs        = [r["count"] for r in results]
-    load_ts   = [r["load_time"]   for r in results]
-    update_ts = [r["update_time"] for r in results]
+# ---------------------------------------------------------------------
+# Construction d’un niveau : masques NumPy vs parcours case par case
+# ---------------------------------------------------------------------
+def synthetic_map(n_tiles: int, folder: pathlib.Path) -> pathlib.Path:
+    """Écrit une carte carrée d’environ `n_tiles` cases (sols, pièces, lave)."""
+    side = max(4, int(n_tiles ** 0.5))
+    rnd = random.Random(n_tiles)
+    rows = ["".join(rnd.choice("==-x*£   ") for _ in range(side)) for _ in range(side)]
+    rows[0] = "S" + rows[0][1:]
+    path = folder / f"synthetic_{n_tiles}.txt"
+    path.write_text(f"width: {side}\nheight: {side}\n---\n" + "\n".join(rows) + "\n",
+                    encoding="utf-8")
+    return path
 
-    fig, ax = plt.subplots()
-    ax.set_xscale("log"); ax.set_yscale("log")
-    ax.plot(xs, load_ts,  "o-", label="Load time (s)")
-    ax.plot(xs, update_ts, "o-", label="Mean on_update (s)")
-    ax.set_xlabel(f"Number of {param_name}")
-    ax.legend(); ax.grid(True, which="both", linestyle=":")
-    png_path = OUTPUT / f"{param_name}.png"
-    fig.savefig(png_path, dpi=150)
-    plt.close(fig)
-    print("PNG →", png_path, "\n")
+
+def build_per_cell(rows: list[str]) -> int:
+    """Ancien chemin : un `match` et un `grid_to_world` par case."""
+    walls: arcade.SpriteList[arcade.Sprite] = arcade.SpriteList(use_spatial_hash=True)
+    coins: arcade.SpriteList[arcade.Sprite] = arcade.SpriteList(use_spatial_hash=True)
+    death: arcade.SpriteList[arcade.Sprite] = arcade.SpriteList(use_spatial_hash=True)
+    for row_index, row in enumerate(reversed(rows)):
+        for col_index, symbol in enumerate(row):
+            x, y = helper.grid_to_world(col_index, row_index)
+            match symbol:
+                case glyph if glyph in textures.TEXTURES:
+                    sprite = arcade.Sprite(textures.TEXTURES[glyph], scale=0.5)
+                    sprite.center_x, sprite.center_y = x, y
+                    if glyph in ("-", "=", "x"):
+                        walls.append(sprite)
+                    elif glyph == "*":
+                        coins.append(sprite)
+                    elif glyph == "£":
+                        death.append(sprite)
+                case _:
+                    pass
+    return len(walls) + len(coins) + len(death)
+
+
+def run_build_bench(values: list[int]) -> None:
+    """Compare `LevelBuilder.build_level` à l’ancien parcours case par case."""
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for n_tiles in values:
+            path = synthetic_map(n_tiles, pathlib.Path(tmp))
+            rows = level_cache.load_compiled(path, use_cache=False)["rows"]
+
+            tic = time.perf_counter()
+            build_per_cell(rows)
+            per_cell = time.perf_counter() - tic
+
+            builder = LevelBuilder(use_cache=False)
+            compiled = level_cache.load_compiled(path, use_cache=False)
+            tic = time.perf_counter()
+            builder.build_level(str(path), compiled)
+            vectorised = time.perf_counter() - tic
+
+            results.append({"count": n_tiles,
+                            "per_cell_time": per_cell,
+                            "vectorised_time": vectorised})
+            print(f"tiles={n_tiles:>6} | per-cell={per_cell*1e3:8.2f} ms"
+                  f" | vectorised={vectorised*1e3:8.2f} ms"
+                  f" | x{per_cell / vectorised:4.1f}")
+
+    _write_results("build", results, "Number of tiles",
+                   {"per_cell_time": "Per-cell build (s)",
+                    "vectorised_time": "Vectorised build (s)"})
+
+# ---------------------------------------------------------------------
+# Moteur physique : arcade (SpriteList) vs grille de tuiles
+# ---------------------------------------------------------------------
+def wall_field(n_walls: int) -> arcade.SpriteList[arcade.Sprite]:
+    """Mêmes briques que `build_level`, sur une grille de 64 px."""
+    walls: arcade.SpriteList[arcade.Sprite] = arcade.SpriteList(use_spatial_hash=True)
+    for i in range(n_walls):
+        brick = arcade.Sprite(":resources:images/tiles/brickBrown.png", scale=0.5)
+        brick.center_x = (i % 40) * 64 + 32
+        brick.center_y = (i // 40) * 64 + 32
+        walls.append(brick)
+    return walls
+
+
+def physics_frames(engine: arcade.PhysicsEnginePlatformer | TileGridPhysicsEngine,
+                   player: Player) -> float:
+    """Durée moyenne de `engine.update()` : course et sauts au-dessus des murs."""
+    times = []
+    for frame in range(FRAME_COUNT):
+        player.change_x = 10 if (frame // 60) % 2 == 0 else -10
+        if frame % 30 == 0:
+            player.change_y = 20
+        tic = time.perf_counter()
+        engine.update()
+        times.append(time.perf_counter() - tic)
+    return mean(times)
+
+
+def run_physics_bench(values: list[int]) -> None:
+    """`PhysicsEnginePlatformer` contre `TileGridPhysicsEngine`, murs croissants."""
+    results = []
+    for n_walls in values:
+        walls = wall_field(n_walls)
+        top = max(wall.top for wall in walls)
+
+        player = Player(pos_x=640, pos_y=top + 100)
+        arcade_t = physics_frames(
+            arcade.PhysicsEnginePlatformer(player, walls=walls, gravity_constant=1), player)
+
+        player = Player(pos_x=640, pos_y=top + 100)
+        grid_t = physics_frames(
+            TileGridPhysicsEngine(player, TileGrid.from_sprites(walls), gravity_constant=1), player)
+
+        results.append({"count": n_walls,
+                        "arcade_time": arcade_t,
+                        "grid_time": grid_t})
+        print(f"walls={n_walls:>6} | arcade={arcade_t*1e6:8.2f} µs"
+              f" | grid={grid_t*1e6:8.2f} µs")
+
+    _write_results("physics", results, "Number of walls",
+                   {"arcade_time": "PhysicsEnginePlatformer.update (s)",
+                    "grid_time": "TileGridPhysicsEngine.update (s)"})
+
+# ---------------------------------------------------------------------
+# Blobs : requêtes de sprites vs spans de la grille
+# ---------------------------------------------------------------------
+def blob_rows(n_blobs: int) -> list[str]:
+    """Étages de 30 cases séparés par des trous, 10 blobs par étage."""
+    floors = max(1, n_blobs // 10)
+    rows = []
+    for _ in range(floors):
+        rows += [" " * 34, "  " + "o  " * 10 + "  ", " " + "=" * 32 + " "]
+    return rows
+
+
+def blob_frames(blobs: list[Blob]) -> float:
+    """Durée moyenne d’un pas de tous les blobs."""
+    times = []
+    for _ in range(FRAME_COUNT):
+        tic = time.perf_counter()
+        for blob in blobs:
+            blob.step(DT)
+        times.append(time.perf_counter() - tic)
+    return mean(times)
+
+
+def patrol_frames(patrol: BlobPatrol) -> float:
+    """Durée moyenne d’un `BlobPatrol.step`."""
+    times = []
+    for _ in range(FRAME_COUNT):
+        tic = time.perf_counter()
+        patrol.step()
+        times.append(time.perf_counter() - tic)
+    return mean(times)
+
+
+def run_blob_bench(values: list[int]) -> None:
+    """Détection des bords : sprites (ancien chemin), `TileGrid.walk_span`
+    blob par blob, puis tous les blobs d’un coup (`BlobPatrol`)."""
+    results = []
+    for n_blobs in values:
+        rows = blob_rows(n_blobs)
+        walls = wall_field(0)
+        spawns = []
+        for row, line in enumerate(reversed(rows)):
+            for col, glyph in enumerate(line):
+                if glyph == "=":
+                    brick = arcade.Sprite(":resources:images/tiles/brickBrown.png", scale=0.5)
+                    brick.position = helper.grid_to_world(col, row)
+                    walls.append(brick)
+                elif glyph == "o":
+                    spawns.append(helper.grid_to_world(col, row))
+        spawns = spawns[:n_blobs]
+        grid = TileGrid.from_rows(rows)
+
+        timings = {}
+        for name, level_grid in (("sprite_time", None), ("grid_time", grid)):
+            blobs = [Blob(pos, speed=2) for pos in spawns]
+            for blob in blobs:
+                blob.set_environment(walls, level_grid)
+            timings[name] = blob_frames(blobs)
+        blobs = [Blob(pos, speed=2) for pos in spawns]
+        for blob in blobs:
+            blob.set_environment(walls, grid)
+        timings["patrol_time"] = patrol_frames(BlobPatrol(blobs))
+
+        results.append({"count": n_blobs, **timings})
+        print(f"blobs={n_blobs:>6} | sprites={timings['sprite_time']*1e6:9.2f} µs"
+              f" | grid={timings['grid_time']*1e6:8.2f} µs"
+              f" | patrol={timings['patrol_time']*1e6:8.2f} µs")
+
+    _write_results("blobs", results, "Number of blobs",
+                   {"sprite_time": "Sprite queries (s)",
+                    "grid_time": "TileGrid walk spans (s)",
+                    "patrol_time": "BlobPatrol (s)"})
+
+# ---------------------------------------------------------------------
+# Chauves-souris : Bat.step une par une vs BatFlock (NumPy)
+# ---------------------------------------------------------------------
+def run_bat_bench(values: list[int]) -> None:
+    """Durée moyenne d’un pas de toutes les chauves-souris, deux façons."""
+    results = []
+    for n_bats in values:
+        rnd = random.Random(n_bats)
+        spawns = [(rnd.uniform(0, 20_000), rnd.uniform(0, 2_000)) for _ in range(n_bats)]
+
+        bats = [Bat(pos) for pos in spawns]
+        times = []
+        for _ in range(FRAME_COUNT):
+            tic = time.perf_counter()
+            for bat in bats:
+                bat.step(DT)
+            times.append(time.perf_counter() - tic)
+        per_bat = mean(times)
+
+        flock = BatFlock([Bat(pos) for pos in spawns], seed=n_bats)
+        times = []
+        for _ in range(FRAME_COUNT):
+            tic = time.perf_counter()
+            flock.step()
+            times.append(time.perf_counter() - tic)
+        batched = mean(times)
+
+        results.append({"count": n_bats, "per_bat_time": per_bat, "flock_time": batched})
+        print(f"bats={n_bats:>6} | Bat.step={per_bat*1e3:8.2f} ms"
+              f" | BatFlock={batched*1e3:8.2f} ms | x{per_bat / batched:4.1f}")
+
+    _write_results("bats", results, "Number of bats",
+                   {"per_bat_time": "Bat.step loop (s)",
+                    "flock_time": "BatFlock.step (s)"})
 
 # ---------------------------------------------------------------------
 # Exécution
@@ -130,4 +376,16 @@ if __name__ == "__main__":
     # 2) Variation du nombre de blobs (murs = 1 000)
     run_bench("enemies", ENEMY_STEPS, fixed=1_000)
 
+    # 3) Construction de niveaux de plus en plus grands
+    run_build_bench(BUILD_STEPS)
+
+    # 4) Physique du joueur : arcade vs grille de tuiles
+    run_physics_bench(WALL_STEPS)
+
+    # 5) Bords des plateformes pour les blobs : sprites vs grille
+    run_blob_bench(ENEMY_STEPS)
+
+    # 6) Chauves-souris : une par une vs en bloc
+    run_bat_bench(BAT_STEPS)
+
     arcade.close_window()        # proprement
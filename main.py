@@ -1,21 +1,52 @@
-import arcade
-from src.game.gameview import GameView
+import time
+T0 = time.perf_counter()   # before any heavy import, for --startup-report
+
+import argparse
+from typing import List, Optional
+
+from src.game.startup import STARTUP, StartupReport
 
 # Constants
 WINDOW_WIDTH = 1280
 WINDOW_HEIGHT = 720
 WINDOW_TITLE = "Platformer"
 
-def main() -> None:
+def main(argv: Optional[List[str]] = None) -> None:
 	"""Main function."""
+	parser = argparse.ArgumentParser(description=WINDOW_TITLE)
+	parser.add_argument("--startup-report", action="store_true",
+		help="time the startup phases, print them after the first frame and exit")
+	parser.add_argument("--no-preload", dest="preload", action="store_false",
+		help="skip the loading screen, assets are loaded when first used")
+	args = parser.parse_args(argv)
+	if args.startup_report:
+		STARTUP.start(T0)
+		STARTUP.on_first_frame = report_and_exit
+
+	with STARTUP.phase("imports"):
+		import arcade
+		from src.game.loading import AssetLoader, LoadingView
+		from src.game.gameview import GameView
+
+	# the workers start decoding now, alongside the window creation
+	loader = AssetLoader() if args.preload else None
 
 	# Create the (unique) Window, setup our GameView, and launch
-	window = arcade.Window(WINDOW_WIDTH, WINDOW_HEIGHT, WINDOW_TITLE)
+	with STARTUP.phase("window"):
+		window = arcade.Window(WINDOW_WIDTH, WINDOW_HEIGHT, WINDOW_TITLE)
 
-	game_view = GameView()
-	window.show_view(game_view)
+	if loader is None:
+		window.show_view(GameView())
+	else:
+		window.show_view(LoadingView(GameView, loader))
 	arcade.run()
- 
+
+
+def report_and_exit(report: StartupReport) -> None:
+	import arcade
+	print(report.format())
+	arcade.close_window()           # also ends the headless loop, unlike arcade.exit()
+
 
 if __name__ == "__main__":
-	main()
\ No newline at end of file
+	main()
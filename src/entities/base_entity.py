@@ -4,6 +4,7 @@ from abc import ABC, abstractmethod
 from typing import Optional, Tuple, Any
 import arcade
 from src.game.objects import Object
+from src.map_builder.tile_grid import TileGrid
 
 # ---------------------------------------------------------------------------
 # Typing helpers
@@ -34,6 +35,8 @@ class Enemy(Object, ABC):
 
         # Will be set each frame by *update()*
         self._walls: Optional[arcade.SpriteList[arcade.Sprite]] = None
+        # same geometry as an occupancy grid, when the level has one
+        self._grid: Optional[TileGrid] = None
 
 
     # ------------------------------------------------------------------
@@ -43,8 +46,20 @@ class Enemy(Object, ABC):
         self._direction *= -1
         self.scale_x *= -1
     
-    def set_environment(self, walls: arcade.SpriteList[arcade.Sprite]) -> None:
-                self._walls = walls    
+    def set_environment(self, walls: arcade.SpriteList[arcade.Sprite], grid: Optional[TileGrid] = None) -> None:
+                self._walls = walls
+                self._grid = grid
+
+    def respawn(self, pos_px: Tuple[float, float]) -> None:
+        """Put a pooled enemy back in its just-constructed state at *pos_px*."""
+        self.center_x, self.center_y = pos_px
+        self.change_x = self.change_y = 0
+        self.reset_health()
+        if self._direction != 1:
+            self.reversy()
+        self._base_y = self.center_y
+        self._walls = None
+        self._grid = None
 
     # ------------------------------------------------------------------
     # Life‑cycle (called manually from GameView.on_update)
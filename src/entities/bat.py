@@ -21,6 +21,11 @@ class Bat(base_entity.Enemy):
         # First random target inside the circle
         self._pick_new_target()
 
+    def respawn(self, pos_px: Tuple[float, float]) -> None:
+        super().respawn(pos_px)
+        self._spawn_x, self._spawn_y = pos_px
+        self._pick_new_target()
+
     # ──────────────────────────────────────────────────────────────────
     # Helpers
     # ──────────────────────────────────────────────────────────────────
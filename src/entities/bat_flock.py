@@ -0,0 +1,109 @@
+"""bat_flock.py – every bat of a level advanced in one NumPy step.
+
+`Bat.step` is a `math.hypot`, a division and two position writes per bat
+per frame, and each new target costs two `random.uniform` calls.
+`BatFlock` keeps the spawn point, radius, speed, target and position of
+all its bats in arrays and advances them together: same rule as
+`Bat.step` (move `speed` px towards the target, pick a new random target
+inside the spawn circle once closer than that), with new targets drawn in
+one batch from a seedable `numpy.random.Generator`.
+
+The arrays are the reference while the flock runs; positions and targets
+are written back to the sprites after each step, so collisions, drawing
+and a later `assign()` see the same state.  `step()` can be limited to
+some of the bats (`indices()`), e.g. the ones `ActivationRegions` keeps
+awake.
+"""
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import numpy.typing as npt
+
+from src.entities.bat import Bat
+
+FloatArray = npt.NDArray[np.float64]
+
+
+class BatFlock:
+    """Batched `Bat.step` for a set of bats."""
+
+    def __init__(self, bats: Iterable[Bat] = (), seed: Optional[int] = None) -> None:
+        self.rng = np.random.default_rng(seed)
+        self.bats: List[Bat] = []
+        self._index: Dict[Bat, int] = {}
+        self.assign(bats)
+
+    def __len__(self) -> int:
+        return len(self.bats)
+
+    def assign(self, bats: Iterable[Bat]) -> None:
+        """(Re)load the flock from the current state of *bats*."""
+        self.bats = list(bats)
+        self._index = {bat: i for i, bat in enumerate(self.bats)}
+
+        def column(attr: str) -> FloatArray:
+            return np.array([getattr(bat, attr) for bat in self.bats], dtype=np.float64)
+
+        self.x, self.y = column("center_x"), column("center_y")
+        self.spawn_x, self.spawn_y = column("_spawn_x"), column("_spawn_y")
+        self.radius, self.speed = column("_radius"), column("_speed")
+        self.target_x, self.target_y = column("_target_x"), column("_target_y")
+        self.direction = column("_direction")
+
+    def indices(self, sprites: Iterable[object]) -> npt.NDArray[np.intp]:
+        """Flock indices of the bats among *sprites* (other sprites skipped)."""
+        index = self._index
+        return np.fromiter((index[s] for s in sprites if s in index), dtype=np.intp)
+
+    # ------------------------------------------------------------------
+    def step(self, idx: Optional[npt.NDArray[np.intp]] = None) -> None:
+        """One `Bat.step` for every bat (or only the bats *idx*), then
+        write the sprites back."""
+        if not self.bats or (idx is not None and not len(idx)):
+            return
+        if idx is None:
+            x, y, speed = self.x, self.y, self.speed
+            dx = self.target_x - x
+            dy = self.target_y - y
+        else:
+            x, y, speed = self.x[idx], self.y[idx], self.speed[idx]
+            dx = self.target_x[idx] - x
+            dy = self.target_y[idx] - y
+        dist = np.hypot(dx, dy)
+        arrived = dist < speed
+
+        moving = ~arrived
+        scale = np.divide(speed, dist, out=np.zeros_like(dist), where=moving)
+        x += dx * scale
+        y += dy * scale
+
+        # all stepped bats written back: cheaper than picking the moving ones
+        if idx is None:
+            for bat, bx, by in zip(self.bats, x.tolist(), y.tolist()):
+                bat.position = bx, by
+        else:
+            self.x[idx], self.y[idx] = x, y
+            bats = self.bats
+            for i, bx, by in zip(idx.tolist(), x.tolist(), y.tolist()):
+                bats[i].position = bx, by
+        if arrived.any():
+            hit = np.flatnonzero(arrived)
+            self._retarget(hit if idx is None else idx[hit])
+
+    def _retarget(self, idx: npt.NDArray[np.intp]) -> None:
+        """`Bat._pick_new_target` for the bats *idx*, random draws batched."""
+        angle = self.rng.uniform(0, 2 * np.pi, len(idx))
+        r = self.rng.uniform(0, self.radius[idx])
+        self.target_x[idx] = self.spawn_x[idx] + r * np.cos(angle)
+        self.target_y[idx] = self.spawn_y[idx] + r * np.sin(angle)
+
+        # facing: same outcome as Bat._pick_new_target (+ reversy)
+        facing = np.where(self.target_x[idx] >= self.x[idx], 1.0, -1.0)
+        flip = facing != self.direction[idx]
+        for i, flipped in zip(idx.tolist(), flip.tolist()):
+            bat = self.bats[i]
+            bat._target_x, bat._target_y = float(self.target_x[i]), float(self.target_y[i])
+            if flipped:
+                bat.scale_x *= -1
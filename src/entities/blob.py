@@ -10,11 +10,19 @@ The blob now predicts its *next bounding box* before moving:
 
 This approach is robust for any integer speed ≤ `TILE/4` and prevents the
 sprite from hanging over lava or void by more than a couple of pixels.
+
+**Walk spans (levels with a TileGrid)**
+The sprite queries above cost a wall-list collision test and four point
+queries per blob per frame.  When the level gives its `TileGrid`, the blob
+asks it once for the run of ground it stands on (`TileGrid.walk_span`) and
+then only compares its next x with the two ends of that run.  The span is
+recomputed when the grid changes (a gate toggles).
 """
 from __future__ import annotations
 
-from typing import List,Tuple
+from typing import List, Optional, Tuple
 from src.entities import base_entity
+from src.map_builder.tile_grid import TileGrid
 import arcade
 
 
@@ -28,6 +36,10 @@ class Blob(base_entity.Enemy):
     def __init__(self, pos_px: Tuple[float, float], speed: int = 1) -> None:
         super().__init__(pos_px, speed)
         self._walls: arcade.SpriteList[arcade.Sprite] | None
+        # walk span: allowed range of center_x, and the grid state it was read for
+        self._span: Optional[Tuple[float, float]] = None
+        self._span_grid: Optional[TileGrid] = None
+        self._span_version = -1
 
     # ------------------------------------------------------------------
     # Prediction helpers
@@ -62,12 +74,34 @@ class Blob(base_entity.Enemy):
         self.center_x -= self._direction * self._speed
         return bool(collisions)
 
+    def set_environment(self, walls: arcade.SpriteList[arcade.Sprite], grid: Optional[TileGrid] = None) -> None:
+        super().set_environment(walls, grid)
+        self._span_grid = None                      # placed again: new span
+
+    def _read_span(self, grid: TileGrid) -> None:
+        """Range of center_x keeping the hit box on ground and out of walls."""
+        self._span_grid, self._span_version = grid, grid.version
+        span = grid.walk_span(self.center_x, self.bottom, self.top)
+        half_w = (self.right - self.left) / 2
+        self._span = None if span is None else (span[0] + half_w, span[1] - half_w)
+
     # ------------------------------------------------------------------
     # AI core
     # ------------------------------------------------------------------
     def step(self, delta: float) -> None:  # noqa: ARG002 – *delta* unused
         next_center_x = self.center_x + self._direction * self._speed
 
+        grid = self._grid
+        if grid is not None:
+            if grid is not self._span_grid or grid.version != self._span_version:
+                self._read_span(grid)
+            span = self._span
+            if span is None or not span[0] <= next_center_x <= span[1]:
+                self.reversy()
+            else:
+                self.center_x = next_center_x
+            return
+
         # Check future collision & ground coverage
         collision_next = self._collision_ahead()
         ground_ok = all(self._ground_samples(next_center_x))
@@ -0,0 +1,101 @@
+"""blob_patrol.py – every blob of a level walked in one NumPy step.
+
+With a `TileGrid`, `Blob.step` is already cheap: compare the next x with
+the two ends of the blob's walk span, then move or turn around.  What is
+left is the Python call, the attribute reads and the comparisons, once
+per blob per frame.  `BlobPatrol` keeps x, direction, speed and the span
+ends of its blobs in arrays and does the comparison for all of them at
+once; only the blobs that moved get their sprite written back, and only
+the ones that turned around call `Blob.reversy()`.
+
+The spans are the blobs' own (`Blob._read_span`); they are read again
+for every blob when the grid changes (a gate toggles).  Blobs without a
+grid keep their sprite-query path and are left out of the patrol.
+"""
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import numpy.typing as npt
+
+from src.entities.blob import Blob
+from src.map_builder.tile_grid import TileGrid
+
+FloatArray = npt.NDArray[np.float64]
+
+
+class BlobPatrol:
+    """Batched `Blob.step` (walk-span path) for the blobs of one grid."""
+
+    def __init__(self, blobs: Iterable[Blob] = ()) -> None:
+        self.blobs: List[Blob] = []
+        self._index: Dict[Blob, int] = {}
+        self.grid: Optional[TileGrid] = None
+        self._version = -1
+        self.assign(blobs)
+
+    def __len__(self) -> int:
+        return len(self.blobs)
+
+    def __contains__(self, sprite: object) -> bool:
+        return sprite in self._index
+
+    def assign(self, blobs: Iterable[Blob]) -> None:
+        """(Re)load the patrol from the current state of *blobs*."""
+        blobs = [b for b in blobs if b._grid is not None]
+        self.grid = blobs[0]._grid if blobs else None
+        self.blobs = [b for b in blobs if b._grid is self.grid]
+        self._index = {blob: i for i, blob in enumerate(self.blobs)}
+        self.x = np.array([b.center_x for b in self.blobs], dtype=np.float64)
+        self.direction = np.array([b._direction for b in self.blobs], dtype=np.float64)
+        self.speed = np.array([b._speed for b in self.blobs], dtype=np.float64)
+        self._read_spans()
+
+    def indices(self, sprites: Iterable[object]) -> npt.NDArray[np.intp]:
+        """Patrol indices of the blobs among *sprites* (other sprites skipped)."""
+        index = self._index
+        return np.fromiter((index[s] for s in sprites if s in index), dtype=np.intp)
+
+    # ------------------------------------------------------------------
+    def step(self, idx: Optional[npt.NDArray[np.intp]] = None) -> None:
+        """One `Blob.step` for every blob (or only the blobs *idx*)."""
+        if not self.blobs or (idx is not None and not len(idx)):
+            return
+        assert self.grid is not None
+        if self.grid.version != self._version:
+            self._read_spans()
+        if idx is None:
+            ahead = self.x + self.direction * self.speed
+            # NaN ends (no span) fail both tests: the blob turns around
+            ok = (self.lo <= ahead) & (ahead <= self.hi)
+            moved, turned = np.flatnonzero(ok), np.flatnonzero(~ok)
+        else:
+            ahead = self.x[idx] + self.direction[idx] * self.speed[idx]
+            ok = (self.lo[idx] <= ahead) & (ahead <= self.hi[idx])
+            moved, turned = idx[ok], idx[~ok]
+        ahead = ahead[ok]
+
+        self.x[moved] = ahead
+        blobs = self.blobs
+        for i, bx in zip(moved.tolist(), ahead.tolist()):
+            blob = blobs[i]
+            blob.position = bx, blob.center_y
+        if len(turned):
+            self.direction[turned] *= -1
+            for i in turned.tolist():
+                blobs[i].reversy()
+
+    def _read_spans(self) -> None:
+        """Span ends of every blob, from the current grid."""
+        grid = self.grid
+        self.lo = np.full(len(self.blobs), np.nan)
+        self.hi = np.full(len(self.blobs), np.nan)
+        if grid is None:
+            return
+        self._version = grid.version
+        for i, blob in enumerate(self.blobs):
+            if blob._span_grid is not grid or blob._span_version != grid.version:
+                blob._read_span(grid)
+            if blob._span is not None:
+                self.lo[i], self.hi[i] = blob._span
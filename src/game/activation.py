@@ -0,0 +1,68 @@
+"""activation.py – only simulate the monsters near the camera.
+
+`GameView.on_update` used to step every monster of the level, update its
+health bar and test it against the player, wherever it was.  With
+`ActivationRegions` the monsters are sorted, each frame, by where they are
+relative to the camera view:
+
+* within `active_margin` of the view: updated every frame, as before;
+* within `lazy_margin`: stepped `lazy_interval` times in a row once every
+  `lazy_interval` frames (no player collision test – the player is on
+  screen);
+* further away: asleep, not touched at all until they come back.
+
+The monsters are looked up through the spatial hash of the monster list,
+so the cost follows the number of monsters around the view, not the size
+of the level.  Enemies move a fixed distance per step (their `step`
+ignores the frame time), so the lazy band catches up by repeating the
+steps it skipped: those monsters keep the pace of the awake ones, in
+coarser moves.
+"""
+from __future__ import annotations
+
+from typing import Iterable, List, Tuple
+
+import arcade
+
+from src.constants_proj import TILESIZE
+from src.entities.base_entity import Enemy
+from src.map_builder.chunks import Rect
+
+
+class ActivationRegions:
+	"""Splits the monsters into full-rate / reduced-rate ones for a frame."""
+
+	def __init__(
+		self,
+		active_margin: float = 4 * TILESIZE,
+		lazy_margin: float = 12 * TILESIZE,
+		lazy_interval: int = 4,
+	) -> None:
+		self.active_margin = active_margin
+		self.lazy_margin = max(lazy_margin, active_margin)
+		self.lazy_interval = max(1, lazy_interval)
+		self._frame = 0
+
+	def select(self, monsters: arcade.SpriteList[Enemy], view: Rect) -> Tuple[List[Enemy], List[Enemy]]:
+		"""(full-rate monsters, lazy monsters due this frame) around *view*."""
+		self._frame += 1
+		lazy_turn = self._frame % self.lazy_interval == 0
+		left, bottom, right, top = view
+		a, z = self.active_margin, self.lazy_margin
+		active: List[Enemy] = []
+		lazy: List[Enemy] = []
+		for monster in self._near(monsters, (left - z, bottom - z, right + z, top + z)):
+			x, y = monster.center_x, monster.center_y
+			if left - a <= x <= right + a and bottom - a <= y <= top + a:
+				active.append(monster)
+			elif lazy_turn and left - z <= x <= right + z and bottom - z <= y <= top + z:
+				lazy.append(monster)
+		return active, lazy
+
+	@staticmethod
+	def _near(monsters: arcade.SpriteList[Enemy], rect: Rect) -> Iterable[Enemy]:
+		"""Candidates around *rect*: the spatial hash buckets, or every monster."""
+		if monsters.spatial_hash is None:
+			return list(monsters)
+		left, bottom, right, top = rect
+		return monsters.spatial_hash.get_sprites_near_rect(arcade.LRBT(left, right, bottom, top))
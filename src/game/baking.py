@@ -0,0 +1,125 @@
+"""baking.py – static tiles rendered once per chunk, drawn as a few quads.
+
+Walls, traps and exits never move once the level is built, yet every
+frame re-submitted each of their sprites.  `BakedBackdrop` renders, the
+first time a chunk comes into view, everything the static `ChunkedLayer`s
+have in that chunk into a slot of its own texture atlas, and draws the
+backdrop as one SpriteList of chunk-sized quads: one draw call and a
+handful of quads whatever the number of tiles.  The price is fill: a quad
+covers its whole chunk, empty parts included.  On software GL (llvmpipe)
+that is what costs, so baking pays on dense maps and not on sparse ones –
+measure before turning it on.
+
+The layers are chunked like the backdrop (`BAKE_TILES`), and a chunk is
+re-baked when what it holds changes: its signature is the length of its
+chunk list in every layer, so a gate that closes (added to the walls by
+`GateSolidity`) or opens (removed) makes its chunk bake again.  Sprites
+sticking out of a neighbouring chunk are drawn into the bake, but only
+changes inside the chunk trigger one – tiles are grid aligned.  Chunks
+with nothing static in them get no quad.  The atlas holds a fixed number
+of slots, reused for the chunks in view (least recently seen first), so
+memory does not grow with the map.
+"""
+from __future__ import annotations
+
+from collections import OrderedDict
+from math import ceil
+from typing import Dict, List, Sequence, Tuple
+
+import arcade
+
+from src.constants_proj import TILESIZE
+from src.game.culling import ChunkedLayer
+from src.map_builder.chunks import ChunkKey, Rect, chunk_rect, chunks_in_rect
+
+BAKE_TILES: int = 8          # edge of a baked chunk, in tiles (512 px)
+BAKE_SLOTS: int = 32         # chunks kept baked; a 1280×720 view overlaps 12 at most
+
+Signature = Tuple[Tuple[int, int], ...]   # (id, len) of each contributing chunk list
+
+
+class BakedBackdrop:
+	"""Static layers drawn from per-chunk textures instead of per-tile sprites."""
+
+	def __init__(
+		self,
+		layers: Sequence[ChunkedLayer],
+		chunk_tiles: int = BAKE_TILES,
+		slots: int = BAKE_SLOTS,
+	) -> None:
+		self.layers = list(layers)
+		self.chunk_tiles = chunk_tiles
+		size = chunk_tiles * TILESIZE
+		columns = min(slots, 8)
+		rows = ceil(slots / columns)
+		self.atlas = arcade.DefaultTextureAtlas(
+			(columns * (size + 2), rows * (size + 2)), border=1, auto_resize=False,
+		)
+		self.quads: arcade.SpriteList[arcade.Sprite] = arcade.SpriteList(atlas=self.atlas)   # baked chunks only
+		self._slots: List[arcade.Sprite] = []
+		for i in range(slots):
+			texture = arcade.Texture.create_empty(f"baked-chunk-{id(self)}-{i}", (size, size))
+			self.atlas.add(texture)
+			self._slots.append(arcade.Sprite(texture))
+		self._free: List[int] = list(range(slots))
+		self._baked: "OrderedDict[ChunkKey, Tuple[int, Signature]]" = OrderedDict()
+		self.bakes = 0               # chunks rendered so far (tests / stats)
+
+	def draw(self, view: Rect) -> None:
+		"""Bake what *view* needs (new or changed chunks), then draw the backdrop."""
+		for layer in self.layers:
+			layer.refresh()
+		for key in chunks_in_rect(view, 0, self.chunk_tiles):
+			signature = self._signature(key)
+			baked = self._baked.get(key)
+			if not signature:                 # nothing static in there
+				if baked is not None:
+					self._release(key)
+				continue
+			if baked is None:
+				slot = self._take_slot()
+			else:
+				slot = baked[0]
+				self._baked.move_to_end(key)
+				if baked[1] == signature:
+					continue
+			self._bake(key, slot)
+			self._baked[key] = slot, signature
+		self.quads.draw(pixelated=True)
+
+	def clear(self) -> None:
+		"""Forget every baked chunk (new level)."""
+		for key in list(self._baked):
+			self._release(key)
+
+	# ------------------------------------------------------------------
+	def _signature(self, key: ChunkKey) -> Signature:
+		rect = chunk_rect(key, self.chunk_tiles)
+		return tuple(
+			(id(sprite_list), len(sprite_list))
+			for layer in self.layers for sprite_list in layer.in_view(rect, overhang=False)
+		)
+
+	def _bake(self, key: ChunkKey, slot: int) -> None:
+		quad = self._slots[slot]
+		left, bottom, right, top = chunk_rect(key, self.chunk_tiles)
+		region = self.atlas.get_texture_region_info(quad.texture.atlas_name)
+		with self.atlas.render_into(quad.texture, projection=(left, right, bottom, top)) as fbo:
+			fbo.clear(viewport=(region.x, region.y, region.width, region.height))
+			for layer in self.layers:
+				for sprite_list in layer.in_view((left, bottom, right, top)):
+					sprite_list.draw()
+		quad.position = (left + right) / 2, (bottom + top) / 2
+		if not quad.sprite_lists:
+			self.quads.append(quad)
+		self.bakes += 1
+
+	def _take_slot(self) -> int:
+		if not self._free:                    # reuse the chunk seen the longest ago
+			self._release(next(iter(self._baked)))
+		return self._free.pop()
+
+	def _release(self, key: ChunkKey) -> None:
+		slot, _ = self._baked.pop(key)
+		self._slots[slot].remove_from_sprite_lists()
+		self._free.append(slot)
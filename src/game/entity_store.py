@@ -0,0 +1,117 @@
+"""entity_store.py – health and invincibility of every Object, in arrays.
+
+Each `Object` used to carry its health, maximum health, invincibility flag
+and timer as (name-mangled) Python attributes, so "hurt every monster"
+meant one property call per monster.  The `EntityStore` keeps them in
+parallel NumPy arrays, one row per entity id; an `Object` only keeps its
+id and its properties read / write its row.
+
+The whole-population operations are the ones the game runs on lists of
+monsters: `add_health` (R / T debug keys, `Object.add_health_all`),
+`damage` (a sword swing, `Object.damage_all`), `dead` (the per-frame
+sweep, `Object.dead_among`) and `save` / `load` (`LevelSnapshot`).
+
+That is all the store holds.  Position and velocity stay on the sprite:
+arcade reads them straight from the sprite when it fills its SpriteList
+buffers and hit boxes, so mirroring them here would mean copying them
+back every frame.  Bat AI state has its own batched form, see
+`entities.bat_flock`.
+"""
+from __future__ import annotations
+
+from typing import Iterable, List, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+IdArray = npt.NDArray[np.intp]
+StoreState = Tuple[npt.NDArray[np.int32], npt.NDArray[np.int32], npt.NDArray[np.bool_], npt.NDArray[np.float64]]
+
+INVINCIBILITY_TIME: float = 0.3   # seconds, see Object.invincible
+
+
+class EntityStore:
+	"""Rows of health / invincibility state, addressed by entity id."""
+
+	def __init__(self, capacity: int = 256) -> None:
+		self.health = np.zeros(capacity, dtype=np.int32)
+		self.max_health = np.zeros(capacity, dtype=np.int32)
+		self.invincible = np.zeros(capacity, dtype=bool)
+		self.timer = np.zeros(capacity, dtype=np.float64)
+		self.size = 0                   # rows ever handed out
+		self._free: List[int] = []
+
+	def __len__(self) -> int:
+		return self.size - len(self._free)
+
+	# ------------------------------------------------------------------
+	def alloc(self, health: int) -> int:
+		"""New entity id, at full *health*."""
+		if self._free:
+			eid = self._free.pop()
+		else:
+			if self.size == len(self.health):
+				self._grow(2 * self.size)
+			eid = self.size
+			self.size += 1
+		self.max_health[eid] = health
+		self.reset(eid)
+		return eid
+
+	def release(self, eid: int) -> None:
+		"""Give the row of a dead Python object back (weakref finaliser)."""
+		self._free.append(eid)
+
+	def reset(self, eid: int) -> None:
+		self.health[eid] = self.max_health[eid]
+		self.invincible[eid] = False
+		self.timer[eid] = 0.0
+
+	# ------------------------------------------------------------------
+	#  whole-population operations
+	# ------------------------------------------------------------------
+	def add_health(self, ids: IdArray, amount: int) -> IdArray:
+		"""`current_health += amount` for every id; returns the ids now at 0."""
+		health = np.clip(self.health[ids] + amount, 0, self.max_health[ids])
+		self.health[ids] = health
+		dead: IdArray = ids[health == 0]
+		return dead
+
+	def damage(self, ids: IdArray, amount: int) -> IdArray:
+		"""`take_damage` for every id (invincible ones are spared)."""
+		return self.add_health(ids[~self.is_invincible(ids)], -amount)
+
+	def is_invincible(self, ids: IdArray) -> npt.NDArray[np.bool_]:
+		protected: npt.NDArray[np.bool_] = self.invincible[ids] | (self.timer[ids] > 0)
+		return protected
+
+	def dead(self, ids: IdArray) -> npt.NDArray[np.bool_]:
+		is_dead: npt.NDArray[np.bool_] = self.health[ids] <= 0
+		return is_dead
+
+	# ------------------------------------------------------------------
+	#  snapshots (LevelSnapshot)
+	# ------------------------------------------------------------------
+	def save(self, ids: IdArray) -> StoreState:
+		"""Copy of the rows *ids*."""
+		return self.health[ids], self.max_health[ids], self.invincible[ids], self.timer[ids]
+
+	def load(self, ids: IdArray, state: StoreState) -> None:
+		"""Write back rows returned by `save`."""
+		self.health[ids], self.max_health[ids], self.invincible[ids], self.timer[ids] = state
+
+	# ------------------------------------------------------------------
+	def _grow(self, capacity: int) -> None:
+		for name in ("health", "max_health", "invincible", "timer"):
+			old = getattr(self, name)
+			new = np.zeros(capacity, dtype=old.dtype)
+			new[:len(old)] = old
+			setattr(self, name, new)
+
+
+def entity_ids(objects: Iterable[object]) -> IdArray:
+	"""Entity ids of some Objects, as an index array."""
+	return np.fromiter((getattr(obj, "_eid") for obj in objects), dtype=np.intp)
+
+
+ENTITIES = EntityStore()
@@ -2,15 +2,37 @@ from __future__ import annotations
 
 # ───────────────────────── Imports ──────────────────────────
 import arcade
-from typing import  Optional
+from typing import  Any, Optional
 
 from src.texture_manager import *
 from src.map_builder.level_builder import LevelBuilder
+from src.map_builder.level_stream import LevelStreamer
+from src.map_builder.chunks import CHUNK_TILES, camera_rect
+from src.map_builder.level_cache import CompiledLevel
+from src.map_builder.prefetch import LevelPrefetcher, next_map
+from src.map_builder.sprite_pool import SpritePool
+from src.map_builder.gate_solidity import GateSolidity
+from src.map_builder.tile_grid import TileGrid
+from src.constants_proj import TILESIZE
 from src.map_builder.platforms import Platform
 from src.map_builder.switch import Gate, Switch
 
 from src.game.player          import Player
+from src.game.objects         import Object
+from src.game.health_bar      import HealthBarLayer
+from src.game.culling         import ChunkedLayer, InView, visible_sprites
+from src.game.baking          import BAKE_TILES, BakedBackdrop
+from src.game.hud             import Hud
+from src.game.startup         import STARTUP
+from src.game.level_state     import LevelSnapshot
+from src.game.activation      import ActivationRegions
+from src.game.tile_physics    import TileGridPhysicsEngine
+from src.game.sweep           import segment_t, swept_hits
 from src.entities.base_entity import Enemy
+from src.entities.bat         import Bat
+from src.entities.bat_flock   import BatFlock
+from src.entities.blob        import Blob
+from src.entities.blob_patrol import BlobPatrol
 from src.weapons.sword        import Sword
 from src.weapons.bow          import Bow
 from src.weapons.weapon       import Weapon
@@ -23,19 +45,84 @@ class GameView(arcade.View):
 	PLAYER_MOVEMENT_SPEED: int = 10
 
 	# --------------------- ctor / setup --------------------
-	def __init__(self) -> None:
+	def __init__(
+		self,
+		streaming: bool = False,
+		stream_radius: int = 1,
+		prefetch_tiles: Optional[int] = None,
+		greedy_collision: bool = False,
+		tile_physics: bool = False,
+		swept_arrows: bool = False,
+		batched_arrows: bool = False,
+		sleep_distant_monsters: bool = False,
+		batched_bats: bool = False,
+		batched_blobs: bool = False,
+		cull_drawing: bool = False,
+		bake_static: bool = False,
+		cached_hud: bool = False,
+	) -> None:
 		super().__init__()
 
-		# camera & background
-		self.camera: arcade.Camera2D = arcade.Camera2D()
-		self.background              = get_texture_path(BACKGROUND_TEXTURE)
-		self.background_color        = arcade.color.BLACK
+		# level streaming: only chunks within `stream_radius` of the camera
+		# are materialised (see LevelStreamer)
+		self.streaming     = streaming
+		self.stream_radius = stream_radius
+		self.streamer: Optional[LevelStreamer] = None
+
+		# next map of the chain is compiled in the background: as soon as a
+		# level starts (prefetch_tiles=None) or once the player is within
+		# `prefetch_tiles` tiles of an exit
+		self.prefetch_tiles = prefetch_tiles
+		self.prefetcher     = LevelPrefetcher()
+
+		# collide against merged wall rectangles instead of every tile sprite
+		self.greedy_collision = greedy_collision
+		# resolve the player against the level's TileGrid instead of wall sprites
+		self.tile_physics = tile_physics
+		# arrows vs terrain: ray through the TileGrid along the last step
+		# instead of a sprite collision test at the new position
+		self.swept_arrows = swept_arrows
+		# step all arrows at once with NumPy (ArrowBatch); only the arrows
+		# near the camera get their sprite updated and are collision-checked
+		self.batched_arrows = batched_arrows
+		# monsters far from the camera are not updated (ActivationRegions)
+		self.activation: Optional[ActivationRegions] = (
+			ActivationRegions() if sleep_distant_monsters else None
+		)
+		# every bat stepped at once (BatFlock); reloaded when the monsters change
+		self.bat_flock: Optional[BatFlock] = BatFlock() if batched_bats else None
+		# every blob walked along its span at once (BlobPatrol); reloaded with the flock
+		self.blob_patrol: Optional[BlobPatrol] = BlobPatrol() if batched_blobs else None
+		self._flock_key: Optional[tuple[int, frozenset[tuple[int, int]]]] = None
+		# walls / coins / traps / exits drawn per chunk, only the chunks in view
+		self.cull_drawing = cull_drawing or bake_static
+		self.static_layers: list[ChunkedLayer] = []
+		self.monsters_in_view: InView[Enemy] = InView()
+		# walls / traps / exits rendered once per chunk into textures (BakedBackdrop)
+		self.backdrop: Optional[BakedBackdrop] = BakedBackdrop(()) if bake_static else None
+
+		# sprites of the previous level, reused by the next LevelBuilder
+		self.sprite_pool = SpritePool()
+		# closed gates in the collision list / grid, updated when they toggle
+		self.gate_solidity = GateSolidity()
+		with STARTUP.phase("assets"):
+			# health bars of the player and the monsters, drawn in two calls
+			self.health_bars = HealthBarLayer()
+
+			# score / health in screen space, re-laid-out only when they change
+			self.hud = Hud(self.window, cached=cached_hud)
+
+			# camera & background
+			self.camera: arcade.Camera2D = arcade.Camera2D()
+			self.background              = get_texture_path(BACKGROUND_TEXTURE)
+			self.background_color        = arcade.color.BLACK
 
 		# map
 		self.map_name: str = "assets/maps/1.txt"
 
 		# runtime collections (dummy init ⇒ typage mypy)
 		self.wall_list:      arcade.SpriteList[arcade.Sprite] = arcade.SpriteList()
+		self.collision_list: arcade.SpriteList[arcade.Sprite] = self.wall_list
 		self.coin_list:      arcade.SpriteList[arcade.Sprite] = arcade.SpriteList()
 		self.monster_list:   arcade.SpriteList[Enemy]         = arcade.SpriteList()
 		self.platforms:      arcade.SpriteList[Platform]      = arcade.SpriteList(use_spatial_hash=True)
@@ -44,6 +131,7 @@ class GameView(arcade.View):
 		self.death_list:     arcade.SpriteList[arcade.Sprite] = arcade.SpriteList()
 		self.exit_list:      arcade.SpriteList[arcade.Sprite] = arcade.SpriteList()
 		self.player_sprite_list: arcade.SpriteList[Player]    = arcade.SpriteList()
+		self.grid: TileGrid = TileGrid.empty()
 
 		# single-sprite refs (set in setup())
 		self.player_sprite: Player
@@ -52,24 +140,37 @@ class GameView(arcade.View):
 
 
 		# physics & weapons + scoew
-		self.physics_engine: Optional[arcade.PhysicsEnginePlatformer] = None
+		self.physics_engine: Optional[arcade.PhysicsEnginePlatformer | TileGridPhysicsEngine] = None
+		self.snapshot: Optional[LevelSnapshot] = None
 		self.sword :  Sword
 		self.bow   :  Bow
 		self.current_weapon: Weapon
 		self.weaponss: arcade.SpriteList[Weapon] = arcade.SpriteList()
 
-		# SFX
-		self.game_over_sound = arcade.load_sound(":resources:sounds/gameover1.wav")
+		# next level compiled in the background once the first frame is out
+		self._prefetch_pending: Optional[str] = None
 
 		# launch level
 		self.setup(self.map_name)
 
-	def setup(self, map_filename: str) -> None:
-		"""(Re)charge un niveau complet."""
-		new_map = LevelBuilder().build_level(map_filename)
+	# SFX – decoded on first use, nothing plays before the first frame
+	@property
+	def game_over_sound(self) -> arcade.Sound:
+		return get_sound(GAME_OVER_SOUND)
+
+	def setup(self, map_filename: str, compiled: Optional[CompiledLevel] = None) -> None:
+		"""(Re)charge un niveau complet (*compiled*: déjà préchargé)."""
+		self.teardown()
+		with STARTUP.phase("level build"):
+			builder = LevelBuilder(collision_mesh=self.greedy_collision, pool=self.sprite_pool)
+			if self.streaming:
+				new_map, self.streamer = builder.build_streamed_level(map_filename, self.stream_radius, compiled)
+			else:
+				new_map, self.streamer = builder.build_level(map_filename, compiled), None
 
 		# ----- sprite lists -----
 		self.wall_list      = new_map["walls"]
+		self.collision_list = new_map["collision"]   # == wall_list unless greedy_collision
 		self.platforms      = new_map["platforms"]
 		self.gates          = new_map["gates"]
 		self.switches       = new_map["switches"]
@@ -78,36 +179,131 @@ class GameView(arcade.View):
 		self.death_list     = new_map["death"]
 		self.exit_list      = new_map["exit"]
 		self.player_sprite_list = new_map["player"]
-
+		self.grid           = new_map["grid"]
+		self.gate_solidity  = GateSolidity(self.collision_list, self.grid)
+		self.gate_solidity.bind(self.gates)
+		if self.cull_drawing:
+			self.static_layers = [
+				ChunkedLayer(layer, BAKE_TILES if self.backdrop else CHUNK_TILES)
+				for layer in (self.wall_list, self.coin_list, self.death_list, self.exit_list)
+			]
+			# opening / closing a gate moves it alone in the culled walls
+			self.gate_solidity.listeners.append(self.static_layers[0].follow)
+			self.monsters_in_view.clear()
+		if self.backdrop is not None:
+			walls, _, death, exits = self.static_layers
+			self.backdrop.layers = [walls, death, exits]
+			self.backdrop.clear()
 
 		# ----- player -----
 		self.player_sprite      = self.player_sprite_list[0]
 		self.initial_x, self.initial_y = self.player_sprite.center_x, self.player_sprite.center_y
+		if self.streamer:
+			self.camera.position = self.player_sprite.position
+			self.streamer.update(camera_rect(self.camera))
 		self.score = 0
-		self.score_text = arcade.Text(
-			"Score: 0",
-			x=10, y=720,
-			font_size=20, color=arcade.color.WHITE,
-			font_name="Kenney Future",)
 		# ----- physics -----
-		self.physics_engine = arcade.PhysicsEnginePlatformer(
-			player_sprite=self.player_sprite,
-			walls=self.wall_list,
-			platforms=self.platforms,
-			gravity_constant=1,
-		)
-
-		# ----- weapons -----
-		self.sword  = Sword(self.player_sprite, self.camera)
-		self.bow    = Bow(self.player_sprite, self.camera)
+		if self.tile_physics:
+			self.physics_engine = TileGridPhysicsEngine(
+				player_sprite=self.player_sprite,
+				grid=self.grid,
+				platforms=self.platforms,
+				gravity_constant=1,          # closed gates: self.gate_solidity writes them in the grid
+			)
+		else:
+			self.physics_engine = arcade.PhysicsEnginePlatformer(
+				player_sprite=self.player_sprite,
+				walls=self.collision_list,
+				platforms=self.platforms,
+				gravity_constant=1,
+			)
+
+		# ----- weapons (created once, they just follow the new player) -----
+		# not deferred: with the textures preloaded (LoadingView) both take < 1 ms
+		if not self.weaponss:
+			with STARTUP.phase("weapons"):
+				self.sword  = Sword(self.player_sprite, self.camera)
+				self.bow    = Bow(self.player_sprite, self.camera)
+				self.weaponss = arcade.SpriteList(use_spatial_hash=True)
+				self.weaponss.append(self.sword)
+				self.weaponss.append(self.bow)
+		else:
+			self.bow.set_player(self.player_sprite)
+			self.bow.projectiles.clear()
+			self.sword.visible = self.bow.visible = False
 		self.current_weapon = self.sword
-		self.weaponss = arcade.SpriteList(use_spatial_hash=True)
-		self.weaponss.append(self.sword)
-		self.weaponss.append(self.bow)
+		# arrows leaving the map are culled (and pooled)
+		self.bow.projectiles.bounds = (0, 0, self.grid.width * TILESIZE, self.grid.height * TILESIZE)
+		self.bow.projectiles.grid = self.grid
+		self.bow.projectiles.batched = self.batched_arrows
 
 		# enemies need environment reference
 		for monster in self.monster_list:
-			monster.set_environment(self.wall_list)
+			monster.set_environment(self.collision_list, self.grid)
+
+		# state rewound by respawn(); streamed coins / monsters are the
+		# streamer's business
+		self.snapshot = LevelSnapshot(
+			members=() if self.streamer else (self.coin_list, self.monster_list),
+			sprites=(self.player_sprite_list, self.platforms, self.gates, self.switches, self.sword, self.bow),
+		)
+		self._flock_key = None
+
+		if self.prefetch_tiles is None:
+			# requested after the level's first frame (on_draw): the worker
+			# would otherwise compete with the build for the GIL
+			self._prefetch_pending = next_map(map_filename)
+
+	def teardown(self) -> None:
+		"""Rend les sprites du niveau courant au pool avant d'en charger un autre."""
+		if self.streamer:
+			self.streamer.clear()           # streamed sprites go back by themselves
+		self.gate_solidity.unbind()
+		lists: list[arcade.SpriteList[Any]] = [
+			self.wall_list, self.collision_list, self.coin_list, self.monster_list,
+			self.platforms, self.gates, self.switches, self.death_list,
+			self.exit_list, self.player_sprite_list,
+		]
+		sprites = [sprite for sprite_list in lists for sprite in sprite_list]
+		if self.snapshot is not None:    # + coins / monsters removed during play
+			sprites += self.snapshot.sprites()
+		for sprite_list in lists:
+			sprite_list.clear()
+		self.sprite_pool.release(sprites)
+		self.snapshot = None
+
+	def sync_flock(self) -> None:
+		"""Reload the bat flock / blob patrol when monsters were killed,
+		streamed or rewound."""
+		chunks = frozenset(self.streamer.loaded_chunks) if self.streamer else frozenset()
+		key = (len(self.monster_list), chunks)
+		if key != self._flock_key:
+			self._flock_key = key
+			if self.bat_flock is not None:
+				self.bat_flock.assign(m for m in self.monster_list if isinstance(m, Bat))
+			if self.blob_patrol is not None:
+				self.blob_patrol.assign(m for m in self.monster_list if isinstance(m, Blob))
+
+	def _batched(self, monster: Enemy) -> bool:
+		"""Stepped by the bat flock / blob patrol rather than `update()`."""
+		if isinstance(monster, Bat):
+			return self.bat_flock is not None
+		return self.blob_patrol is not None and monster in self.blob_patrol
+
+	def respawn(self) -> None:
+		"""Remet le niveau courant à son état initial, sans le reconstruire."""
+		if self.snapshot is None:
+			self.setup(self.map_name)
+			return
+		self.snapshot.restore()
+		self.gate_solidity.refresh()        # gate states were restored directly
+		self._flock_key = None              # bats / blobs too
+		self.bow.projectiles.clear()
+		self.current_weapon = self.sword
+		self.score = 0
+		if self.streamer:
+			self.camera.position = self.player_sprite.position
+			self.streamer.reset(camera_rect(self.camera))
 
 		
 
@@ -121,16 +317,13 @@ class GameView(arcade.View):
 			case arcade.key.UP:
 				self.player_sprite.change_y = +20
 			case arcade.key.SPACE:         # reload same map
-				self.player_sprite.change_x = self.player_sprite.change_y = 0
-				self.setup(self.map_name)
+				self.respawn()
 			case arcade.key.R:             # debug damage
 				self.player_sprite.take_damage(10)
-				for m in self.monster_list:
-					m.current_health -= 10
+				Object.add_health_all(self.monster_list, -10)
 			case arcade.key.T:             # debug heal
 				self.player_sprite.heal(10)
-				for m in self.monster_list:
-					m.current_health += 10
+				Object.add_health_all(self.monster_list, +10)
 			case _:
 				pass
 
@@ -170,13 +363,33 @@ class GameView(arcade.View):
 			self.physics_engine.update()
 
 		# ---- monsters ----
-		for monster in list(self.monster_list):
-			monster.update(delta_time)
-			monster.health_bar.updates()
-
-			if monster.current_health <= 0:
-				monster.remove_from_sprite_lists()
-				continue
+		for monster in Object.dead_among(self.monster_list):   # killed since last frame (R key…)
+			monster.remove_from_sprite_lists()
+		awake: list[Enemy] = list(self.monster_list)
+		lazy:  list[Enemy] = []
+		interval = 1
+		if self.activation is not None:
+			awake, lazy = self.activation.select(self.monster_list, camera_rect(self.camera))
+			interval = self.activation.lazy_interval
+		batches: list[BatFlock | BlobPatrol] = [b for b in (self.bat_flock, self.blob_patrol) if b is not None]
+		if batches:
+			self.sync_flock()
+		for batch in batches:
+			if self.activation is None:
+				batch.step()
+			else:                                # sleeping monsters stay put
+				batch.step(batch.indices(awake))
+				lazy_idx = batch.indices(lazy)
+				for _ in range(interval):
+					batch.step(lazy_idx)
+		for monster in lazy:                     # far-ish: the missed steps in one go
+			if not self._batched(monster):
+				for _ in range(interval):
+					monster.update(delta_time)
+
+		for monster in awake:
+			if not self._batched(monster):
+				monster.update(delta_time)
 
 			if arcade.check_for_collision(self.player_sprite, monster):
 				self.player_sprite.take_damage(20)
@@ -191,65 +404,65 @@ class GameView(arcade.View):
 		self.bow.updating(self.player_sprite, self.camera)
 		for p in arcade.check_for_collision_with_list(self.player_sprite, self.platforms):
 			if getattr(p, "is_deadly", False):
-				self.setup(self.map_name)       # or whatever routine you already call
+				self.respawn()
 				return
 
 		if self.sword.ready():
-			for enemy in arcade.check_for_collision_with_list(self.sword, self.monster_list):
-				enemy.take_damage(self.sword.DAMAGE)
-				if enemy.current_health <= 0:
-					enemy.remove_from_sprite_lists()
+			struck = arcade.check_for_collision_with_list(self.sword, self.monster_list)
+			for enemy in Object.damage_all(struck, self.sword.DAMAGE):
+				enemy.remove_from_sprite_lists()
 
 			for switch in arcade.check_for_collision_with_list(self.sword, self.switches):
 				switch.trigger()
 
 			self.sword.reset_cooldown()
 		
-		for arrow in list(self.bow.arrows):          # safe copy – we may remove items
+		for arrow in self.bow.projectiles.synced():  # a copy – we may remove items
+			# swept_arrows: everything is tested along the segment of the last
+			# step, and nothing behind the first wall on it counts (sweep.py)
+			if self.swept_arrows:
+				start = (arrow.prev_x, arrow.prev_y)
+				wall = self.grid.raycast(*start, arrow.center_x, arrow.center_y)
+				reach = 1.0 if wall is None else segment_t(*start, *arrow.position, *wall[:2])
+				victims = swept_hits(arrow, start, self.monster_list, reach)
+			else:
+				victims = arcade.check_for_collision_with_list(arrow, self.monster_list)
     # 1) monsters -------------------------------------------------
-			victims = arcade.check_for_collision_with_list(
-				arrow, self.monster_list)
 			for m in victims:
 				m.take_damage(self.bow.DAMAGE)
 				if m.current_health <= 0:
 					m.remove_from_sprite_lists()
 					self.score+=1
-					self.score_text.text = f"Score: {self.score}"
-					arrow.remove_from_sprite_lists()
+					self.bow.projectiles.release(arrow)
 					break                                   # arrow spent → stop further checks
 
 		# 2) gates ----------------------------------------------------
 			if arrow in self.bow.arrows:             # still alive?
-				switch_hit = arcade.check_for_collision_with_list(
-					arrow, self.switches)
+				if self.swept_arrows:
+					switch_hit = swept_hits(arrow, start, self.switches, reach)
+				else:
+					switch_hit = arcade.check_for_collision_with_list(arrow, self.switches)
 				if switch_hit:
 					switch_hit[0].trigger()
-					arrow.remove_from_sprite_lists()
+					self.bow.projectiles.release(arrow)
 
 			# ► 3) terrain / platforms -----------------------------------
-			#    self.wall_list already contains *both* the static tiles and
-			#    the moving Platform sprites because you called
-			#    `self.wall_list.extend(self.platforms)` in setup().
+			#    self.collision_list holds the static tiles (or their merged
+			#    rectangles) and the closed gates.
 			if arrow in self.bow.arrows:             # still alive?
-				if arcade.check_for_collision_with_list(arrow, self.wall_list):
-					arrow.remove_from_sprite_lists()
-
-		# ---- gates solid / open management ----
-		for gate in self.gates:
-			if gate.is_open and gate in self.wall_list:
-				self.wall_list.remove(gate)
-			elif not gate.is_open and gate not in self.wall_list:
-				self.wall_list.append(gate)
+				if self.swept_arrows:
+					if wall is not None:
+						self.bow.projectiles.release(arrow)
+				elif arcade.check_for_collision_with_list(arrow, self.collision_list):
+					self.bow.projectiles.release(arrow)
 
 		# ---- coins ----
 		for coin in arcade.check_for_collision_with_list(self.player_sprite, self.coin_list):
 			coin.remove_from_sprite_lists()
 			self.score += 1
-			self.score_text.text = f"Score: {self.score}"
 
 		# ---- player status ----
 		self.player_sprite.update_invincibility(delta_time)
-		self.player_sprite.update_health_bar()
 
 		# ---- end-level / death ----
 		if (
@@ -257,18 +470,17 @@ class GameView(arcade.View):
 			or self.player_sprite.current_health <= 0
 			or self.player_sprite.center_y < -300
 		):
-			self.player_sprite.change_x = self.player_sprite.change_y = 0
-			self.setup(self.map_name)
+			self.respawn()
 			return
 
+		if self.prefetch_tiles is not None and self.exit_list:
+			closest = arcade.get_closest_sprite(self.player_sprite, self.exit_list)
+			if closest and closest[1] <= self.prefetch_tiles * TILESIZE:
+				self.prefetcher.request(next_map(self.map_name))
+
 		if arcade.check_for_collision_with_list(self.player_sprite, self.exit_list):
-			if self.map_name == "assets/maps/1.txt":
-				self.map_name = "assets/maps/2.txt"
-			elif self.map_name == "assets/maps/2.txt":
-				self.map_name = "assets/maps/3.txt"
-			else:
-				self.map_name = "assets/maps/1.txt"
-			self.setup(self.map_name)  # or load next level, etc.
+			self.map_name = next_map(self.map_name)
+			self.setup(self.map_name, self.prefetcher.take(self.map_name))
 			return
 
 		# ---- camera follow ----
@@ -276,6 +488,8 @@ class GameView(arcade.View):
 			self.player_sprite.center_x,
 			self.player_sprite.center_y - self.player_sprite.change_y,
 		)
+		if self.streamer:
+			self.streamer.update(camera_rect(self.camera))
 
 	# ───────────────────── Draw loop ────────────────────────
 	def on_draw(self) -> None:
@@ -287,26 +501,39 @@ class GameView(arcade.View):
 			self.switches.draw()
 			arcade.draw_sprite(self.player_sprite)
 
-			self.wall_list.draw()
-			self.coin_list.draw()
-			self.death_list.draw()
-			self.monster_list.draw()
-			self.exit_list.draw()
+			if self.static_layers:
+				view = camera_rect(self.camera)
+				walls, coins, death, exits = self.static_layers
+				monsters = visible_sprites(self.monster_list, view)
+				self.monsters_in_view.update(monsters)
+				if self.backdrop is not None:
+					self.backdrop.draw(view)         # walls + traps + exits
+					coins.draw(view)
+					self.monsters_in_view.draw()
+				else:
+					walls.draw(view)
+					coins.draw(view)
+					death.draw(view)
+					self.monsters_in_view.draw()
+					exits.draw(view)
+			else:
+				self.wall_list.draw()
+				self.coin_list.draw()
+				self.death_list.draw()
+				self.monster_list.draw()
+				self.exit_list.draw()
+				monsters = list(self.monster_list)
 			self.platforms.draw()
-			self.score_text.draw()
 
-			self.player_sprite.draw_health_bar()
-			for monster in self.monster_list:
-				monster.draw_health_bar()
+			self.health_bars.sync([self.player_sprite, *monsters])
+			self.health_bars.draw()
 
 			self.weaponss.draw()
 			self.bow.arrows.draw()
-		arcade.draw_text(
-		f"Score : {self.score}",
-		100,                               
-		self.window.height - 20,        
-		arcade.color.WHITE,
-		font_size=20,
-		anchor_x="left",
-		anchor_y="top",
-    )
+		self.hud.update(self.score, self.player_sprite.current_health)
+		self.hud.draw()
+
+		STARTUP.frame_drawn()
+		if self._prefetch_pending is not None:
+			self.prefetcher.request(self._prefetch_pending)
+			self._prefetch_pending = None
@@ -0,0 +1,109 @@
+"""health_bar.py – the health bars of a whole level in two draw calls.
+
+`Object.HealthBar` used to own a frame sprite and a spatial-hashed
+SpriteList each, and every damaged object drew its own red rectangle and
+its own SpriteList: two draw calls per monster.  `HealthBarLayer` holds
+one SpriteList of frames and one SpriteList of solid-colour fills for
+every bar on screen.  `sync()` shows the bars of the damaged objects (a
+full bar is not drawn, as before) and only moves / resizes a bar when the
+position or the health of its owner changed since the last call; the
+sprites of bars that are hidden are kept and reused.
+
+`Object.HealthBar` still computes where a bar goes (`updates()`), so
+subclasses that tweak it keep working.
+"""
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Set, Tuple
+
+import arcade
+
+from src.constants_proj import SCALE_FACTOR
+from src.game.entity_store import entity_ids
+from src.game.objects import Object
+from src.texture_manager import get_texture_path
+
+BAR_FRAME = "assets/heathbar.png"
+FILL_COLOR = arcade.color.RED_DEVIL
+
+BarKey = Tuple[float, float, int]   # owner x, y, health when last laid out
+
+
+class _Bar:
+	"""The two sprites of one bar, and what they were laid out for."""
+
+	__slots__ = ("frame", "fill", "key")
+
+	def __init__(self, frame: arcade.Sprite, fill: arcade.SpriteSolidColor) -> None:
+		self.frame = frame
+		self.fill = fill
+		self.key: BarKey | None = None
+
+
+class HealthBarLayer:
+	"""Shared frames + fills SpriteLists for the bars of many objects."""
+
+	def __init__(self) -> None:
+		self.frame_texture = get_texture_path(BAR_FRAME)
+		self.frames: arcade.SpriteList[arcade.Sprite] = arcade.SpriteList()
+		self.fills: arcade.SpriteList[arcade.SpriteSolidColor] = arcade.SpriteList()
+		self._bars: Dict[Object, _Bar] = {}
+		self._spare: List[_Bar] = []
+
+	def __len__(self) -> int:
+		"""Number of bars currently shown."""
+		return len(self._bars)
+
+	def sync(self, owners: Iterable[Object]) -> None:
+		"""Show the bars of the damaged *owners*; hide every other bar."""
+		owners = list(owners)
+		store = Object.store
+		ids = entity_ids(owners)
+		hurt = (store.health[ids] < store.max_health[ids]).tolist()
+		shown: Set[Object] = {owner for owner, damaged in zip(owners, hurt) if damaged}
+		for owner in [o for o in self._bars if o not in shown]:
+			self._hide(owner)
+		for owner in shown:
+			self._show(owner)
+
+	def clear(self) -> None:
+		for owner in list(self._bars):
+			self._hide(owner)
+
+	def draw(self) -> None:
+		self.fills.draw()
+		self.frames.draw()
+
+	# ------------------------------------------------------------------
+	def _show(self, owner: Object) -> None:
+		bar = self._bars.get(owner)
+		if bar is None:
+			bar = self._spare.pop() if self._spare else self._new_bar()
+			bar.frame.visible = bar.fill.visible = True
+			self._bars[owner] = bar
+		key = (owner.center_x, owner.center_y, owner.current_health)
+		if bar.key == key:
+			return
+		bar.key = key
+		layout = owner.health_bar
+		layout.updates()
+		bar.frame.position = layout.bar_x, layout.bar_y
+		bar.fill.width = layout.fill_width
+		bar.fill.position = (
+			layout.bar_x - 38 * SCALE_FACTOR + layout.fill_width / 2,
+			layout.bar_y - 10 * SCALE_FACTOR + layout.fill_height / 2,
+		)
+
+	def _hide(self, owner: Object) -> None:
+		bar = self._bars.pop(owner)
+		bar.frame.visible = bar.fill.visible = False
+		bar.key = None
+		self._spare.append(bar)
+
+	def _new_bar(self) -> _Bar:
+		frame = arcade.Sprite(self.frame_texture, scale=0.5)
+		fill = arcade.SpriteSolidColor(1, 1, color=FILL_COLOR)
+		fill.height = 20 * SCALE_FACTOR
+		self.frames.append(frame)
+		self.fills.append(fill)
+		return _Bar(frame, fill)
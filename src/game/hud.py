@@ -0,0 +1,97 @@
+"""hud.py – score / health readout, drawn in screen space.
+
+`GameView.on_draw` used to call `arcade.draw_text` for the score every
+frame (a new pyglet label laid out each time) and drew a second score
+`Text` inside the world camera, recreated with its font on every level
+load.  The `Hud` owns its `arcade.Text` objects and a default (screen
+space) camera, all created once; `update()` only touches a text when the
+value it shows changed, which is the only time pyglet lays it out again.
+
+With *cached* the texts are also rendered into a texture of their own
+(an atlas slot, like `baking.BakedBackdrop`) each time they change, and
+the HUD is drawn as that one quad in between.
+"""
+from __future__ import annotations
+
+from typing import List, Optional
+
+import arcade
+from arcade.gl import ONE, ONE_MINUS_SRC_ALPHA
+
+HUD_FONT_SIZE = 20
+HUD_MARGIN_X = 100
+HUD_MARGIN_TOP = 20
+HUD_LINE = 30
+HUD_SIZE = (360, 2 * HUD_LINE + 10)       # cached area, from the top-left margin
+
+# the cached texture holds colours already multiplied by alpha
+BLEND_PREMULTIPLIED = (ONE, ONE_MINUS_SRC_ALPHA)
+
+
+class Hud:
+	"""Screen-space texts re-laid-out only when their value changes."""
+
+	def __init__(self, window: arcade.Window, cached: bool = False) -> None:
+		self.camera = arcade.Camera2D()
+		left, top = HUD_MARGIN_X, window.height - HUD_MARGIN_TOP
+		self.score_text = arcade.Text(
+			"Score : 0", left, top, arcade.color.WHITE,
+			font_size=HUD_FONT_SIZE, anchor_x="left", anchor_y="top",
+		)
+		self.health_text = arcade.Text(
+			"Health : 0", left, top - HUD_LINE, arcade.color.WHITE,
+			font_size=HUD_FONT_SIZE, anchor_x="left", anchor_y="top",
+		)
+		self.texts: List[arcade.Text] = [self.score_text, self.health_text]
+		self._score: Optional[int] = None
+		self._health: Optional[int] = None
+		self.layouts = 0            # text changes so far (tests / stats)
+
+		self._cache: Optional[arcade.SpriteList[arcade.Sprite]] = None
+		self._dirty = True
+		if cached:
+			width, height = HUD_SIZE
+			self._area = (left - 10, left - 10 + width, top - height, top)   # l, r, b, t
+			self._atlas = arcade.DefaultTextureAtlas((width + 2, height + 2), border=1, auto_resize=False)
+			texture = arcade.Texture.create_empty(f"hud-{id(self)}", (width, height))
+			self._atlas.add(texture)
+			quad = arcade.Sprite(texture)
+			l, r, b, t = self._area
+			quad.position = (l + r) / 2, (b + t) / 2
+			self._cache = arcade.SpriteList(atlas=self._atlas)
+			self._cache.append(quad)
+
+	def update(self, score: int, health: int) -> None:
+		if score != self._score:
+			self._score = score
+			self.score_text.text = f"Score : {score}"
+			self._changed()
+		if health != self._health:
+			self._health = health
+			self.health_text.text = f"Health : {health}"
+			self._changed()
+
+	def draw(self) -> None:
+		with self.camera.activate():
+			if self._cache is None:
+				for text in self.texts:
+					text.draw()
+				return
+			if self._dirty:
+				self._render_cache()
+			self._cache.draw(pixelated=True, blend_function=BLEND_PREMULTIPLIED)
+
+	# ------------------------------------------------------------------
+	def _changed(self) -> None:
+		self.layouts += 1
+		self._dirty = True
+
+	def _render_cache(self) -> None:
+		assert self._cache is not None
+		quad = self._cache[0]
+		region = self._atlas.get_texture_region_info(quad.texture.atlas_name)
+		with self._atlas.render_into(quad.texture, projection=self._area) as fbo:
+			fbo.clear(viewport=(region.x, region.y, region.width, region.height))
+			for text in self.texts:
+				text.draw()
+		self._dirty = False
@@ -0,0 +1,151 @@
+"""level_state.py – put a level back into its just-built state, in place.
+
+Dying (or pressing SPACE) used to call `GameView.setup()` again: parse the
+map, create every sprite, a new physics engine, new weapons…  A
+`LevelSnapshot` is taken once, right after the level has been built, and
+`restore()` rewinds the very same sprites:
+
+* membership of the lists whose content changes during play (coins picked
+  up, monsters killed) is put back as it was;
+* per-sprite state – position, velocity, angle, scale, visibility, texture
+  and the Python attributes (patrol direction, gate / lever state,
+  platform direction…) – is copied back, together with the entity store
+  rows (health, invincibility) of the `Object`s.  Plain data (numbers,
+  strings and lists / dicts / sets / tuples of them) is deep-copied both
+  ways, containers being refilled in place; other objects are wiring
+  (walls, camera, listeners, the player…) and only the reference is put
+  back.  Attributes set after the snapshot are deleted.
+
+No sprite is created and nothing is read from disk (a streamed level
+only gets its chunks reloaded, see `LevelStreamer.reset`).
+"""
+from __future__ import annotations
+
+import copy
+from typing import Any, Dict, Iterable, List, Tuple
+
+import arcade
+
+from src.game.entity_store import ENTITIES, entity_ids
+
+# position, change_x, change_y, angle, scale, visible, texture, texture index, __dict__
+SpriteState = Tuple[
+	Tuple[float, float], float, float, float, Tuple[float, float],
+	bool, arcade.Texture, int, Dict[str, Any],
+]
+
+
+PLAIN = (int, float, str, bytes, bool, type(None))
+
+
+def is_plain(value: Any) -> bool:
+	"""Numbers, strings, and containers holding nothing else."""
+	if isinstance(value, PLAIN):
+		return True
+	if isinstance(value, dict):
+		return all(is_plain(k) and is_plain(v) for k, v in value.items())
+	if isinstance(value, (list, tuple, set, frozenset)):
+		return all(is_plain(item) for item in value)
+	return False
+
+
+def copy_attr(value: Any) -> Any:
+	"""Deep copy of plain data; the object itself for anything else."""
+	return copy.deepcopy(value) if is_plain(value) else value
+
+
+def restore_attr(attrs: Dict[str, Any], key: str, saved: Any) -> None:
+	"""Put *saved* back in *attrs*, refilling the current container if any."""
+	current = attrs.get(key)
+	if current is saved or not is_plain(saved):
+		attrs[key] = saved
+	elif isinstance(saved, list) and type(current) is list:
+		current[:] = copy.deepcopy(saved)
+	elif isinstance(saved, (dict, set)) and isinstance(current, (dict, set)) and type(current) is type(saved):
+		current.clear()
+		current.update(copy.deepcopy(saved))
+	else:
+		attrs[key] = copy.deepcopy(saved)
+
+
+def capture(sprite: arcade.Sprite) -> SpriteState:
+	"""Copy of the mutable state of *sprite* (see the module docstring)."""
+	return (
+		(sprite.center_x, sprite.center_y),
+		sprite.change_x, sprite.change_y,
+		sprite.angle,
+		(sprite.scale_x, sprite.scale_y),
+		sprite.visible,
+		sprite.texture,
+		sprite.cur_texture_index,
+		{key: copy_attr(value) for key, value in getattr(sprite, "__dict__", {}).items()},
+	)
+
+
+def apply(sprite: arcade.Sprite, state: SpriteState) -> None:
+	"""Write back a state returned by `capture`."""
+	position, change_x, change_y, angle, scale, visible, texture, index, attrs = state
+	if sprite.texture is not texture:
+		sprite.texture = texture
+	sprite.cur_texture_index = index
+	sprite.position  = position
+	sprite.change_x  = change_x
+	sprite.change_y  = change_y
+	sprite.angle     = angle
+	sprite.scale     = scale
+	sprite.visible   = visible
+	current = getattr(sprite, "__dict__", None)
+	if current is None:
+		return
+	for key in [key for key in current if key not in attrs]:
+		del current[key]
+	for key, saved in attrs.items():
+		restore_attr(current, key, saved)
+
+
+class LevelSnapshot:
+	"""State of a level's sprites at one instant, restorable in place.
+
+	*members*: lists whose content is restored (sprites removed meanwhile are
+	put back, sprites added meanwhile are dropped).
+	*sprites*: lists / single sprites whose state only is restored.
+	"""
+
+	def __init__(
+		self,
+		members: Iterable[arcade.SpriteList[Any]] = (),
+		sprites: Iterable[arcade.SpriteList[Any] | arcade.Sprite] = (),
+	) -> None:
+		self._members: List[Tuple[arcade.SpriteList[Any], List[arcade.Sprite]]] = [
+			(sprite_list, list(sprite_list)) for sprite_list in members
+		]
+		self._states: List[Tuple[arcade.Sprite, SpriteState]] = []
+		seen: set[int] = set()
+		groups: List[Iterable[arcade.Sprite]] = [saved for _, saved in self._members]
+		groups += [[item] if isinstance(item, arcade.Sprite) else item for item in sprites]
+		for group in groups:
+			for sprite in group:
+				if id(sprite) not in seen:
+					seen.add(id(sprite))
+					self._states.append((sprite, capture(sprite)))
+		self._ids = entity_ids(s for s, _ in self._states if hasattr(s, "_eid"))
+		self._rows = ENTITIES.save(self._ids)
+
+	def __len__(self) -> int:
+		return len(self._states)
+
+	def sprites(self) -> List[arcade.Sprite]:
+		"""Every sprite the snapshot knows, including those removed since."""
+		return [sprite for sprite, _ in self._states]
+
+	def restore(self) -> None:
+		for sprite_list, saved in self._members:
+			keep = set(map(id, saved))
+			for sprite in [s for s in sprite_list if id(s) not in keep]:
+				sprite_list.remove(sprite)
+			for sprite in saved:
+				if sprite not in sprite_list:
+					sprite_list.append(sprite)
+		for sprite, state in self._states:
+			apply(sprite, state)
+		ENTITIES.load(self._ids, self._rows)
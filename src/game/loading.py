@@ -0,0 +1,128 @@
+"""loading.py – decode the game's assets in the background, behind a loading screen.
+
+Every texture and sound used to be read and decoded on the main thread,
+the first time something asked for it – the background alone is a 60 ms
+PNG decode inside `GameView.__init__`, and each new texture is uploaded to
+the atlas by the first frame that draws it.  `AssetLoader` decodes the
+PNGs of `assets/texturepack` (and the game's sounds) on a thread pool –
+`decode_texture` and `arcade.load_sound` touch neither GL nor the texture
+cache – and `pump()` files, on the main thread, a few finished assets per
+call into `ASSETS` and uploads their textures to the default atlas.
+
+`LoadingView` calls `pump()` once per frame and draws the progress; once
+everything is in, it shows the view it was given, which starts with every
+texture decoded and already in the atlas.
+"""
+from __future__ import annotations
+
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, List, Optional, Sequence, Tuple
+
+import arcade
+from arcade.texture_atlas import TextureAtlasBase
+
+from src.game.startup import STARTUP
+from src.texture_manager import (
+    ASSETS, GAME_OVER_SOUND, TEXTURE_DIR, AssetRegistry, asset_files, decode_texture,
+)
+
+LOAD_WORKERS: int = 4
+UPLOADS_PER_FRAME: int = 4        # assets filed (and textures uploaded) per pump()
+
+Decoded = arcade.Texture | arcade.Sound
+
+
+class AssetLoader:
+	"""Decodes textures / sounds on worker threads; `pump()` hands them over."""
+
+	def __init__(
+		self,
+		registry: AssetRegistry = ASSETS,
+		directory: str = TEXTURE_DIR,
+		sounds: Sequence[str] = (GAME_OVER_SOUND,),
+		workers: int = LOAD_WORKERS,
+	) -> None:
+		self.registry = registry
+		textures, sound_files = asset_files(directory)
+		jobs: List[Tuple[str, Callable[[str], Decoded]]] = [
+			*((path, decode_texture) for path in textures),
+			*((path, arcade.load_sound) for path in (*sound_files, *sounds)),
+		]
+		jobs = [(path, decode) for path, decode in jobs if not registry.has(path)]
+		self.total = len(jobs)
+		self.done = 0
+		self.started = time.perf_counter()
+		self.elapsed = 0.0                 # seconds from start to the last asset filed
+		self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="asset-load")
+		self._pending: List[Tuple[str, Future[Decoded]]] = [
+			(path, self._executor.submit(decode, path)) for path, decode in jobs
+		]
+		if not self._pending:
+			self._executor.shutdown()
+
+	@property
+	def progress(self) -> float:
+		return self.done / self.total if self.total else 1.0
+
+	@property
+	def finished(self) -> bool:
+		return not self._pending
+
+	def pump(self, budget: int = UPLOADS_PER_FRAME, atlas: Optional[TextureAtlasBase] = None) -> int:
+		"""File up to *budget* decoded assets, textures uploaded to *atlas*
+		(the window's default one); returns how many were filed.
+
+		Never waits for a worker.  Errors raised while decoding (missing or
+		broken file…) are re-raised here, on the main thread.
+		"""
+		ready = [item for item in self._pending if item[1].done()][:budget]
+		if not ready:
+			return 0
+		if atlas is None:
+			atlas = arcade.get_window().ctx.default_atlas
+		for item in ready:
+			self._pending.remove(item)
+			path, future = item
+			asset = future.result()
+			self.registry.adopt(path, asset)
+			if isinstance(asset, arcade.Texture):
+				atlas.add(asset)
+		self.done += len(ready)
+		self.elapsed = time.perf_counter() - self.started
+		if not self._pending:
+			self._executor.shutdown()
+		return len(ready)
+
+
+class LoadingView(arcade.View):
+	"""Progress bar while the assets load, then `make_view()` is shown."""
+
+	BAR_SIZE: Tuple[int, int] = (400, 24)
+
+	def __init__(self, make_view: Callable[[], arcade.View], loader: Optional[AssetLoader] = None) -> None:
+		super().__init__()
+		self.make_view = make_view
+		self.loader = loader if loader is not None else AssetLoader()
+		self.background_color = arcade.color.BLACK
+		self.label = arcade.Text(
+			"Loading… 0 %", self.window.width / 2, self.window.height / 2 + 30,
+			arcade.color.WHITE, font_size=16, anchor_x="center",
+		)
+
+	def on_update(self, delta_time: float) -> None:
+		self.loader.pump()
+		if self.loader.finished:
+			STARTUP.record("asset loading", self.loader.elapsed)
+			self.window.show_view(self.make_view())
+
+	def on_draw(self) -> None:
+		self.clear()
+		width, height = self.BAR_SIZE
+		left, bottom = (self.window.width - width) / 2, (self.window.height - height) / 2
+		arcade.draw_lbwh_rectangle_filled(left, bottom, width * self.loader.progress, height, arcade.color.WHITE)
+		arcade.draw_lbwh_rectangle_outline(left, bottom, width, height, arcade.color.WHITE, 2)
+		text = f"Loading… {int(self.loader.progress * 100)} %"
+		if self.label.text != text:
+			self.label.text = text
+		self.label.draw()
@@ -1,8 +1,15 @@
+import weakref
 import arcade
-from typing import Tuple
+from typing import Iterable, List, Tuple, TypeVar
 from src.constants_proj import SCALE_FACTOR
+from src.game.entity_store import ENTITIES, INVINCIBILITY_TIME, EntityStore, entity_ids
+
+ObjectT = TypeVar("ObjectT", bound="Object")
 
 class Object(arcade.Sprite):
+	# health / invincibility live in a row of the entity store, see entity_store.py
+	store: EntityStore = ENTITIES
+
 	def __init__(
 	self,
 	texture: str,
@@ -12,21 +19,15 @@ class Object(arcade.Sprite):
 
 		super().__init__(texture, scale=scale, center_x=pos[0], center_y=pos[1]
 		)
-		self.__max_health = health  # Private maximum health
-		self.__current_health = health  # Private current health
+		self._eid = self.store.alloc(health)  # row of this object in the store
+		weakref.finalize(self, self.store.release, self._eid)
 		self.health_bar = Object.HealthBar(self)
-		self.healthes: arcade.SpriteList[arcade.Sprite] = self.health_bar.sprite_list
-		self.__invincible: bool = False  # Private invincibility flag
-		self.__invincible_timer: float = 0.0  # Timer for invincibility duration
 
 
-	# HealthBar class encapsulating the health bar functionality
+	# Where the health bar of the owner goes; drawn by health_bar.HealthBarLayer
 	class HealthBar:
 		def __init__(self, owner: "Object") -> None:
 			self.owner = owner
-			self.sprite = arcade.Sprite("assets/heathbar.png", scale=0.5)
-			self.sprite_list :arcade.SpriteList[arcade. Sprite]=arcade.SpriteList(use_spatial_hash=True)
-			self.sprite_list.append(self.sprite)
 			self.fill_height = 20 * SCALE_FACTOR  # height of the fill
 			self.fill_width = 75 * SCALE_FACTOR  # width of the fill
 			self.bar_y = self.owner.center_y + self.owner.height / 2 + 10* SCALE_FACTOR  # 10 pixels above the owner
@@ -37,26 +38,12 @@ class Object(arcade.Sprite):
 			# Update health bar position above the owner
 			self.bar_y = self.owner.center_y + self.owner.height / 2 + 10* SCALE_FACTOR  # 10 pixels above the owner
 			self.bar_x = self.owner.center_x
-			self.sprite.center_y = self.bar_y
-			self.sprite.center_x = self.bar_x
 			if self.owner.max_health:
 				self.health_percentage = self.owner.current_health / self.owner.max_health
 			else:
 				self.health_percentage = 0
 			self.fill_width = 75 * round(self.health_percentage,1)* SCALE_FACTOR  # width of the fill based on health percentage
 
-		def draws(self) -> None:
-			# Draw the dynamic health fill only if health is not full
-			if self.owner.current_health < self.owner.max_health:
-				arcade.draw_lbwh_rectangle_filled(
-					left=self.bar_x-38*SCALE_FACTOR,
-					bottom=self.bar_y-10*SCALE_FACTOR,
-					width=self.fill_width,
-					height=self.fill_height,
-					color=arcade.color.RED_DEVIL)
-				self.sprite_list.draw()
-				
-			
 		def to_decimal(self,health_pecentages:float) -> float:
 			"""returns the health percentage truncated to 1 decimal place"""
 			return round(health_pecentages, 1)
@@ -65,18 +52,19 @@ class Object(arcade.Sprite):
 	# Getter for max_health
 	@property
 	def max_health(self) -> int:
-		return self.__max_health
+		return int(self.store.max_health[self._eid])
 
 	# Getter for current_health
 	@property
 	def current_health(self) -> int:
-		return self.__current_health
+		return int(self.store.health[self._eid])
 
 	# Setter for current_health (with validation)
 	@current_health.setter
 	def current_health(self, value: int) -> None:
-		self.__current_health = max(0, min(self.__max_health, value))
-		if self.__current_health == 0:
+		health = max(0, min(self.max_health, value))
+		self.store.health[self._eid] = health
+		if health == 0:
 			self.on_death()
 
 	def take_damage(self, amount: int) -> None:
@@ -95,41 +83,69 @@ class Object(arcade.Sprite):
 		"""Handle the death of the object."""
 		return True
 
+	def reset_health(self) -> None:
+		"""Back to full health and not invincible (sprite reused for a new level)."""
+		self.store.reset(self._eid)
+
 	def update_health_bar(self) -> None:
 		"""Update the health bar with the current health status."""
 		self.health_bar.updates()
 
-	def draw_health_bar(self) -> None:
-		"""Draw the health bar."""
-		self.health_bar.draws()
-	
 	@property
 	def invincible(self) -> bool:
 		"""Check if the player is invincible."""
 		# The invincible property is True if either the flag is set,
 		# or the timer is still counting down.
-		return self.__invincible or self.__invincible_timer > 0
+		return bool(self.store.invincible[self._eid] or self.store.timer[self._eid] > 0)
 
 	@invincible.setter
 	def invincible(self, value: bool) -> None:
 		"""Set the player's invincibility status.
 		   When set to True, the player remains invincible for 3 seconds.
 		"""
-		if value == self.__invincible:
+		if value == self.store.invincible[self._eid]:
 			return
-		self.__invincible = value
-		if value:
-			self.__invincible_timer = 0.3 # Duration of invincibility in seconds
-		else:
-			self.__invincible_timer = 0
+		self.store.invincible[self._eid] = value
+		self.store.timer[self._eid] = INVINCIBILITY_TIME if value else 0.0
 
 	def update_invincibility(self, delta_time: float) -> None:
 		"""Update the invincibility timer using delta time."""
-		if self.__invincible_timer > 0:
-			self.__invincible_timer -= delta_time
-
-			if self.__invincible_timer <= 0:
-				self.__invincible_timer = 0
-				self.__invincible = False
+		timer = self.store.timer[self._eid]
+		if timer > 0:
+			timer -= delta_time
+			if timer <= 0:
+				timer = 0.0
+				self.store.invincible[self._eid] = False
+			self.store.timer[self._eid] = timer
 	"""ATTENTION LAVE NE TUE PAS PERSO SI IL EST INVINCIBLE"""
-	
+
+	@classmethod
+	def add_health_all(cls, objects: Iterable["Object"], amount: int) -> None:
+		"""`current_health += amount` on many objects at once (one store operation)."""
+		objects = list(objects)
+		if not objects:
+			return
+		dead = set(cls.store.add_health(entity_ids(objects), amount).tolist())
+		for obj in objects:
+			if obj._eid in dead:
+				obj.on_death()
+
+	@classmethod
+	def damage_all(cls, objects: Iterable[ObjectT], amount: int) -> List[ObjectT]:
+		"""`take_damage(amount)` on many objects at once; returns those it killed."""
+		objects = list(objects)
+		if not objects:
+			return []
+		dead = set(cls.store.damage(entity_ids(objects), amount).tolist())
+		killed = [obj for obj in objects if obj._eid in dead]
+		for obj in killed:
+			obj.on_death()
+		return killed
+
+	@classmethod
+	def dead_among(cls, objects: Iterable[ObjectT]) -> List[ObjectT]:
+		"""The *objects* at 0 health (one store lookup for the whole list)."""
+		objects = list(objects)
+		if not objects:
+			return []
+		return [obj for obj, dead in zip(objects, cls.store.dead(entity_ids(objects)).tolist()) if dead]
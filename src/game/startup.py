@@ -0,0 +1,62 @@
+"""startup.py – where the time to the first frame goes.
+
+`python main.py --startup-report` turns `STARTUP` on: the phases wrapped in
+`STARTUP.phase(...)` (imports, window, assets, level build, weapons…) are
+timed, the first `GameView.on_draw` closes the report, which is printed
+before the game exits.  Without the flag the phases cost one
+`perf_counter()` pair each and nothing is kept or printed.
+"""
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Optional, Tuple
+
+
+class StartupReport:
+	"""Named phase durations, from process start to the first frame."""
+
+	def __init__(self) -> None:
+		self.t0 = time.perf_counter()
+		self.phases: List[Tuple[str, float]] = []
+		self.first_frame: Optional[float] = None     # seconds since t0
+		self.enabled = False
+		self.on_first_frame: Optional[Callable[["StartupReport"], None]] = None
+
+	def start(self, t0: float) -> None:
+		"""Turn the report on, counting from *t0* (`perf_counter()` value)."""
+		self.t0 = t0
+		self.enabled = True
+
+	@contextmanager
+	def phase(self, name: str) -> Iterator[None]:
+		start = time.perf_counter()
+		try:
+			yield
+		finally:
+			self.record(name, time.perf_counter() - start)
+
+	def record(self, name: str, seconds: float) -> None:
+		"""Add a phase timed elsewhere (e.g. spread over several frames)."""
+		if not self.enabled:      # every level load would add one, for good
+			return
+		self.phases.append((name, seconds))
+
+	def frame_drawn(self) -> None:
+		"""Called at the end of each `on_draw`; only the first one counts."""
+		if self.first_frame is not None:
+			return
+		self.first_frame = time.perf_counter() - self.t0
+		if self.enabled and self.on_first_frame is not None:
+			self.on_first_frame(self)
+
+	def format(self) -> str:
+		lines = ["startup report"]
+		for name, seconds in self.phases:
+			lines.append(f"  {name:<20} {seconds * 1000:8.1f} ms")
+		if self.first_frame is not None:
+			lines.append(f"  {'time to first frame':<20} {self.first_frame * 1000:8.1f} ms")
+		return "\n".join(lines)
+
+
+STARTUP = StartupReport()
@@ -0,0 +1,74 @@
+"""sweep.py – what an arrow crossed during its last step, not just where it ended.
+
+With `swept_arrows` the terrain test follows the segment an arrow
+travelled in the frame (`TileGrid.raycast`), but monsters and switches
+were still tested by overlap at the arrow's new position: a fast arrow
+(or a long frame) could jump over a thin monster, and hit a monster
+standing behind the wall that stopped it.
+
+`swept_hits()` tests the same segment against the hit boxes of the
+sprites near it (slab test, each box grown by the arrow's half-size) and
+returns the ones entered before *reach* – the point of the segment where
+the raycast met a wall – ordered along the segment.
+"""
+from __future__ import annotations
+
+from typing import List, Optional, Sequence, Tuple, TypeVar
+
+import arcade
+
+SpriteT = TypeVar("SpriteT", bound=arcade.BasicSprite)
+
+Box = Tuple[float, float, float, float]         # left, bottom, right, top
+
+
+def segment_entry(x0: float, y0: float, x1: float, y1: float, box: Box) -> Optional[float]:
+	"""Segment parameter t (0 → 1) where (x0, y0) → (x1, y1) enters *box*,
+	0 if it starts inside, None if it misses it."""
+	t_in, t_out = 0.0, 1.0
+	for start, delta, low, high in ((x0, x1 - x0, box[0], box[2]), (y0, y1 - y0, box[1], box[3])):
+		if delta == 0:
+			if not low <= start <= high:
+				return None
+			continue
+		t_low, t_high = (low - start) / delta, (high - start) / delta
+		if t_low > t_high:
+			t_low, t_high = t_high, t_low
+		t_in, t_out = max(t_in, t_low), min(t_out, t_high)
+		if t_in > t_out:
+			return None
+	return t_in
+
+
+def segment_t(x0: float, y0: float, x1: float, y1: float, x: float, y: float) -> float:
+	"""Parameter t of point (x, y), known to lie on the segment."""
+	dx, dy = x1 - x0, y1 - y0
+	if abs(dx) >= abs(dy):
+		return (x - x0) / dx if dx else 0.0
+	return (y - y0) / dy
+
+
+def swept_hits(
+	mover: arcade.BasicSprite,
+	start: Tuple[float, float],
+	sprites: arcade.SpriteList[SpriteT] | Sequence[SpriteT],
+	reach: float = 1.0,
+) -> List[SpriteT]:
+	"""*sprites* hit by *mover* on its way from *start* to its position,
+	before *reach*, nearest first."""
+	(x0, y0), (x1, y1) = start, mover.position
+	half_w, half_h = (mover.right - mover.left) / 2, (mover.top - mover.bottom) / 2
+	left, right = min(x0, x1) - half_w, max(x0, x1) + half_w
+	bottom, top = min(y0, y1) - half_h, max(y0, y1) + half_h
+	if isinstance(sprites, arcade.SpriteList):
+		near = arcade.get_sprites_in_rect(arcade.LRBT(left, right, bottom, top), sprites)
+	else:
+		near = [s for s in sprites if s.right >= left and s.left <= right and s.top >= bottom and s.bottom <= top]
+	hits: List[Tuple[float, SpriteT]] = []
+	for sprite in near:
+		box = (sprite.left - half_w, sprite.bottom - half_h, sprite.right + half_w, sprite.top + half_h)
+		t = segment_entry(x0, y0, x1, y1, box)
+		if t is not None and t <= reach:
+			hits.append((t, sprite))
+	hits.sort(key=lambda hit: hit[0])
+	return [sprite for _, sprite in hits]
@@ -0,0 +1,146 @@
+"""tile_physics.py – platformer physics against a TileGrid.
+
+`arcade.PhysicsEnginePlatformer` tests the player against every candidate
+of the wall SpriteList (spatial hash + polygon checks, then a bisection on
+x).  `TileGridPhysicsEngine` does the same job – gravity, moving platforms,
+closed gates – with the static geometry read from a `TileGrid`: the cells
+under the player's box are looked up directly and the player is snapped to
+their edges.  Closed gates are solid cells of the grid; keeping them so is
+the caller's job (`GateSolidity`, owned by GameView).
+
+Differences with the arcade engine (as GameView uses it):
+
+* vertical moves are split in steps of at most half a tile, so a long fall
+  can not go through a one-tile floor;
+* "ramp up" on x snaps onto the ledge instead of searching pixel by pixel;
+* `update()` only returns the moving platforms that were hit.
+"""
+from __future__ import annotations
+
+import math
+from typing import List, Optional, Tuple
+
+import arcade
+
+from src.map_builder.platforms import Platform
+from src.map_builder.tile_grid import EPSILON, Box, TileGrid
+
+Blocker = Tuple[Box, Optional[Platform]]
+
+
+class TileGridPhysicsEngine:
+	"""Drop-in for `arcade.PhysicsEnginePlatformer` on tile maps."""
+
+	def __init__(
+		self,
+		player_sprite: arcade.Sprite,
+		grid: TileGrid,
+		platforms: Optional[arcade.SpriteList[Platform]] = None,
+		gravity_constant: float = 1.0,
+	) -> None:
+		self.player_sprite = player_sprite
+		self.grid = grid
+		self.platforms: arcade.SpriteList[Platform] = platforms if platforms is not None else arcade.SpriteList()
+		self.gravity_constant = gravity_constant
+		# hit-box extents around the centre (left, bottom, right, top), taken
+		# once per update – the hit box points are costly to recompute
+		self._extents: Box = (0.0, 0.0, 0.0, 0.0)
+
+	# ------------------------------------------------------------------
+	def update(self) -> List[Platform]:
+		self.player_sprite.change_y -= self.gravity_constant
+		self.move_platforms()
+		return self.move_player()
+
+	def move_platforms(self) -> None:
+		"""Same bouncing rules as the arcade engine."""
+		for platform in self.platforms:
+			if platform.change_x:
+				if platform.boundary_left is not None and platform.left <= platform.boundary_left:
+					platform.left = platform.boundary_left
+					if platform.change_x < 0:
+						platform.change_x *= -1
+				if platform.boundary_right is not None and platform.right >= platform.boundary_right:
+					platform.right = platform.boundary_right
+					if platform.change_x > 0:
+						platform.change_x *= -1
+				platform.center_x += platform.change_x
+			if platform.change_y:
+				if platform.boundary_top is not None and platform.top >= platform.boundary_top:
+					platform.top = platform.boundary_top
+					if platform.change_y > 0:
+						platform.change_y *= -1
+				if platform.boundary_bottom is not None and platform.bottom <= platform.boundary_bottom:
+					platform.bottom = platform.boundary_bottom
+					if platform.change_y < 0:
+						platform.change_y *= -1
+				platform.center_y += platform.change_y
+
+	def move_player(self) -> List[Platform]:
+		player = self.player_sprite
+		hit: List[Platform] = []
+		self._extents = (
+			player.center_x - player.left, player.center_y - player.bottom,
+			player.right - player.center_x, player.top - player.center_y,
+		)
+		ext_left, ext_bottom, ext_right, ext_top = self._extents
+
+		# --- y: half-tile steps, stop at the first blocker ---
+		dy = player.change_y
+		steps = max(1, math.ceil(abs(dy) / (self.grid.tile / 2)))
+		for _ in range(steps):
+			player.center_y += dy / steps
+			blockers = self._blockers()
+			if not blockers:
+				continue
+			moving = [sprite for _, sprite in blockers if sprite is not None]
+			if dy > 0:
+				player.center_y = min(box[1] for box, _ in blockers) - ext_top
+			else:
+				player.center_y = max(box[3] for box, _ in blockers) + ext_bottom
+				if moving and moving[0].change_x:      # ride the platform
+					player.center_x += moving[0].change_x
+			player.change_y = min(0.0, moving[0].change_y) if moving else 0.0
+			hit += moving
+			break
+
+		# --- x ---
+		dx = player.change_x
+		if dx:
+			player.center_x += dx
+			blockers = self._blockers()
+			if blockers:
+				# ramp up: step onto a ledge no higher than the x move
+				step = max(box[3] for box, _ in blockers) - (player.center_y - ext_bottom)
+				if 0 < step <= abs(dx):
+					player.center_y += step
+					if not self._blockers():
+						return hit
+					player.center_y -= step
+				if dx > 0:
+					player.center_x = min(box[0] for box, _ in blockers) - ext_right
+				else:
+					player.center_x = max(box[2] for box, _ in blockers) + ext_left
+				hit += [sprite for _, sprite in blockers if sprite is not None and sprite not in hit]
+		return hit
+
+	def _blockers(self) -> List[Blocker]:
+		player = self.player_sprite
+		x, y = player.center_x, player.center_y
+		ext_left, ext_bottom, ext_right, ext_top = self._extents
+		own = (x - ext_left, y - ext_bottom, x + ext_right, y + ext_top)
+		blockers: List[Blocker] = [(box, None) for box in self.grid.overlapping(*own)]
+		if self.platforms:
+			for platform in arcade.check_for_collision_with_list(player, self.platforms):
+				box = (platform.left, platform.bottom, platform.right, platform.top)
+				if _overlap(box, own):
+					blockers.append((box, platform))
+		return blockers
+
+
+def _overlap(a: Box, b: Box) -> bool:
+	"""Strict overlap: boxes that only touch do not block."""
+	return (
+		a[0] < b[2] - EPSILON and a[2] > b[0] + EPSILON
+		and a[1] < b[3] - EPSILON and a[3] > b[1] + EPSILON
+	)
@@ -0,0 +1,54 @@
+"""chunks.py – fixed-size square chunks of the tile grid.
+
+A chunk is addressed by ``(chunk_col, chunk_row)`` where rows are counted
+from the *bottom* of the map, the same way `LevelBuilder` places tiles
+(``helper.grid_to_world(col, row)`` with row 0 at the bottom).
+"""
+from __future__ import annotations
+
+from typing import List, Tuple
+
+import arcade
+
+from src.constants_proj import TILESIZE
+
+CHUNK_TILES: int = 16           # chunk edge, in tiles
+
+ChunkKey = Tuple[int, int]
+Rect = Tuple[float, float, float, float]   # left, bottom, right, top
+
+
+def chunk_key(col: int, row: int, size: int = CHUNK_TILES) -> ChunkKey:
+    """Chunk that contains grid cell (*col*, *row*)."""
+    return col // size, row // size
+
+
+def chunk_of_point(x: float, y: float, size: int = CHUNK_TILES) -> ChunkKey:
+    """Chunk that contains world point (*x*, *y*)."""
+    span = size * TILESIZE
+    return int(x // span), int(y // span)
+
+
+def chunk_rect(key: ChunkKey, size: int = CHUNK_TILES) -> Rect:
+    """World-space rectangle covered by chunk *key*."""
+    span = size * TILESIZE
+    return key[0] * span, key[1] * span, (key[0] + 1) * span, (key[1] + 1) * span
+
+
+def chunks_in_rect(rect: Rect, radius: int = 0, size: int = CHUNK_TILES) -> List[ChunkKey]:
+    """Every chunk overlapping *rect*, grown by *radius* chunks on each side."""
+    left, bottom, right, top = rect
+    c0, r0 = chunk_of_point(left, bottom, size)
+    c1, r1 = chunk_of_point(right, top, size)
+    return [
+        (c, r)
+        for c in range(c0 - radius, c1 + radius + 1)
+        for r in range(r0 - radius, r1 + radius + 1)
+    ]
+
+
+def camera_rect(camera: arcade.Camera2D) -> Rect:
+    """World-space rectangle currently seen by *camera*."""
+    x, y = camera.position
+    half_w, half_h = camera.width / 2, camera.height / 2
+    return x - half_w, y - half_h, x + half_w, y + half_h
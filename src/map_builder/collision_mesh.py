@@ -0,0 +1,89 @@
+"""collision_mesh.py – merge static wall tiles into a few big rectangles.
+
+Every ``=``, ``-`` and ``x`` glyph is its own sprite in ``walls``, so the
+physics engine and the enemy probes used to test a flat floor of 40 tiles
+as 40 candidates.  The collision layer built here covers the same solid
+area with maximal rectangles (greedy meshing) – the floor becomes one
+invisible `arcade.SpriteSolidColor`.  The tile sprites are still what gets
+drawn; the rectangles are only ever collided with.
+
+* ``=`` / ``x`` fill their whole tile and are merged in both directions.
+* ``-`` only fills the upper half of its tile (see its hit box), so half
+  tiles are merged along their row only.
+
+A streamed level meshes chunk by chunk (`grid_rectangles` on a slice of
+the glyph grid, see `LevelStreamer`): rectangles stop at chunk borders,
+the rest of the map is never meshed.
+"""
+from __future__ import annotations
+
+from typing import List, Tuple
+
+import arcade
+import numpy as np
+import numpy.typing as npt
+
+from src.constants_proj import TILESIZE
+from src.map_builder import glyph_grid
+
+FULL_GLYPHS: Tuple[str, ...] = ("=", "x")
+HALF_GLYPHS: Tuple[str, ...] = ("-",)
+
+GridRect = Tuple[int, int, int, int]     # col, row (bottom), width, height – in tiles
+WorldRect = Tuple[float, float, float, float]   # center_x, center_y, width, height
+
+
+def greedy_rectangles(mask: npt.NDArray[np.bool_], grow_up: bool = True) -> List[GridRect]:
+    """Cover the True cells of *mask* (row 0 = bottom) with rectangles.
+
+    Each horizontal run of the lowest unconsumed row is grown upwards for as
+    long as the cells right above it are all solid too.
+    """
+    todo = mask.copy()
+    height = todo.shape[0]
+    rects: List[GridRect] = []
+    for row in range(height):
+        cols = np.flatnonzero(todo[row])
+        if not len(cols):
+            continue
+        # split the solid columns of this row into contiguous runs
+        breaks = np.flatnonzero(np.diff(cols) != 1) + 1
+        for run in np.split(cols, breaks):
+            c0, c1 = int(run[0]), int(run[-1]) + 1
+            top = row + 1
+            while grow_up and top < height and todo[top, c0:c1].all():
+                top += 1
+            todo[row:top, c0:c1] = False
+            rects.append((c0, row, c1 - c0, top - row))
+    return rects
+
+
+def collision_rectangles(rows: List[str]) -> List[WorldRect]:
+    """World rectangles (center_x, center_y, width, height) of the static walls."""
+    return grid_rectangles(glyph_grid.glyph_array(rows))
+
+
+def grid_rectangles(grid: glyph_grid.GlyphArray, col0: int = 0, row0: int = 0) -> List[WorldRect]:
+    """Same, for a glyph array (row 0 = bottom) whose cell (0, 0) is the
+    grid cell (*col0*, *row0*) of the level."""
+    world: List[WorldRect] = []
+    for col, row, w, h in greedy_rectangles(glyph_grid.glyph_mask(grid, FULL_GLYPHS)):
+        world.append(((col0 + col + w / 2) * TILESIZE, (row0 + row + h / 2) * TILESIZE, w * TILESIZE, h * TILESIZE))
+    for col, row, w, _ in greedy_rectangles(glyph_grid.glyph_mask(grid, HALF_GLYPHS), grow_up=False):
+        world.append(((col0 + col + w / 2) * TILESIZE, (row0 + row + 0.75) * TILESIZE, w * TILESIZE, TILESIZE / 2))
+    return world
+
+
+def collision_sprites(rects: List[WorldRect]) -> List[arcade.Sprite]:
+    """One invisible solid sprite per rectangle."""
+    return [
+        arcade.SpriteSolidColor(int(w), int(h), cx, cy, arcade.color.TRANSPARENT_BLACK)
+        for cx, cy, w, h in rects
+    ]
+
+
+def build_collision_list(rows: List[str]) -> arcade.SpriteList[arcade.Sprite]:
+    """Invisible SpriteList holding one solid rectangle per merged wall area."""
+    collision: arcade.SpriteList[arcade.Sprite] = arcade.SpriteList(use_spatial_hash=True)
+    collision.extend(collision_sprites(collision_rectangles(rows)))
+    return collision
@@ -0,0 +1,68 @@
+"""gate_solidity.py – closed gates are walls, open gates are not.
+
+`GameView` used to walk every gate each frame, testing whether it was in
+the collision list and writing it into the tile grid.  `GateSolidity`
+subscribes to the gates instead (`Gate.listeners`): the collision list and
+the grid are only touched for a gate whose state just changed, so a level
+costs nothing per frame while no switch is used.  Whoever mirrors *walls*
+(the culled wall layer) subscribes to `listeners` and is told which gate
+just went in or out, rather than rescanning the list.
+"""
+from __future__ import annotations
+
+from typing import Any, Callable, Iterable, List, Optional
+
+import arcade
+
+from src.map_builder.switch import Gate
+from src.map_builder.tile_grid import TileGrid
+
+
+class GateSolidity:
+    """Keeps *walls* and *grid* (both optional) in step with some gates."""
+
+    def __init__(
+        self,
+        walls: Optional[arcade.SpriteList[Any]] = None,
+        grid: Optional[TileGrid] = None,
+    ) -> None:
+        self.walls = walls
+        self.grid = grid
+        self.gates: List[Gate] = []
+        # called with a gate just added to / removed from *walls*
+        self.listeners: List[Callable[[Gate], None]] = []
+
+    def bind(self, gates: Iterable[Gate]) -> None:
+        """Follow *gates* (instead of the previous ones) from their current state."""
+        self.unbind()
+        self.gates = list(gates)
+        for gate in self.gates:
+            gate.listeners.append(self.apply)
+        self.refresh()
+
+    def unbind(self) -> None:
+        """Stop listening – pooled gates are reused by the next level."""
+        for gate in self.gates:
+            if self.apply in gate.listeners:
+                gate.listeners.remove(self.apply)
+        self.gates = []
+
+    def refresh(self) -> None:
+        """Full resync, for states written without `Gate.set_state` (snapshots)."""
+        for gate in self.gates:
+            self.apply(gate)
+
+    def apply(self, gate: Gate) -> None:
+        """Make *gate* solid or not, according to its state."""
+        if self.walls is not None:
+            # `in` is O(1) on a SpriteList (the sprite knows its slot)
+            if gate.is_open == (gate in self.walls):
+                if gate.is_open:
+                    self.walls.remove(gate)
+                else:
+                    self.walls.append(gate)
+                for listener in self.listeners:
+                    listener(gate)
+        if self.grid is not None:
+            col, row = self.grid.cell_at(gate.center_x, gate.center_y)
+            self.grid.set_solid(col, row, not gate.is_open)
@@ -1,6 +1,7 @@
 # src/entities/gate.py
 from __future__ import annotations
 import arcade
+from src.texture_manager import get_texture_path
 from typing import TYPE_CHECKING, List, Tuple
 
 if TYPE_CHECKING:   # avoid cycle at runtime
@@ -29,7 +30,7 @@ class Gate(arcade.Sprite):
         if self.closed == closed:
             return
         self.closed = closed
-        self.texture = arcade.load_texture(self.CLOSED_TEX if closed else self.OPEN_TEX)
+        self.texture = get_texture_path(self.CLOSED_TEX if closed else self.OPEN_TEX)
 
     # ------------------------------------------------ helpers for LevelBuilder
     @property
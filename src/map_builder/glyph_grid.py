@@ -0,0 +1,51 @@
+"""glyph_grid.py – the ASCII grid of a level as a NumPy array.
+
+`glyph_array()` turns the rows returned by `MapLoader` into a 2-D array of
+Unicode code points (the grid uses glyphs such as ``£`` or ``→``, so one
+byte per cell is not enough), flipped so that row 0 is the *bottom* of the
+map – the convention of `helper.grid_to_world`.  Glyph classes are then
+plain boolean masks, and the cells of a class come out of one
+``np.nonzero`` call instead of a Python walk over every cell.
+"""
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from src.constants_proj import TILESIZE
+
+GlyphArray = npt.NDArray[np.uint32]
+IndexArray = npt.NDArray[np.intp]
+CoordArray = npt.NDArray[np.float64]
+
+
+def glyph_array(rows: List[str]) -> GlyphArray:
+    """(height, width) code-point array of *rows*, row 0 = bottom row."""
+    if not rows:
+        return np.zeros((0, 0), dtype=np.uint32)
+    width = max(len(row) for row in rows)
+    flat = "".join(row.ljust(width) for row in reversed(rows))
+    return np.frombuffer(flat.encode("utf-32-le"), dtype=np.uint32).reshape(len(rows), width)
+
+
+def glyph_mask(grid: GlyphArray, glyphs: Iterable[str]) -> npt.NDArray[np.bool_]:
+    """Boolean mask of the cells holding any of *glyphs*."""
+    return np.isin(grid, [ord(g) for g in glyphs])
+
+
+def glyph_cells(grid: GlyphArray, glyphs: Iterable[str]) -> Dict[str, Tuple[IndexArray, IndexArray]]:
+    """glyph → (cols, rows) of every cell holding it (only glyphs present)."""
+    cells: Dict[str, Tuple[IndexArray, IndexArray]] = {}
+    for glyph in glyphs:
+        rows, cols = np.nonzero(grid == ord(glyph))
+        if len(cols):
+            cells[glyph] = (cols, rows)
+    return cells
+
+
+def cell_centers(cols: IndexArray, rows: IndexArray, tile: float = TILESIZE) -> Tuple[CoordArray, CoordArray]:
+    """Vectorised `helper.grid_to_world`."""
+    half = tile / 2
+    return (cols * tile + half).astype(np.float64), (rows * tile + half).astype(np.float64)
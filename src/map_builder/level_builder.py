@@ -1,16 +1,23 @@
 import arcade
-from typing import List, Dict, TypedDict
+from typing import List, Dict, Optional, Tuple, TypedDict
 from src.entities.blob import Blob
 from src.entities.bat import Bat
 from src.entities.base_entity import Enemy
-from src.map_builder import map_loader
+from src.map_builder import level_cache
+from src.map_builder import glyph_grid
+from src.map_builder.level_stream import LevelStreamer
 from src import textures  
 from src import constants_proj
 from src import helper
-from src.map_builder.platform_build import build_platforms
+from src.map_builder.platform_build import spawn_platforms
+from src.map_builder.collision_mesh import build_collision_list
+from src.map_builder.sprite_pool import SpritePool
+from src.map_builder.tile_grid import TileGrid
+from src.map_builder.tracked_list import TrackedSpriteList
 from src.map_builder.platforms import Platform
 from src.game.player import Player
 from src.texture_manager import *
+from src.texture_manager import ASSETS
 from src.map_builder.switch import Gate, Switch
         # ← add this
 
@@ -29,189 +36,227 @@ class LevelData(TypedDict):
     platforms: arcade.SpriteList[Platform]
     gates:    arcade.SpriteList[Gate]
     switches: arcade.SpriteList[Switch]
+    collision: arcade.SpriteList[arcade.Sprite]   # what physics collides with (walls, or merged rects)
+    grid:      TileGrid                            # static walls as an occupancy grid
 
 
-class LevelBuilder:
+STATIC_GLYPHS: Tuple[str, ...] = ("-", "=", "x", "*", "£")   # one plain sprite per cell
+SPAWN_GLYPHS:  Tuple[str, ...] = ("S", "E", "o", "b")        # a handful per map
 
 
-	    
-	def build_level(self,filename:str) -> LevelData:
+class LevelBuilder:
 
-		meta, rows = map_loader.MapLoader(filename).load()
+	def __init__(
+		self,
+		use_cache: bool = True,
+		collision_mesh: bool = False,
+		pool: Optional[SpritePool] = None,
+	) -> None:
+		# read / write the compiled `<map>.txt.cache` next to each map
+		self.use_cache = use_cache
+		# merge static walls into big rectangles for collisions (collision_mesh.py)
+		self.collision_mesh = collision_mesh
+		# sprites of previous levels are taken from here before creating new ones
+		self.pool = pool if pool is not None else SpritePool()
+
+	def build_level(self,filename:str, compiled: Optional[level_cache.CompiledLevel] = None) -> LevelData:
+
+		if compiled is None:        # not prefetched → load (or hit the cache) now
+			compiled = level_cache.load_compiled(filename, use_cache=self.use_cache)
+		rows = compiled["rows"]
 	
 		"""
 		Builds the level assuming your map file lists rows from top to bottom.
 		This code reverses self.grid so that row 0 is at the TOP in-game.
 		"""
-		wall_list: arcade.SpriteList[arcade.Sprite] = arcade.SpriteList(use_spatial_hash=True)
-		coin_list: arcade.SpriteList[arcade.Sprite] = arcade.SpriteList(use_spatial_hash=True)
-		death_list: arcade.SpriteList[arcade.Sprite] = arcade.SpriteList(use_spatial_hash=True)
-		exit_list: arcade.SpriteList[arcade.Sprite] = arcade.SpriteList(use_spatial_hash=True)
-		player_sprite_list: arcade.SpriteList[Player] = arcade.SpriteList()
-		monster_list: arcade.SpriteList[Enemy] = arcade.SpriteList(use_spatial_hash=True)
-		platforms: arcade.SpriteList[Platform] = arcade.SpriteList(use_spatial_hash=True)
-		#gate_list: arcade.SpriteList[Gate]  = arcade.SpriteList(use_spatial_hash=True)   # closed gates
-		#switch_list: arcade.SpriteList[Switch] = arcade.SpriteList()
-		#gate_list:   arcade.SpriteList[Gate]   = arcade.SpriteList(use_spatial_hash=True)
-		#switch_list: arcade.SpriteList[Switch] = arcade.SpriteList()
-
-
-
-		# Reverse self.grid so the top line in the file is row_index=0 (top in the game).
-		reversed_grid: List[str] = list(reversed(rows))
-		last_ground_tiles: Dict[int, arcade.Sprite] = {}
-		boundary_list: arcade.SpriteList[arcade.Sprite] = arcade.SpriteList(use_spatial_hash=True)
-		#self.platforms:  = arcade.SpriteList(use_spatial_hash=True)
-
-		#platform_sprites = build_platforms(rows, meta,textures.TEXTURES)
-		#self.platforms.extend(platform_sprites)
+		level = self.empty_level()
+
+		# Whole grid as an array (row 0 = bottom); each glyph class is a mask
+		# and its sprites are created in one batch with a shared texture.
+		# The static lists are hashed once, when full: one rebuild of the
+		# spatial hash is cheaper than an insert per appended sprite.
+		static = (level["walls"], level["coins"], level["death"])
+		for sprite_list in static:
+			sprite_list.disable_spatial_hashing()
+		grid = glyph_grid.glyph_array(rows)
+		for glyph, (cols, rws) in glyph_grid.glyph_cells(grid, STATIC_GLYPHS + SPAWN_GLYPHS).items():
+			if glyph in STATIC_GLYPHS:
+				xs, ys = glyph_grid.cell_centers(cols, rws)
+				self.place_static(level, glyph, xs.tolist(), ys.tolist())
+			else:
+				for col_index, row_index in zip(cols.tolist(), rws.tolist()):
+					self.place_glyph(level, glyph, col_index, row_index)
+		for sprite_list in static:
+			sprite_list.enable_spatial_hashing()
+
+		self._add_dynamic(level, compiled)
+		return level
+
+	def build_streamed_level(
+		self,
+		filename: str,
+		radius: int = 1,
+		compiled: Optional[level_cache.CompiledLevel] = None,
+	) -> Tuple[LevelData, LevelStreamer]:
+		"""Like *build_level*, but static tiles, coins, traps, exits and
+		monsters are left to the returned `LevelStreamer`, which
+		materialises them chunk by chunk around the camera."""
+		if compiled is None:
+			compiled = level_cache.load_compiled(filename, use_cache=self.use_cache)
+		level = self.empty_level()
+
+		# only the player start is placed up front
+		for row_index, row in enumerate(reversed(compiled["rows"])):
+			col_index = row.find("S")
+			if col_index != -1:
+				self.place_glyph(level, "S", col_index, row_index)
+
+		self._add_dynamic(level, compiled, streamed=True)
+		streamer = LevelStreamer(self, level, compiled["rows"], radius=radius, collision_mesh=self.collision_mesh)
+		return level, streamer
+
+	@staticmethod
+	def empty_level() -> LevelData:
+		# the static lists are mirrored by the culled layers: they count their changes
+		walls: arcade.SpriteList[arcade.Sprite] = TrackedSpriteList(use_spatial_hash=True)
+		return {
+			"walls": walls,
+			"coins": TrackedSpriteList(use_spatial_hash=True),
+			"monsters": arcade.SpriteList(use_spatial_hash=True),
+			"death": TrackedSpriteList(use_spatial_hash=True),
+			"player": arcade.SpriteList(),
+			"exit": TrackedSpriteList(use_spatial_hash=True),
+			"platforms": arcade.SpriteList(use_spatial_hash=True),
+			"gates": arcade.SpriteList(),
+			"switches": arcade.SpriteList(),
+			"collision": walls,
+			"grid": TileGrid.empty(),
+		}
 
+	def place_glyph(self, level: LevelData, symbol: str, col_index: int, row_index: int) -> Optional[arcade.Sprite]:
+		"""Create the sprite for one grid cell (row 0 = bottom) and append it
+		to the matching list of *level*.  Returns it, or None for empty cells."""
+		x,y=helper.grid_to_world(col_index,row_index)
+
+		match symbol:
+			# --------------------------------------------------------------
+			# Player start
+			# --------------------------------------------------------------
+			case 'S':
+				player_sprite = self.pool.take(Player, PLAYER_TEXTURE)
+				if player_sprite is None:
+					player_sprite = self.pool.track(Player(), PLAYER_TEXTURE)
+				else:
+					player_sprite.reset_health()
+					player_sprite.change_x = player_sprite.change_y = 0
+				player_sprite.center_x = x
+				player_sprite.center_y = y
+				level["player"].append(player_sprite)
+				return player_sprite
+			case 'E':
+				exit_sprite = self.pool.take(arcade.Sprite, PORTAL_TEXTURE)
+				if exit_sprite is None:
+					exit_sprite = self.pool.track(arcade.Sprite(
+						PORTAL_TEXTURE,
+						scale=constants_proj.SCALE_FACTOR
+					), PORTAL_TEXTURE)
+				exit_sprite.center_x = x
+				exit_sprite.center_y = y
+				level["exit"].append(exit_sprite)
+				return exit_sprite
+
+			case 'o':                            # Blob
+				blobb = self.pool.take(Blob, Blob.TEXTURE)
+				if blobb is None:
+					blobb = self.pool.track(Blob((x, y), speed=1), Blob.TEXTURE)
+				else:
+					blobb.respawn((x, y))
+				level["monsters"].append(blobb)
+				return blobb
+
+			case 'b':                            # Bat
+				batt = self.pool.take(Bat, Bat.TEXTURE)
+				if batt is None:
+					batt = self.pool.track(Bat((x, y + 200), radius_px=500, speed=3), Bat.TEXTURE)
+				else:
+					batt.respawn((x, y + 200))
+				level["monsters"].append(batt)
+				return batt
+
+			# --------------------------------------------------------------
+			# Static tiles & collectibles
+			# --------------------------------------------------------------
+			case "-" | "=" | "x" | "*" | "£":
+				return self.place_static(level, symbol, [x], [y])[0]
+
+			# --------------------------------------------------------------
+			# Anything else → ignore
+			# --------------------------------------------------------------
+			case _:
+				return None
+
+	def place_static(self, level: LevelData, glyph: str, xs: List[float], ys: List[float]) -> List[arcade.Sprite]:
+		"""Create (or take from the pool) one sprite of a static *glyph* per
+		(x, y) world position."""
+		path = textures.TEXTURES[glyph]
+		texture = ASSETS.texture(path)
+		# the whole batch at once: pooled sprites first, then the missing ones
+		sprites = self.pool.take_many(arcade.Sprite, path, len(xs))
+		for sprite, x, y in zip(sprites, xs, ys):
+			sprite.position = (x, y)
+		scale, reused = constants_proj.SCALE_FACTOR, len(sprites)
+		sprites += self.pool.track_many([
+			arcade.Sprite(texture, scale=scale, center_x=x, center_y=y)
+			for x, y in zip(xs[reused:], ys[reused:])
+		], path)
+		if glyph == "*":                      # pièce
+			level["coins"].extend(sprites)
+		elif glyph == "£":                    # piège
+			level["death"].extend(sprites)
+		else:                                 # sol, plateforme, caisse
+			level["walls"].extend(sprites)
+		return sprites
+
+	def _add_dynamic(self, level: LevelData, compiled: level_cache.CompiledLevel, streamed: bool = False) -> None:
+		"""Platforms, gates, switches and the collision layer – always fully
+		materialised, except the collision mesh of a *streamed* level, which
+		the `LevelStreamer` builds chunk by chunk."""
+		if self.collision_mesh:
+			level["collision"] = (
+				arcade.SpriteList(use_spatial_hash=True) if streamed
+				else build_collision_list(compiled["rows"])
+			)
+		level["grid"] = TileGrid.from_rows(compiled["rows"])
+
+		# Build moving platforms from the (cached) platform descriptions
+		level["platforms"].extend(spawn_platforms(compiled["platforms"], self.pool))
 		
-		for row_index, row in enumerate(reversed_grid):
-			
-			#padded_row = row.ljust(meta["width"], " ")
-
-			for col_index, symbol in enumerate(row):
-				x,y=helper.grid_to_world(col_index,row_index)
-
-				match symbol:
-					# --------------------------------------------------------------
-					# Player start
-					# --------------------------------------------------------------
-					case 'S':
-						player_sprite = Player()
-						player_sprite.center_x = x
-						player_sprite.center_y = y
-						player_sprite_list.append(player_sprite)
-
-						continue                           # next grid-cell
-					case 'E':
-						exit_sprite = arcade.Sprite(
-							PORTAL_TEXTURE,
-							scale=constants_proj.SCALE_FACTOR
-						)
-						exit_sprite.center_x = x
-						exit_sprite.center_y = y
-						exit_list.append(exit_sprite)
-						continue
-
-					case 'o':                            # Blob
-						blobb = Blob((x, y), speed=1)
-						monster_list.append(blobb)
-						print("\n")
-						print("\n")
-						print("Found blob at", x, y)
-						print("\n")
-						print("\n")
-						continue
-
-					case 'b':                            # Bat
-						batt = Bat((x, y + 200), radius_px=500, speed=3)
-						monster_list.append(batt)
-
-						continue
-
-					# --------------------------------------------------------------
-					# Static tiles & collectibles
-					# --------------------------------------------------------------
-					case glyph if glyph in textures.TEXTURES:
-						sprite_info = textures.TEXTURES[glyph]
-						sprite = arcade.Sprite(sprite_info, scale=constants_proj.SCALE_FACTOR)
-						sprite.center_x = x
-						sprite.center_y = y
-						if glyph in ("-", "=", "x"):          # sol, plateforme, caisse
-							wall_list.append(sprite)
-						elif glyph == "*":                    # pièce
-							coin_list.append(sprite)
-						elif glyph == "£":                    # piège
-							death_list.append(sprite)
-									# crates act as boundaries
-						if glyph == 'x':
-							boundary_list.append(sprite)
-
-						# remember last ground tile in each column
-						if glyph in ('-', 'x', '='):
-							last_ground_tiles[col_index] = sprite
-
-					# --------------------------------------------------------------
-					# Anything else → ignore
-					# --------------------------------------------------------------
-					case _:
-						pass
-		
-					
-		# Build moving platforms from the map
-		platform_sprites = build_platforms(
-			rows,  # original (not reversed) rows for platform logic
-			meta,
-			textures.TEXTURES
-		)
-		for platform in platform_sprites:
-			print(f"Platform created at ({platform.center_x}, {platform.center_y}) axis={platform.axis} change_x={platform.change_x} change_y={platform.change_y}, boundary_l={platform.boundary_left}, boundary_r={platform.boundary_right}")
-			platforms.append(platform)
 		
-		
-		# meta now contains the parsed header dict
-		# level_builder.py — inside build_level()
-
-# 		----- Gates ----------------------------------------------------
-		#gate_list = arcade.SpriteList(use_spatial_hash=True)
-
-		# meta.gates is *really* a list[dict]; tell the type-checker explicitly
-		#gates_raw: List[Dict[str, Any]] = cast(List[Dict[str, Any]], meta.gates or [])
-		
-
 		# gates ------------------------------------------------------------
-				# snippet inside build_level() ---------------------------------------
-
-		gate_list: arcade.SpriteList[Gate] = arcade.SpriteList()
-		gate_by_coord: dict[tuple[int, int], Gate] = {}
-
-		for g in meta.get("gates", []):
-			gx, gy = g["x"], g["y"]
-			wx, wy = helper.grid_to_world(gx, gy+1)
-
-			gate = Gate(position=(wx, wy), state=g.get("state", "closed"))
-              # keep grid coords
-			gate_list.append(gate)
-			gate_by_coord[(gx, gy)] = gate                 # quick lookup
-
-
-		switch_list: arcade.SpriteList[Switch] = arcade.SpriteList()
-
-		for s in meta.get("switches", []):
-			sx, sy = s["x"], s["y"]
-			wx, wy = helper.grid_to_world(sx, sy+1)
-			targets: list[Gate] = []
-			actions = (s.get("switch_on", [])) + (s.get("switch_off", []))  
-
-			for act in actions:
-				print("TEST1", act)
-				g = gate_by_coord.get((act["x"], act["y"]))
-				if g and g not in targets:
-					targets.append(g)
-					print("TEST2", g, "added to switch targets")
-
-			switch = Switch(position=(wx, wy),
-					switch_meta=s,
-					gate_list=targets)
-			switch_list.append(switch)
-
-
-		if len(player_sprite_list) == 0:
+		for g in compiled["gates"]:
+			gate = self.pool.take(Gate, GATE_TEXTURE)
+			if gate is None:
+				gate = self.pool.track(Gate(position=g["position"], state=g["state"]), GATE_TEXTURE)
+			else:
+				gate.position = g["position"]
+				gate.set_state(closed=g["state"] != "open")
+			level["gates"].append(gate)
+
+		# switches – their actions were compiled to gate indices (level_cache)
+		for sw in compiled["switches"]:
+			actions = (sw["on"], sw["off"])
+			switch = self.pool.take(Switch, Switch.TEXTURE_OFF)
+			if switch is None:
+				switch = self.pool.track(Switch(position=sw["position"],
+						switch_meta=sw["meta"],
+						gate_list=level["gates"],
+						actions=actions), Switch.TEXTURE_OFF)
+			else:
+				switch.configure(sw["position"], sw["meta"], level["gates"], actions)
+			level["switches"].append(switch)
+
+
+		if len(level["player"]) == 0:
 			raise ValueError("No player sprite found in the map (missing 'S' symbol)!")
 
 
-		return {
-			"walls": wall_list,
-			"coins": coin_list,
-			"monsters": monster_list,
-			"death": death_list,
-			"player": player_sprite_list,
-			"exit": exit_list,
-			"platforms": platforms,
-			"gates": gate_list,
-			"switches": switch_list,
-		}
-
-
@@ -0,0 +1,191 @@
+"""level_cache.py – compiled, content-hashed cache of a level file.
+
+Every death, reload or exit transition used to re-run the YAML parse, the
+ASCII split, the platform detection and the gate/switch wiring for a map
+that had not changed.  `load_compiled()` does that work once, pickles the
+result next to the source (``1.txt`` → ``1.txt.cache``) and reuses it for as
+long as the SHA-256 of the ``.txt`` matches the one stored in the cache.
+
+The compiled level is plain data (no sprites, no textures), so it can be
+produced on any thread; `LevelBuilder` turns it into sprites.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Dict, List, Tuple, TypedDict, cast
+
+from src import helper
+from src import textures
+from src.map_builder.platform_build import PlatformSpec, platform_specs
+
+CACHE_SUFFIX: str = ".cache"
+CACHE_VERSION: int = 2          # bump whenever CompiledLevel changes layout
+
+# YAML verb → state the gate is put in (closed?); both spellings are in use
+GATE_VERBS: Dict[str, bool] = {
+    "open-gate": False, "open_gate": False,
+    "close-gate": True, "close_gate": True,
+}
+DISABLE_VERB: str = "disable"
+
+
+# ────────────────────────────────────────────────────────────
+#  Compiled level model
+# ────────────────────────────────────────────────────────────
+
+class GateSpec(TypedDict):
+    grid:     Tuple[int, int]       # (col, row) as written in the YAML
+    position: Tuple[float, float]   # world coordinates
+    state:    str                   # "open" or "closed"
+
+
+class ActionTable(TypedDict):
+    """What a switch does when it reaches one of its states."""
+    gates:   List[int]              # indices into CompiledLevel["gates"]
+    closed:  List[bool]             # per gate: close-gate (True) / open-gate (False)
+    disable: bool                   # "disable": the lever stops reacting
+
+
+class SwitchSpec(TypedDict):
+    position: Tuple[float, float]
+    meta:     Dict[str, Any]        # raw YAML dict of the switch
+    on:       ActionTable           # switch_on
+    off:      ActionTable           # switch_off
+
+
+class CompiledLevel(TypedDict):
+    version:     int
+    source_hash: str
+    meta:        Dict[str, Any]
+    rows:        List[str]
+    platforms:   List[PlatformSpec]
+    gates:       List[GateSpec]
+    switches:    List[SwitchSpec]
+
+
+# ────────────────────────────────────────────────────────────
+#  Public API
+# ────────────────────────────────────────────────────────────
+
+def cache_path(filename: str | Path) -> Path:
+    """Return where the compiled form of *filename* is stored."""
+    path = Path(filename)
+    return path.with_name(path.name + CACHE_SUFFIX)
+
+
+def source_hash(data: bytes) -> str:
+    """Hash of the raw map file (salted with the cache format version)."""
+    return hashlib.sha256(str(CACHE_VERSION).encode() + b"\0" + data).hexdigest()
+
+
+def compile_level(filename: str | Path, digest: str = "") -> CompiledLevel:
+    """Parse *filename* and derive everything that does not need a sprite."""
+    # imported here: a warm cache never parses YAML, so it never pays for it
+    from src.map_builder import map_loader
+
+    meta, rows = map_loader.MapLoader(filename).load()
+
+    gates: List[GateSpec] = []
+    gate_index: Dict[Tuple[int, int], int] = {}
+    for g in meta.get("gates") or []:
+        gx, gy = g["x"], g["y"]
+        gate_index[(gx, gy)] = len(gates)
+        gates.append(GateSpec(
+            grid=(gx, gy),
+            position=helper.grid_to_world(gx, gy + 1),
+            state=g.get("state", "closed"),
+        ))
+
+    switches: List[SwitchSpec] = []
+    for s in meta.get("switches") or []:
+        on = compile_actions(s.get("switch_on") or [], gate_index)
+        off = compile_actions(s.get("switch_off") or [], gate_index)
+        switches.append(SwitchSpec(
+            position=helper.grid_to_world(s["x"], s["y"] + 1),
+            meta=s,
+            on=on,
+            off=off,
+        ))
+
+    return CompiledLevel(
+        version=CACHE_VERSION,
+        source_hash=digest,
+        meta=meta,
+        rows=rows,
+        platforms=platform_specs(rows, meta, textures.TEXTURES),
+        gates=gates,
+        switches=switches,
+    )
+
+
+def compile_actions(actions: List[Dict[str, Any]], gate_index: Dict[Tuple[int, int], int]) -> ActionTable:
+    """Resolve one YAML action list to gate indices + target states.
+
+    Actions naming no known gate, or an unknown verb, are dropped.
+    """
+    table = ActionTable(gates=[], closed=[], disable=False)
+    for act in actions:
+        verb = act.get("action")
+        if verb == DISABLE_VERB:
+            table["disable"] = True
+            continue
+        idx = gate_index.get((act.get("x", -1), act.get("y", -1)))
+        if idx is not None and verb in GATE_VERBS:
+            table["gates"].append(idx)
+            table["closed"].append(GATE_VERBS[verb])
+    return table
+
+
+def load_compiled(filename: str | Path, use_cache: bool = True) -> CompiledLevel:
+    """Return the compiled level, from the on-disk cache when it is fresh.
+
+    A missing, stale or unreadable cache is silently rebuilt; failing to
+    write the new cache (read-only install…) is not an error either.
+    """
+    path = Path(filename)
+    if not path.exists():
+        raise FileNotFoundError(path)
+    digest = source_hash(path.read_bytes())
+
+    if not use_cache:
+        return compile_level(path, digest)
+
+    cached = _read_cache(cache_path(path), digest)
+    if cached is not None:
+        return cached
+
+    level = compile_level(path, digest)
+    _write_cache(cache_path(path), level)
+    return level
+
+
+# ────────────────────────────────────────────────────────────
+#  Internals
+# ────────────────────────────────────────────────────────────
+
+def _read_cache(path: Path, digest: str) -> CompiledLevel | None:
+    try:
+        with path.open("rb") as fh:
+            data: Any = pickle.load(fh)
+    except Exception:   # missing, truncated, garbage, stale classes…: rebuild
+        return None
+    if (
+        not isinstance(data, dict)
+        or data.get("version") != CACHE_VERSION
+        or data.get("source_hash") != digest
+    ):
+        return None
+    return cast(CompiledLevel, data)
+
+
+def _write_cache(path: Path, level: CompiledLevel) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        with tmp.open("wb") as fh:
+            pickle.dump(level, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)            # atomic: readers never see half a file
+    except OSError:
+        tmp.unlink(missing_ok=True)
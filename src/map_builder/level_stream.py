@@ -0,0 +1,143 @@
+"""level_stream.py – materialise a level chunk by chunk around the camera.
+
+`LevelBuilder.build_streamed_level()` only creates the player, the moving
+platforms, the gates and the switches.  Everything else that sits on the
+grid (walls, coins, traps, exits, monster spawns) is handed to a
+`LevelStreamer`, which creates the sprites of a chunk when it comes within
+*radius* chunks of the camera and drops them again once it is further away.
+Memory and per-frame collision cost therefore depend on the view, not on
+the size of the map.
+
+Evicted sprites go back to the builder's `SpritePool`, so walking back and
+forth over a chunk border recycles the same sprites.
+
+With *collision_mesh* the collision list is the streamer's too: a chunk's
+walls are greedy-meshed (`collision_mesh.grid_rectangles`) the first time
+it loads, and its rectangles come and go with it – the map as a whole is
+never meshed.
+
+Coins that were picked up and monsters that were killed are remembered by
+grid cell, so leaving and re-entering a chunk does not bring them back.
+A monster belongs to the chunk of its spawn cell: it is evicted (and later
+respawned fresh) together with that chunk.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, List, Set, Tuple
+
+import arcade
+
+from src.entities.base_entity import Enemy
+from src.map_builder import glyph_grid
+from src.map_builder.collision_mesh import collision_sprites, grid_rectangles
+from src.map_builder.chunks import CHUNK_TILES, ChunkKey, Rect, chunk_key, chunks_in_rect
+
+if TYPE_CHECKING:   # avoid cycle at runtime
+    from src.map_builder.level_builder import LevelBuilder, LevelData
+
+STREAMED_GLYPHS: Set[str] = {"=", "-", "x", "*", "£", "E", "o", "b"}
+CONSUMABLE_GLYPHS: Set[str] = {"*", "o", "b"}   # removed by gameplay, never restored
+
+Cell = Tuple[int, int]   # (col, row) – row 0 at the bottom
+
+
+class LevelStreamer:
+    """Loads / evicts the static content of a level around a view rectangle."""
+
+    def __init__(
+        self,
+        builder: "LevelBuilder",
+        level: "LevelData",
+        rows: List[str],
+        *,
+        radius: int = 1,
+        chunk_tiles: int = CHUNK_TILES,
+        collision_mesh: bool = False,
+    ) -> None:
+        self._builder = builder
+        self._level = level
+        self.radius = radius
+        self.chunk_tiles = chunk_tiles
+        self.collision_mesh = collision_mesh
+
+        # glyphs per chunk, computed once from the grid (empty cells skipped)
+        self._cells: Dict[ChunkKey, List[Tuple[str, int, int]]] = {}
+        grid = self._grid = glyph_grid.glyph_array(rows)
+        for symbol, (cols, rws) in glyph_grid.glyph_cells(grid, STREAMED_GLYPHS).items():
+            for col_index, row_index in zip(cols.tolist(), rws.tolist()):
+                key = chunk_key(col_index, row_index, chunk_tiles)
+                self._cells.setdefault(key, []).append((symbol, col_index, row_index))
+
+        self._loaded: Dict[ChunkKey, List[Tuple[Cell, arcade.Sprite, bool]]] = {}
+        self._consumed: Set[Cell] = set()
+        # collision rectangles of the chunks met so far (collision_mesh)
+        self._meshes: Dict[ChunkKey, List[arcade.Sprite]] = {}
+
+    # ------------------------------------------------------------------
+    # public API
+    # ------------------------------------------------------------------
+    @property
+    def loaded_chunks(self) -> Set[ChunkKey]:
+        return set(self._loaded)
+
+    def update(self, view: Rect) -> None:
+        """Make the loaded chunks match *view* (world rect) grown by radius."""
+        wanted = {
+            key for key in chunks_in_rect(view, self.radius, self.chunk_tiles)
+            if key in self._cells
+        }
+        for key in [k for k in self._loaded if k not in wanted]:
+            self._evict(key)
+        for key in wanted:
+            if key not in self._loaded:
+                self._load(key)
+
+    def clear(self) -> None:
+        """Evict every loaded chunk."""
+        for key in list(self._loaded):
+            self._evict(key)
+
+    def reset(self, view: Rect) -> None:
+        """Back to the start of the level: every coin / monster comes back."""
+        self.clear()
+        self._consumed.clear()
+        self.update(view)
+
+    # ------------------------------------------------------------------
+    # internals
+    # ------------------------------------------------------------------
+    def _load(self, key: ChunkKey) -> None:
+        placed: List[Tuple[Cell, arcade.Sprite, bool]] = []
+        for symbol, col, row in self._cells[key]:
+            if (col, row) in self._consumed:
+                continue
+            sprite = self._builder.place_glyph(self._level, symbol, col, row)
+            if sprite is None:
+                continue
+            if isinstance(sprite, Enemy):
+                sprite.set_environment(self._level["collision"], self._level["grid"])
+            placed.append(((col, row), sprite, symbol in CONSUMABLE_GLYPHS))
+        self._loaded[key] = placed
+        if self.collision_mesh:
+            self._level["collision"].extend(self._mesh(key))
+
+    def _mesh(self, key: ChunkKey) -> List[arcade.Sprite]:
+        mesh = self._meshes.get(key)
+        if mesh is None:
+            size = self.chunk_tiles
+            col0, row0 = key[0] * size, key[1] * size
+            cells = self._grid[row0:row0 + size, col0:col0 + size]
+            mesh = self._meshes[key] = collision_sprites(grid_rectangles(cells, col0, row0))
+        return mesh
+
+    def _evict(self, key: ChunkKey) -> None:
+        placed = self._loaded.pop(key)
+        if self.collision_mesh:
+            for rect in self._meshes[key]:
+                rect.remove_from_sprite_lists()
+        for cell, sprite, consumable in placed:
+            if consumable and not sprite.sprite_lists:
+                self._consumed.add(cell)       # picked up / killed meanwhile
+            else:
+                sprite.remove_from_sprite_lists()
+        self._builder.pool.release(sprite for _, sprite, _ in placed)
@@ -5,9 +5,10 @@ Build MovingPlatform sprites for one level without external helpers.
 
 from __future__ import annotations
 
-from typing import Dict, List, Tuple, Generator, Any
+from typing import Dict, List, Optional, Tuple, Generator, Any, TypedDict
 
 from src.map_builder.platforms import Platform
+from src.map_builder.sprite_pool import SpritePool
 from src.helper import grid_to_world, grid_row
 
 
@@ -22,6 +23,40 @@ ARROWS_V = {"↑", "↓"}
 # Tiny in-file helpers – replace former src.helper.*
 # ──────────────────────────────────────────────────────────────
 
+class PlatformSpec(TypedDict):
+    """Plain-data description of one moving tile (picklable, no GL)."""
+    texture:    str
+    start_pos:  Tuple[float, float]
+    axis:       str
+    direction:  bool
+    boundary_a: float
+    boundary_b: float
+
+
+def spawn_platforms(specs: List[PlatformSpec], pool: Optional[SpritePool] = None) -> List[Platform]:
+    """Instantiate the Platform sprites described by *specs* (reusing the
+    released tiles of *pool* first)."""
+    platforms: List[Platform] = []
+    for spec in specs:
+        platform = pool.take(Platform, spec["texture"]) if pool is not None else None
+        if platform is not None:
+            platform.reset(spec["start_pos"], spec["axis"], spec["direction"],
+                           spec["boundary_a"], spec["boundary_b"])
+        else:
+            platform = Platform(
+                texture=spec["texture"],
+                start_pos=spec["start_pos"],
+                axis=spec["axis"],
+                direction=spec["direction"],
+                boundary_a=spec["boundary_a"],
+                boundary_b=spec["boundary_b"],
+            )
+            if pool is not None:
+                pool.track(platform, spec["texture"])
+        platforms.append(platform)
+    return platforms
+
+
 # ──────────────────────────────────────────────────────────────
 # Public entry – build platforms
 # ──────────────────────────────────────────────────────────────
@@ -30,8 +65,17 @@ def build_platforms(
     meta: dict[str, Any],
     tile_textures: Dict[str, str],
 ) -> List[Platform]:
+    """Return a list of MovingPlatform sprites built from an ASCII map."""
+    return spawn_platforms(platform_specs(rows, meta, tile_textures))
+
+
+def platform_specs(
+    rows: List[str],
+    meta: dict[str, Any],
+    tile_textures: Dict[str, str],
+) -> List[PlatformSpec]:
     """
-    Return a list of MovingPlatform sprites built from an ASCII map.
+    Return the PlatformSpec of every moving tile found in an ASCII map.
     `meta` MUST contain at least: tile, scale.
     
     The function:
@@ -39,7 +83,7 @@ def build_platforms(
       - Identifies eligible blocks.
       - Collects horizontal and vertical arrow series.
       - Matches arrow series with blocks to determine platform direction and boundaries.
-      - Creates Platform instances based on discovered data.
+      - Describes one Platform per tile based on discovered data.
     """
     # Create a working copy of rows.
     meta_with_rows = rows
@@ -48,15 +92,8 @@ def build_platforms(
     #print("Building platforms from rows:", meta_with_rows)
     #print("Unique chars in rows:", sorted({c for line in rows for c in line}))
 
-    # Label connected blocks of eligible characters.
-    blocks = _label_blocks(meta_with_rows, width)
-    #print(f"Blocks found: {blocks}")
-    # Extract arrow series for horizontal and vertical directions.
-    series_h, series_v = _collect_arrow_series(meta_with_rows, width)
-    #print(f"Horizontal arrow series: {series_h}")
-    #print(f"Vertical arrow series: {series_v}")
-    # Initialize list to hold created platforms.
-    sprites: List[Platform] = []
+    # Initialize list to hold the platform descriptions.
+    sprites: List[PlatformSpec] = []
     wx: float
     wy: float
     """
@@ -68,24 +105,8 @@ def build_platforms(
     """
     # Total number of rows for coordinate calculations.
     length = len(rows)
-    # Process each block (group of connected cells)
-    for cells in blocks.values():
-        # Determine the minimal and maximal column and row indices in the block.
-        #col_min = min(c for c, _ in cells)
-        #col_max = max(c for c, _ in cells)
-
-
-        # Try to find a horizontal arrow series adjacent to the block.
-        chosen: tuple[int, Tuple[int, int], int] | None = fuse_series_for_block(cells, series_h, axis="x")
-        axis = "x"
-        # If no horizontal series was found, try vertical.
-        if chosen is None:
-            chosen = fuse_vertical_series_for_block(cells, series_v)
-            axis = "y"
-        # If still no series is found, skip this block.
-        if chosen is None:
-            continue
-
+    # Process each block (group of connected cells) driven by an arrow series
+    for cells, axis, chosen in block_series(meta_with_rows, width):
         # Unpack the arrow series details.
         _, (ser_min, ser_max), direction = chosen
 
@@ -104,7 +125,7 @@ def build_platforms(
                 #print(f"Processing cell ({col}, {row}) with bounds ({b_left}, {b_right}), a={a}, b={b}")
                 wx, wy = grid_to_world(col, length - row - 1)
                 sprites.append(
-                    Platform(
+                    PlatformSpec(
                         texture=tile_textures[rows[row][col]],
                         start_pos=(wx, wy),
                         axis="x",
@@ -128,7 +149,7 @@ def build_platforms(
                 wx, wy = grid_to_world(col, length - row - 1)
                 print("Unknown map char:", repr(rows[row][col]))
                 sprites.append(
-                    Platform(
+                    PlatformSpec(
                         texture=tile_textures[rows[row][col]],
                         start_pos=(wx, wy),
                         axis="y",
@@ -137,7 +158,7 @@ def build_platforms(
                         boundary_b=b_bottom,
                     )
                 )    
-    # Return the list of created platform sprites.
+    # Return the list of platform descriptions.
     return sprites
 
 
@@ -147,6 +168,80 @@ def build_platforms(
 GridPos = Tuple[int, int]
 SeriesH = Dict[Tuple[int, Tuple[int, int]], int]
 SeriesV = Dict[Tuple[int, Tuple[int, int]], int]
+Chosen = Tuple[int, Tuple[int, int], int]          # line, (start, end), direction
+
+
+def block_series(rows: List[str], width: int) -> List[Tuple[List[GridPos], str, Chosen]]:
+    """(cells, axis, fused series) for every block an arrow series drives.
+
+    Same answer as calling `fuse_series_for_block` then
+    `fuse_vertical_series_for_block` on every block, but each series is
+    attached to the block owning its entry cell in one pass, so the whole
+    thing is O(cells + series) instead of O(blocks × series × cells).
+    """
+    # Label connected blocks of eligible characters.
+    blocks = _label_blocks(rows, width)
+    # Extract arrow series for horizontal and vertical directions.
+    series_h, series_v = _collect_arrow_series(rows, width)
+
+    block_of: Dict[GridPos, int] = {
+        cell: label for label, cells in blocks.items() for cell in cells
+    }
+    attached_h = _attach_series(series_h, block_of, axis="x")
+    attached_v = _attach_series(series_v, block_of, axis="y")
+
+    found: List[Tuple[List[GridPos], str, Chosen]] = []
+    for label, cells in blocks.items():
+        # Try to find a horizontal arrow series adjacent to the block,
+        # then a vertical one; blocks with neither stay static.
+        chosen = _fuse_attached(cells, attached_h.get(label), axis="x")
+        axis = "x"
+        if chosen is None:
+            chosen = _fuse_attached(cells, attached_v.get(label), axis="y")
+            axis = "y"
+        if chosen is not None:
+            found.append((cells, axis, chosen))
+    return found
+
+
+def _attach_series(
+    series_dict: SeriesH | SeriesV,
+    block_of: Dict[GridPos, int],
+    axis: str,
+) -> Dict[int, Dict[int, List[Tuple[int, int, int]]]]:
+    """block label → line (row for "x", col for "y") → series entering it.
+
+    Series keep the order of *series_dict*, so the first one of a line is
+    the one the linear scan would have met first.
+    """
+    attached: Dict[int, Dict[int, List[Tuple[int, int, int]]]] = {}
+    for (line, (start, end)), direction in series_dict.items():
+        entry = start - 1 if direction == 1 else end + 1
+        cell = (entry, line) if axis == "x" else (line, entry)
+        label = block_of.get(cell)
+        if label is not None:
+            attached.setdefault(label, {}).setdefault(line, []).append((start, end, direction))
+    return attached
+
+
+def _fuse_attached(
+    cells: List[GridPos],
+    by_line: Dict[int, List[Tuple[int, int, int]]] | None,
+    axis: str,
+) -> Chosen | None:
+    if not by_line:
+        return None
+    # Same (set) iteration order as fuse_series_for_block so that a block
+    # touched on several lines picks the same one.
+    lines = set(r for _, r in cells) if axis == "x" else set(c for c, _ in cells)
+    for line in lines:
+        series = by_line.get(line)
+        if not series:
+            continue
+        min_start = min(s for s, _, _ in series)
+        max_end = max(e for _, e, _ in series)
+        return line, (min_start, max_end), series[0][2]
+    return None
 
 
 def _label_blocks(rows: List[str], width: int) -> Dict[int, List[GridPos]]:
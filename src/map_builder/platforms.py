@@ -10,6 +10,12 @@ class Platform(arcade.Sprite):
                  boundary_a:float, boundary_b:float)-> None:
         super().__init__(texture, scale=0.5,
                          center_x=start_pos[0], center_y=start_pos[1])
+        self.reset(start_pos, axis, direction, boundary_a, boundary_b)
+
+    def reset(self, start_pos:Tuple[float,float], axis:str, direction:bool,
+              boundary_a:float, boundary_b:float) -> None:
+        """(Re)place the tile at *start_pos* with its motion – also used for pooled tiles."""
+        self.position = start_pos
         self.axis = axis              # "x" or "y"
         self.direction = direction        # True = +dir, False = −dir
         if self.axis == "x":
@@ -17,11 +23,14 @@ class Platform(arcade.Sprite):
             self.change_y = 0
             self.boundary_left = boundary_a  # world coords  (min on that axis)
             self.boundary_right = boundary_b  # world coords  (max on that axis)
+            # a pooled tile may come from the other axis: arcade checks all four
+            self.boundary_top = self.boundary_bottom = None
         elif self.axis == "y":
             self.change_y = self.SPEED_PX_PER_FRAME if direction else -self.SPEED_PX_PER_FRAME
             self.change_x = 0
             self.boundary_top = boundary_a  # world coords  (min on that axis)
             self.boundary_bottom = boundary_b  # world coords  (max on that axis)
+            self.boundary_left = self.boundary_right = None
         else: raise ValueError("Axis must be 'x' or 'y'.")
 
         
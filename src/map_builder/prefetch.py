@@ -0,0 +1,61 @@
+"""prefetch.py – load the next level of the chain on a worker thread.
+
+Reaching the exit portal used to parse and build the next map inside the
+frame that touched it.  `LevelPrefetcher` compiles upcoming maps (see
+`level_cache`) in the background, so only the sprite creation is left to
+the main thread when the player actually goes through the exit.
+"""
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
+
+from src.map_builder import level_cache
+from src.map_builder.level_cache import CompiledLevel
+
+# exit portals lead through these maps, in order, then wrap around
+MAP_CHAIN: Tuple[str, ...] = (
+    "assets/maps/1.txt",
+    "assets/maps/2.txt",
+    "assets/maps/3.txt",
+)
+
+
+def next_map(current: str) -> str:
+    """Map that follows *current* in MAP_CHAIN (unknown maps restart it)."""
+    if current in MAP_CHAIN:
+        return MAP_CHAIN[(MAP_CHAIN.index(current) + 1) % len(MAP_CHAIN)]
+    return MAP_CHAIN[0]
+
+
+class LevelPrefetcher:
+    """Compile maps ahead of time on a single background thread."""
+
+    def __init__(self, use_cache: bool = True) -> None:
+        self.use_cache = use_cache
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="level-prefetch")
+        self._pending: Dict[str, Future[CompiledLevel]] = {}
+
+    def request(self, filename: str) -> None:
+        """Start compiling *filename* unless it is already queued / ready."""
+        if filename not in self._pending:
+            self._pending[filename] = self._executor.submit(
+                level_cache.load_compiled, filename, self.use_cache
+            )
+
+    def is_ready(self, filename: str) -> bool:
+        future = self._pending.get(filename)
+        return future is not None and future.done()
+
+    def take(self, filename: str) -> Optional[CompiledLevel]:
+        """Hand over the compiled level (waiting for the worker if needed).
+
+        Returns None when *filename* was never requested, or when the worker
+        failed (missing file, malformed map, cache being rewritten…): the
+        caller then loads it synchronously, which either succeeds or raises
+        the error right where a load without prefetch would have raised it.
+        """
+        future = self._pending.pop(filename, None)
+        if future is None or future.exception() is not None:
+            return None
+        return future.result()
@@ -0,0 +1,95 @@
+"""sprite_pool.py – reuse level sprites from one map to the next.
+
+Loading a map used to construct every wall, coin, platform, gate, switch
+and monster from scratch and throw them all away on the next load.  A
+`SpritePool` keeps the sprites of the level being torn down, keyed by
+(sprite class, texture path); `LevelBuilder` takes from it before creating
+anything, so cycling through the maps quickly stops allocating sprites at
+all – only their position / state is rewritten.
+
+Only sprites created through `track()` are pooled: collision rectangles,
+arrows or anything else handed to `release()` are simply ignored.
+"""
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional, Tuple, Type, TypeVar
+from weakref import WeakKeyDictionary
+
+import arcade
+
+PoolKey = Tuple[type, str]      # sprite class, texture path
+
+SpriteT = TypeVar("SpriteT", bound=arcade.Sprite)
+
+
+class SpritePool:
+    """Free lists of level sprites, keyed by class and texture."""
+
+    def __init__(self) -> None:
+        self._free: Dict[PoolKey, List[arcade.Sprite]] = {}
+        # key of every sprite handed out and not yet released
+        self._owned: WeakKeyDictionary[arcade.Sprite, PoolKey] = WeakKeyDictionary()
+        self.created = 0
+        self.reused = 0
+
+    def take(self, cls: Type[SpriteT], texture: str) -> Optional[SpriteT]:
+        """A released sprite of *cls* / *texture*, or None (caller creates it).
+
+        The sprite keeps whatever state it had: the caller resets it.
+        """
+        free = self._free.get((cls, texture))
+        if not free:
+            return None
+        sprite = free.pop()
+        assert isinstance(sprite, cls)
+        self._owned[sprite] = (cls, texture)
+        self.reused += 1
+        return sprite
+
+    def take_many(self, cls: Type[SpriteT], texture: str, count: int) -> List[SpriteT]:
+        """Up to *count* released sprites of *cls* / *texture* in one go
+        (fewer if the pool runs short: the caller creates the rest)."""
+        free = self._free.get((cls, texture))
+        if not free:
+            return []
+        sprites = free[-count:] if count else []
+        del free[len(free) - len(sprites):]
+        key = (cls, texture)
+        self._owned.update((sprite, key) for sprite in sprites)
+        self.reused += len(sprites)
+        return sprites      # type: ignore[return-value]   # pooled under *cls*
+
+    def track(self, sprite: SpriteT, texture: str) -> SpriteT:
+        """Register a freshly created sprite so `release()` can keep it."""
+        self._owned[sprite] = (type(sprite), texture)
+        self.created += 1
+        return sprite
+
+    def track_many(self, sprites: List[SpriteT], texture: str) -> List[SpriteT]:
+        """`track()` for a batch of sprites of one class."""
+        if sprites:
+            key = (type(sprites[0]), texture)
+            self._owned.update((sprite, key) for sprite in sprites)
+            self.created += len(sprites)
+        return sprites
+
+    def release(self, sprites: Iterable[arcade.Sprite]) -> int:
+        """Give *sprites* back to the pool; returns how many were kept.
+
+        Clear the sprite lists first (``SpriteList.clear()``): a sprite still
+        in a list is removed from it here, one at a time.
+        """
+        kept = 0
+        for sprite in sprites:
+            key = self._owned.pop(sprite, None)
+            if key is None:             # not ours, or already released
+                continue
+            if sprite.sprite_lists:
+                sprite.remove_from_sprite_lists()
+            self._free.setdefault(key, []).append(sprite)
+            kept += 1
+        return kept
+
+    @property
+    def free_count(self) -> int:
+        return sum(len(free) for free in self._free.values())
@@ -53,8 +53,9 @@ it requires only `arcade` and a reference to the gate list so it can find the
 right Gate to operate on.
 """
 import arcade
-from typing import List,Tuple, Union, Any, Dict
+from typing import Callable, List, Optional, Tuple, Union, Any, Dict
 from src.texture_manager import *
+from src.map_builder.level_cache import ActionTable
 
 
 # ──────────────────────────────────────────────────────────────────────
@@ -64,9 +65,10 @@ from src.texture_manager import *
 class Gate(arcade.Sprite):
     """Solid tile that can open (become intangible and invisible).
 
-    When *open* is True the sprite is hidden; callers are responsible for
-    removing / re‑adding it to the *walls* SpriteList used by the physics
-    engine so it stops colliding with the player.
+    When *open* is True the sprite is hidden.  Every callable of
+    ``listeners`` is called with the gate when its state actually changes,
+    so the walls used by the physics engine can follow (see
+    `gate_solidity.GateSolidity`) without scanning the gates each frame.
     """
 
     def __init__(
@@ -80,6 +82,7 @@ class Gate(arcade.Sprite):
         super().__init__(texture, scale=scale, center_x=position[0], center_y=position[1])
         self.is_open: bool = state == "open"
         self.visible = not self.is_open
+        self.listeners: List[Callable[["Gate"], None]] = []
 
     # ------------------------------------------------------------------
     # public helpers ----------------------------------------------------
@@ -87,21 +90,19 @@ class Gate(arcade.Sprite):
 
     def set_state(self, closed: bool) -> None:
         """Set gate closed (solid/visible) or open (hidden)."""
+        changed = self.is_open == closed
         self.is_open = not closed
         self.visible = closed  # visible == solid in a 2D platformer
+        if changed:
+            for listener in self.listeners:
+                listener(self)
 
     def toggle(self) -> None:
         """Convenience shortcut."""
         self.set_state(self.is_open)  # invert
 
-    # The physics‑engine sprite list must be managed *outside* – we cannot
-    # know which list the caller is using.  Recommended pattern:
-    #
-    #     if gate.is_open:
-    #         walls.remove(gate)
-    #     else:
-    #         walls.append(gate)
-    #
+    # The physics‑engine sprite list is managed *outside* – we cannot know
+    # which list the caller is using: subscribe to ``listeners`` instead.
 
 # ──────────────────────────────────────────────────────────────────────
 #  Switch sprite – animated lever that executes actions
@@ -110,6 +111,10 @@ class Gate(arcade.Sprite):
 
 SpriteListOrList = Union[List["Gate"], arcade.SpriteList[Gate]]  # helper alias
 
+# a compiled action list, resolved to sprites: (gate, closed) – closed=None
+# toggles the gate (switches built without compiled actions)
+GateActions = List[Tuple[Gate, Optional[bool]]]
+
 
 class Switch(arcade.Sprite):
     """
@@ -119,6 +124,9 @@ class Switch(arcade.Sprite):
       ``{ "x": 3, "y": 8, "state": "on", "switch_on": [...], ... }``.
     * ``gate_list`` is the sprite list containing every Gate that may be
       targeted by this switch.
+    * ``actions`` – the ``switch_on`` / ``switch_off`` lists compiled by
+      `level_cache.compile_actions`, with gate indices into *gate_list*.
+      Without them the lever simply toggles every gate of *gate_list*.
     """
 
     TEXTURE_OFF = LEVER_OFF_TEXTURE
@@ -134,6 +142,7 @@ class Switch(arcade.Sprite):
         gate_list: SpriteListOrList=arcade.SpriteList(),
         *,
         scale: float = 0.5,
+        actions: Optional[Tuple[ActionTable, ActionTable]] = None,
     ) -> None:
 
         # --- base sprite ------------------------------------------------
@@ -141,31 +150,62 @@ class Switch(arcade.Sprite):
                          scale=scale,
                          center_x=position[0],
                          center_y=position[1])
-        self.append_texture(arcade.load_texture(self.TEXTURE_OFF))
-        self.append_texture(arcade.load_texture(self.TEXTURE_ON))  # index 1
+        self.append_texture(get_texture_path(self.TEXTURE_OFF))
+        self.append_texture(get_texture_path(self.TEXTURE_ON))  # index 1
+        self.configure(position, switch_meta, gate_list, actions)
+
+    def configure(
+        self,
+        position: Tuple[float, float],
+        switch_meta: Dict[str, Any],
+        gate_list: SpriteListOrList,
+        actions: Optional[Tuple[ActionTable, ActionTable]] = None,
+    ) -> None:
+        """Place the lever and (re)bind its meta / gates – pooled levers too."""
+        self.position = position
 
         # --- runtime state ----------------------------------------------
         self._meta: Dict[str, Any]   = switch_meta        # keep the dict
         self._gate_list              = gate_list
         self.meta_x: int = switch_meta.get("x", 0)
         self.meta_y: int = switch_meta.get("y", 0)
-        self.is_on: bool = switch_meta.get("state", "off") == "on"
+        # YAML reads a bare ``on`` as True
+        self.is_on: bool = switch_meta.get("state", "off") in ("on", True)
+        self.enabled: bool = True
         self.set_texture(1 if self.is_on else 0)
 
+        # --- action tables, indexed by the state being entered -----------
+        if actions is None:
+            toggle_all: GateActions = [(gate, None) for gate in gate_list]
+            self._actions = (toggle_all, toggle_all)
+            self._disables = (False, False)
+        else:
+            on, off = actions
+            self._actions = (self._resolve(off, gate_list), self._resolve(on, gate_list))
+            self._disables = (off["disable"], on["disable"])
+
+    @staticmethod
+    def _resolve(table: ActionTable, gate_list: SpriteListOrList) -> GateActions:
+        resolved: GateActions = [(gate_list[i], closed) for i, closed in zip(table["gates"], table["closed"])]
+        return resolved
+
     # ------------------------------------------------------------------
     #  Public interface
     # ------------------------------------------------------------------
     def trigger(self) -> None:
         """Flip the switch and execute its actions (unless disabled)."""
+        if not self.enabled:
+            return
 
         # 1) toggle logical + visual state
         self.is_on = not self.is_on
         self.set_texture(1 if self.is_on else 0)
 
         # 2) execute appropriate action list
-        for gate in self._gate_list:
-            print("gate:", gate, "is_open:", gate.is_open,"at", gate.center_x, gate.center_y)
-            gate.toggle()
+        for gate, closed in self._actions[self.is_on]:
+            gate.set_state(gate.is_open if closed is None else closed)
+        if self._disables[self.is_on]:
+            self.enabled = False
 
     def debug_switch(self, position: Tuple[float, float], state: bool, gates: arcade.SpriteList[Gate]) -> None:
         """Debugging helper to visualize switch state."""
@@ -173,3 +213,5 @@ class Switch(arcade.Sprite):
         self.is_on = state
         self.set_texture(1 if self.is_on else 0)
         self._gate_list = gates
+        toggle_all: GateActions = [(gate, None) for gate in gates]
+        self._actions = (toggle_all, toggle_all)
@@ -0,0 +1,205 @@
+"""tile_grid.py – occupancy grid of the static level geometry.
+
+Static walls sit on the regular TILESIZE grid of `helper.grid_to_world`, so
+"is there a wall here?" does not need a SpriteList query: it is one lookup
+in a (height, width) array built from the ASCII rows.
+
+* ``=`` / ``x`` fill their whole cell (`FULL`);
+* ``-`` only fills the upper half of its cell (`HALF`, see its hit box);
+* gates are written into the grid while they are closed (`set_solid`);
+  `version` changes with every such write, so anything derived from the
+  grid (e.g. the walk spans of blobs) knows when to recompute.
+
+Row 0 is the bottom row, like everywhere else in map_builder.  Outside the
+map everything is empty.
+"""
+from __future__ import annotations
+
+import math
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import arcade
+import numpy as np
+import numpy.typing as npt
+
+from src.constants_proj import TILESIZE
+from src.map_builder import glyph_grid
+from src.map_builder.collision_mesh import FULL_GLYPHS, HALF_GLYPHS
+
+EMPTY, FULL, HALF = 0, 1, 2
+
+Cell = Tuple[int, int]                          # (col, row)
+Box = Tuple[float, float, float, float]         # left, bottom, right, top
+RayHit = Tuple[float, float, Cell]              # x, y of the first solid point, its cell
+
+EPSILON = 1e-6   # touching edges do not overlap
+
+
+class TileGrid:
+    """Solid / half-solid / empty state of every tile of a level."""
+
+    def __init__(self, cells: npt.NDArray[np.uint8], tile: float = TILESIZE) -> None:
+        self.cells = cells                      # (height, width), row 0 = bottom
+        self.tile = tile
+        self.height, self.width = cells.shape
+        # per-row bytearrays: scalar lookups without NumPy's indexing overhead
+        self._rows: List[bytearray] = [bytearray(row.tobytes()) for row in cells]
+        self._base: Dict[Cell, int] = {}        # cells overridden by set_solid
+        self.version = 0                        # bumped when a cell changes
+        # walkable columns (1 byte each) per (bottom, top) band, see walk_span
+        self._walk_rows: Dict[Tuple[float, float], bytes] = {}
+
+    @classmethod
+    def from_rows(cls, rows: List[str], tile: float = TILESIZE) -> "TileGrid":
+        grid = glyph_grid.glyph_array(rows)
+        cells = np.zeros(grid.shape, dtype=np.uint8)
+        cells[glyph_grid.glyph_mask(grid, FULL_GLYPHS)] = FULL
+        cells[glyph_grid.glyph_mask(grid, HALF_GLYPHS)] = HALF
+        return cls(cells, tile)
+
+    @classmethod
+    def from_sprites(cls, sprites: Iterable[arcade.Sprite], tile: float = TILESIZE) -> "TileGrid":
+        """Grid whose cells under the centre of *sprites* are FULL (hand-built levels)."""
+        cells = [(math.floor(s.center_x / tile), math.floor(s.center_y / tile)) for s in sprites]
+        cells = [(col, row) for col, row in cells if col >= 0 and row >= 0]
+        width = max((col for col, _ in cells), default=-1) + 1
+        height = max((row for _, row in cells), default=-1) + 1
+        grid = np.zeros((height, width), dtype=np.uint8)
+        for col, row in cells:
+            grid[row, col] = FULL
+        return cls(grid, tile)
+
+    @classmethod
+    def empty(cls) -> "TileGrid":
+        return cls(np.zeros((0, 0), dtype=np.uint8))
+
+    # ------------------------------------------------------------------
+    # lookups
+    # ------------------------------------------------------------------
+    def cell_at(self, x: float, y: float) -> Cell:
+        return math.floor(x / self.tile), math.floor(y / self.tile)
+
+    def kind(self, col: int, row: int) -> int:
+        if 0 <= row < self.height and 0 <= col < self.width:
+            return self._rows[row][col]
+        return EMPTY
+
+    def cell_box(self, col: int, row: int) -> Box:
+        """Solid part of a non-empty cell."""
+        bottom = row * self.tile
+        if self.kind(col, row) == HALF:
+            bottom += self.tile / 2
+        return col * self.tile, bottom, (col + 1) * self.tile, (row + 1) * self.tile
+
+    def solid_at(self, x: float, y: float) -> bool:
+        col, row = self.cell_at(x, y)
+        kind = self.kind(col, row)
+        if kind == HALF:
+            return y >= (row + 0.5) * self.tile
+        return kind == FULL
+
+    def overlapping(self, left: float, bottom: float, right: float, top: float) -> List[Box]:
+        """Solid boxes overlapping the given rectangle (touching is not overlapping)."""
+        col0, row0 = self.cell_at(left + EPSILON, bottom + EPSILON)
+        col1, row1 = self.cell_at(right - EPSILON, top - EPSILON)
+        col0, row0 = max(col0, 0), max(row0, 0)
+        col1, row1 = min(col1, self.width - 1), min(row1, self.height - 1)
+        boxes: List[Box] = []
+        for row in range(row0, row1 + 1):
+            line = self._rows[row]
+            for col in range(col0, col1 + 1):
+                if not line[col]:
+                    continue
+                box = self.cell_box(col, row)
+                if box[1] < top - EPSILON and box[3] > bottom + EPSILON:
+                    boxes.append(box)
+        return boxes
+
+    def walk_span(self, x: float, bottom: float, top: float) -> Optional[Tuple[float, float]]:
+        """World x-range of the run of cells a box can walk along, or None.
+
+        A column is walkable when there is ground right under *bottom* and
+        nothing solid between *bottom* and *top*; the run is the one holding
+        *x*.  None when there is no ground under *x* at all.
+        """
+        walkable = self._walk_rows.get((bottom, top))
+        if walkable is None:
+            walkable = self._walk_rows[bottom, top] = self._walkable_row(bottom, top)
+        col = math.floor(x / self.tile)
+        if not (0 <= col < self.width and walkable[col]):
+            return None
+        first = walkable.rfind(b"\0", 0, col) + 1
+        end = walkable.find(b"\0", col)
+        return first * self.tile, (self.width if end < 0 else end) * self.tile
+
+    def _walkable_row(self, bottom: float, top: float) -> bytes:
+        """Walkability of every column for a box spanning *bottom* → *top*."""
+        walkable = np.zeros(self.width, dtype=bool)
+        ground_row = math.floor((bottom - 1) / self.tile)
+        if 0 <= ground_row < self.height:
+            kinds = self.cells[ground_row]
+            upper_half = bottom - 1 >= (ground_row + 0.5) * self.tile
+            walkable = (kinds == FULL) | ((kinds == HALF) & upper_half)
+        row0 = max(math.floor((bottom + EPSILON) / self.tile), 0)
+        row1 = min(math.floor((top - EPSILON) / self.tile), self.height - 1)
+        for row in range(row0, row1 + 1):
+            kinds = self.cells[row]
+            cell_bottom = row * self.tile + np.where(kinds == HALF, self.tile / 2, 0)
+            cell_top = (row + 1) * self.tile
+            blocked = (kinds != EMPTY) & (cell_bottom < top - EPSILON) & (cell_top > bottom + EPSILON)
+            walkable &= ~blocked
+        return walkable.astype(np.uint8).tobytes()
+
+    def raycast(self, x0: float, y0: float, x1: float, y1: float) -> Optional[RayHit]:
+        """First solid point of the segment (x0, y0) → (x1, y1), or None.
+
+        Grid traversal (DDA, Amanatides & Woo): only the cells the segment
+        actually crosses are visited, in order, so nothing thin can be
+        skipped however long the segment is.
+        """
+        dx, dy = x1 - x0, y1 - y0
+        col, row = self.cell_at(x0, y0)
+        end_col, end_row = self.cell_at(x1, y1)
+        step_col = 1 if dx > 0 else -1
+        step_row = 1 if dy > 0 else -1
+        # segment parameter t (0 → 1) at the next vertical / horizontal cell border
+        t_max_x = ((col + (dx > 0)) * self.tile - x0) / dx if dx else math.inf
+        t_max_y = ((row + (dy > 0)) * self.tile - y0) / dy if dy else math.inf
+        t_delta_x = self.tile / abs(dx) if dx else math.inf
+        t_delta_y = self.tile / abs(dy) if dy else math.inf
+
+        t_enter = 0.0
+        for _ in range(abs(end_col - col) + abs(end_row - row) + 1):
+            kind = self.kind(col, row)
+            t_exit = min(t_max_x, t_max_y, 1.0)
+            if kind == FULL:
+                return x0 + dx * t_enter, y0 + dy * t_enter, (col, row)
+            if kind == HALF:
+                half = (row + 0.5) * self.tile
+                if y0 + dy * t_enter >= half:
+                    return x0 + dx * t_enter, y0 + dy * t_enter, (col, row)
+                if dy > 0 and (half - y0) / dy <= t_exit:
+                    t_half = (half - y0) / dy
+                    return x0 + dx * t_half, half, (col, row)
+            if t_max_x < t_max_y:
+                col += step_col
+                t_enter, t_max_x = t_max_x, t_max_x + t_delta_x
+            else:
+                row += step_row
+                t_enter, t_max_y = t_max_y, t_max_y + t_delta_y
+        return None
+
+    # ------------------------------------------------------------------
+    # dynamic cells
+    # ------------------------------------------------------------------
+    def set_solid(self, col: int, row: int, solid: bool) -> None:
+        """Make a cell fully solid (closed gate) or give it back its map value."""
+        if not (0 <= row < self.height and 0 <= col < self.width):
+            return
+        base = self._base.setdefault((col, row), self._rows[row][col])
+        value = FULL if solid else base
+        if self._rows[row][col] != value:
+            self._rows[row][col] = value
+            self.cells[row, col] = value
+            self.version += 1
+            self._walk_rows.clear()
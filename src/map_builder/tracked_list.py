@@ -0,0 +1,48 @@
+"""tracked_list.py – a SpriteList that counts its changes.
+
+Whoever mirrors a level list (the culled layers of `game.culling`) has
+to know when it changed.  Comparing lengths is not enough: a sprite
+removed and another added in the same frame leave the count as it was.
+`TrackedSpriteList.version` goes up on every append, insert, removal,
+replacement and clear – `remove_from_sprite_lists()` and `extend()` go
+through `remove()` / `append()` – so one integer comparison tells
+whether there is anything to catch up on.
+"""
+from __future__ import annotations
+
+from typing import TypeVar
+
+import arcade
+
+SpriteT = TypeVar("SpriteT", bound=arcade.BasicSprite)
+
+
+class TrackedSpriteList(arcade.SpriteList[SpriteT]):
+    """SpriteList with a `version` bumped by every change of its contents."""
+
+    version = 0
+
+    def append(self, sprite: SpriteT) -> None:
+        super().append(sprite)
+        self.version += 1
+
+    def insert(self, index: int, sprite: SpriteT) -> None:
+        super().insert(index, sprite)
+        self.version += 1
+
+    def remove(self, sprite: SpriteT) -> None:
+        super().remove(sprite)
+        self.version += 1
+
+    def pop(self, index: int = -1) -> SpriteT:
+        sprite = super().pop(index)
+        self.version += 1
+        return sprite
+
+    def __setitem__(self, index: int, sprite: SpriteT) -> None:
+        super().__setitem__(index, sprite)
+        self.version += 1
+
+    def clear(self, *, capacity: int | None = None, deep: bool = True) -> None:
+        super().clear(capacity=capacity, deep=deep)
+        self.version += 1
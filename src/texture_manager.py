@@ -1,6 +1,159 @@
+"""Shared textures and sounds.
+
+Every texture / sound of the game goes through `ASSETS`: a file is read
+and decoded once, later requests get the very same `arcade.Texture` /
+`arcade.Sound` object.  Textures come from arcade's default texture cache,
+the one `arcade.Sprite("path.png")` uses, so a sprite built from a path
+and a texture handed out here share one atlas slot.
+
+`ASSETS.preload()` warms the registry up from `assets/texturepack` (all
+PNGs) at startup; `ASSETS.stats()` reports hits, misses and the memory
+held by the decoded images and sounds.
+
+`decode_texture()` does the file read / decode / hit box of a texture
+without touching GL, so it can run on a worker thread (see
+`src.game.loading`); `ASSETS.adopt()` then files the result on the main
+thread, where the texture cache lives.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Dict, List, Tuple, TypedDict
+
 import arcade
+import PIL.Image
+from arcade.texture import ImageData
+from pyglet.media import StaticSource
+
+# what `from src.texture_manager import *` hands out: the asset paths and
+# the two lookups.  The registry and the loading helpers are imported by name.
+__all__ = [
+    "get_texture_path", "get_sound",
+    "SWORD_TEXTURE", "BETTER_SWORD_TEXTURE", "PLAYER_TEXTURE", "ARROW_TEXTURE",
+    "BACKGROUND_TEXTURE", "GAME_OVER_SOUND", "BAT_TEXTURE", "BOW_TEXTURE",
+    "COIN_TEXTURE", "CRATE_TEXTURE", "GATE_TEXTURE", "GREEN_BLOB_TEXTURE",
+    "GROUND_TEXTURE", "GROUND2_TEXTURE", "HALF_GROUND_TEXTURE", "LAVA_TEXTURE",
+    "LEVER_OFF_TEXTURE", "LEVER_ON_TEXTURE", "PORTAL_TEXTURE",
+]
+
+TEXTURE_DIR = "assets/texturepack"
+SOUND_SUFFIXES = (".wav", ".ogg", ".mp3")
+
+
+class AssetStats(TypedDict):
+    textures: int
+    sounds: int
+    hits: int
+    misses: int
+    texture_bytes: int      # decoded RGBA pixels
+    sound_bytes: int        # decoded PCM of static (non streamed) sounds
+
+
+class AssetRegistry:
+    """Loads each texture / sound once and hands out the shared object."""
+
+    def __init__(self) -> None:
+        self._textures: Dict[str, arcade.Texture] = {}
+        self._sounds: Dict[str, arcade.Sound] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def texture(self, path: str) -> arcade.Texture:
+        texture = self._textures.get(path)
+        if texture is not None:
+            self.hits += 1
+            return texture
+        self.misses += 1
+        texture = arcade.texture.default_texture_cache.load_or_get_texture(path)
+        self._textures[path] = texture
+        return texture
+
+    def sound(self, path: str, streaming: bool = False) -> arcade.Sound:
+        sound = self._sounds.get(path)
+        if sound is not None:
+            self.hits += 1
+            return sound
+        self.misses += 1
+        sound = arcade.load_sound(path, streaming=streaming)
+        self._sounds[path] = sound
+        return sound
+
+    def has(self, path: str) -> bool:
+        return path in self._textures or path in self._sounds
+
+    def adopt(self, path: str, asset: arcade.Texture | arcade.Sound) -> None:
+        """File an asset decoded elsewhere (`decode_texture`, a worker's
+        `arcade.load_sound`) as if `texture()` / `sound()` had loaded it."""
+        self.misses += 1
+        if isinstance(asset, arcade.Sound):
+            self._sounds[path] = asset
+            return
+        cache = arcade.texture.default_texture_cache
+        cache.texture_cache.put(asset)
+        cache.image_data_cache.put(arcade.Texture.create_image_cache_name(str(asset.file_path)), asset.image_data)
+        self._textures[path] = asset
+
+    def preload(self, directory: str = TEXTURE_DIR, sounds: bool = True) -> int:
+        """Load every PNG (and sound) of *directory*; returns how many were new."""
+        before = len(self._textures) + len(self._sounds)
+        textures, sound_files = asset_files(directory, sounds)
+        for path in textures:
+            self.texture(path)
+        for path in sound_files:
+            self.sound(path)
+        return len(self._textures) + len(self._sounds) - before
+
+    def stats(self) -> AssetStats:
+        sound_bytes = 0
+        for sound in self._sounds.values():
+            fmt = sound.source.audio_format
+            if isinstance(sound.source, StaticSource) and fmt is not None:
+                sound_bytes += int(sound.get_length() * fmt.bytes_per_second)
+        return {
+            "textures": len(self._textures),
+            "sounds": len(self._sounds),
+            "hits": self.hits,
+            "misses": self.misses,
+            "texture_bytes": sum(t.image.width * t.image.height * 4 for t in self._textures.values()),
+            "sound_bytes": sound_bytes,
+        }
+
+    def clear(self) -> None:
+        self._textures.clear()
+        self._sounds.clear()
+        self.hits = self.misses = 0
+
+
+ASSETS = AssetRegistry()
+
+
+def asset_files(directory: str = TEXTURE_DIR, sounds: bool = True) -> Tuple[List[str], List[str]]:
+    """PNGs and sound files of *directory*, sorted."""
+    textures: List[str] = []
+    sound_files: List[str] = []
+    for file in sorted(Path(directory).iterdir()):
+        if file.suffix.lower() == ".png":
+            textures.append(file.as_posix())
+        elif sounds and file.suffix.lower() in SOUND_SUFFIXES:
+            sound_files.append(file.as_posix())
+    return textures, sound_files
+
+
+def decode_texture(path: str) -> arcade.Texture:
+    """Texture of *path*, built the way arcade's texture cache builds it
+    (RGBA image, default hit box) but without touching the cache or GL."""
+    real_path = arcade.resources.resolve(path)
+    texture = arcade.Texture(ImageData(PIL.Image.open(real_path).convert("RGBA")))
+    texture.file_path = real_path
+    return texture
+
+
 def get_texture_path(filename: str) -> arcade.Texture:
-    return arcade.load_texture(filename)
+    return ASSETS.texture(filename)
+
+
+def get_sound(filename: str) -> arcade.Sound:
+    return ASSETS.sound(filename)
 
 
 SWORD_TEXTURE= "assets/texturepack/base_sword.png"
@@ -12,6 +165,8 @@ ARROW_TEXTURE = "assets/texturepack/arrow.png"
 
 BACKGROUND_TEXTURE = "assets/texturepack/background2.png"
 
+GAME_OVER_SOUND = ":resources:sounds/gameover1.wav"
+
 BAT_TEXTURE = "assets/texturepack/bat.png"
 
 BOW_TEXTURE = "assets/texturepack/bow.png"
@@ -0,0 +1,127 @@
+"""arrow_batch.py – all live arrows integrated at once with NumPy.
+
+`Bow.Arrow.step` advances one arrow at a time: a new `arcade.Vec2` and a
+`math.atan2` per arrow per frame.  `ArrowBatch` keeps the state of every
+live arrow in parallel arrays (struct of arrays) and advances them in one
+vectorised step; sprites are only written back for the arrows the camera
+can see.  Arrows outside the view keep a stale sprite until they come back
+into it – `synced()` lists the arrows whose sprite is up to date, and only
+those should be used for sprite collisions.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List, Optional
+
+import arcade
+import numpy as np
+import numpy.typing as npt
+
+from src.map_builder.chunks import Rect
+from src.map_builder.tile_grid import EMPTY, HALF, TileGrid
+
+if TYPE_CHECKING:
+	from src.weapons.bow import Bow
+
+FloatArray = npt.NDArray[np.float64]
+
+ANGLE_OFFSET: float = 42.8      # same sprite orientation as Bow.Arrow.step
+LEFT_LIMIT: float = -100.0      # Bow.Arrow.death() rule
+
+
+class ArrowBatch:
+	"""Positions, velocities, lifetimes and angles of the live arrows."""
+
+	FIELDS = ("x", "y", "prev_x", "prev_y", "vx", "vy", "life", "angle")
+
+	def __init__(self, capacity: int = 64) -> None:
+		self.size = 0
+		self.arrows: "List[Bow.Arrow]" = []          # slot i ↔ arrows[i]
+		self._synced = np.zeros(capacity, dtype=bool)
+		self.x, self.y, self.prev_x, self.prev_y = (np.zeros(capacity) for _ in range(4))
+		self.vx, self.vy, self.life, self.angle = (np.zeros(capacity) for _ in range(4))
+
+	def __len__(self) -> int:
+		return self.size
+
+	# ------------------------------------------------------------------
+	def add(self, arrow: "Bow.Arrow") -> None:
+		"""Take *arrow*'s current sprite state into a new slot."""
+		if self.size == len(self.x):
+			self._grow(2 * len(self.x))
+		i = self.size
+		self.x[i], self.y[i] = arrow.center_x, arrow.center_y
+		self.prev_x[i], self.prev_y[i] = arrow.prev_x, arrow.prev_y
+		self.vx[i], self.vy[i] = arrow._vel.x, arrow._vel.y
+		self.life[i], self.angle[i] = arrow._life, arrow.angle
+		self._synced[i] = True
+		self.arrows.append(arrow)
+		self.size += 1
+
+	def keep(self, mask: npt.NDArray[np.bool_]) -> None:
+		"""Drop the slots where *mask* is False (order of the others kept)."""
+		n = self.size
+		kept = int(mask.sum())
+		if kept == n:
+			return
+		for name in self.FIELDS:
+			array: FloatArray = getattr(self, name)
+			array[:kept] = array[:n][mask]
+		self._synced[:kept] = self._synced[:n][mask]
+		self.arrows = [arrow for arrow, alive in zip(self.arrows, mask.tolist()) if alive]
+		self.size = kept
+
+	def step(self, dt: float, gravity: float) -> None:
+		"""Same integration as `Bow.Arrow.step`, for every slot at once."""
+		n = self.size
+		x, y, vx, vy = self.x[:n], self.y[:n], self.vx[:n], self.vy[:n]
+		self.prev_x[:n] = x
+		self.prev_y[:n] = y
+		x += vx * dt
+		y += vy * dt
+		vy -= gravity * dt
+		self.life[:n] -= dt
+		self.angle[:n] = -np.degrees(np.arctan2(vy, vx)) + ANGLE_OFFSET
+
+	def in_rect(self, rect: Rect) -> npt.NDArray[np.bool_]:
+		left, bottom, right, top = rect
+		x, y = self.x[:self.size], self.y[:self.size]
+		inside: npt.NDArray[np.bool_] = (x >= left) & (x <= right) & (y >= bottom) & (y <= top)
+		return inside
+
+	def in_solid(self, grid: TileGrid) -> npt.NDArray[np.bool_]:
+		"""Arrows whose position is inside a wall of *grid* (point test)."""
+		n = self.size
+		cols = np.floor(self.x[:n] / grid.tile).astype(np.intp)
+		rows = np.floor(self.y[:n] / grid.tile).astype(np.intp)
+		inside = (cols >= 0) & (cols < grid.width) & (rows >= 0) & (rows < grid.height)
+		kinds = np.full(n, EMPTY, dtype=np.uint8)
+		kinds[inside] = grid.cells[rows[inside], cols[inside]]
+		half_ok = self.y[:n] >= (rows + 0.5) * grid.tile
+		solid: npt.NDArray[np.bool_] = (kinds != EMPTY) & ((kinds != HALF) | half_ok)
+		return solid
+
+	def sync(self, mask: Optional[npt.NDArray[np.bool_]] = None) -> None:
+		"""Write the slots of *mask* (default: all) back to their sprites."""
+		n = self.size
+		self._synced[:n] = True if mask is None else mask
+		for i in np.flatnonzero(self._synced[:n]).tolist():
+			arrow = self.arrows[i]
+			arrow.prev_x, arrow.prev_y = float(self.prev_x[i]), float(self.prev_y[i])
+			arrow.position = float(self.x[i]), float(self.y[i])
+			arrow.angle = float(self.angle[i])
+			arrow._vel = arcade.Vec2(float(self.vx[i]), float(self.vy[i]))
+			arrow._life = float(self.life[i])
+
+	def synced(self) -> "List[Bow.Arrow]":
+		return [arrow for arrow, ok in zip(self.arrows, self._synced[:self.size].tolist()) if ok]
+
+	# ------------------------------------------------------------------
+	def _grow(self, capacity: int) -> None:
+		for name in self.FIELDS:
+			old: FloatArray = getattr(self, name)
+			new = np.zeros(capacity)
+			new[:len(old)] = old
+			setattr(self, name, new)
+		synced = np.zeros(capacity, dtype=bool)
+		synced[:len(self._synced)] = self._synced
+		self._synced = synced
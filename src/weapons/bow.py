@@ -21,6 +21,7 @@ import arcade
 from src.game.objects import Object
 from src.game.player import Player
 from src.weapons.weapon import Weapon
+from src.weapons.projectiles import ProjectileManager
 from src.texture_manager import BOW_TEXTURE, ARROW_TEXTURE
 
 # ---------------------------------------------------------------------------
@@ -28,7 +29,7 @@ from src.texture_manager import BOW_TEXTURE, ARROW_TEXTURE
 # ---------------------------------------------------------------------------
 ARROW_SPEED    = 900.0   # px / s
 ARROW_GRAVITY  = 900 # px / s², downward
-ARROW_LIFETIME = 6.0     # seconds before auto‑destroy
+ARROW_LIFETIME = 6.0     # seconds before auto‑destroy (enforced by death())
 ARROW_COOLDOWN = 0.1    # seconds between shots
 ARROW_SCALE    = 0.30
 
@@ -49,12 +50,20 @@ class Bow(Weapon):
 	class Arrow(Object):
 		def __init__(self, start: Tuple[float, float], direction: arcade.Vec2, angle: float) -> None:
 				super().__init__(texture=ARROW_TEXTURE, scale=ARROW_SCALE, pos=start, health=1)
+				self._aim_vec: arcade.Vec2 = arcade.Vec2(1, 0)
+				self.launch(start, direction, angle)
+
+		def launch(self, start: Tuple[float, float], direction: arcade.Vec2, angle: float) -> None:
+				"""(Re)fire from *start* – also used for arrows taken from the pool."""
+				self.position = start
 				self._vel: arcade.Vec2 = direction.normalize() * ARROW_SPEED
 				self.angle = angle
 				self._life = ARROW_LIFETIME
-				self._aim_vec: arcade.Vec2 = arcade.Vec2(1, 0)
+				# position before the last step: start of the swept segment
+				self.prev_x, self.prev_y = start
 
 		def step(self, dt: float,camera:arcade.Camera2D) -> None:
+				self.prev_x, self.prev_y = self.center_x, self.center_y
 				self.center_x += self._vel.x * dt
 				self.center_y += self._vel.y * dt
 				self._vel = arcade.Vec2(self._vel.x, self._vel.y - ARROW_GRAVITY * dt)
@@ -66,7 +75,7 @@ class Bow(Weapon):
 				self.angle = -math.degrees(math.atan2(vy,vx)) +42.8
 	
 		def death(self)-> None:
-			if self.center_x<-100:
+			if self.center_x<-100 or self._life <= 0:
 				self.remove_from_sprite_lists()
 
 
@@ -86,6 +95,11 @@ class Bow(Weapon):
 		#self._wall_list = arcade.SpriteList()
 		self._cooldown = 0.0
 		self.arrows: arcade.SpriteList[Bow.Arrow] = arcade.SpriteList(use_spatial_hash=True)
+		self.projectiles = ProjectileManager(self.arrows, Bow.Arrow, gravity=ARROW_GRAVITY)
+
+	def set_player(self, player: Player) -> None:
+		"""Follow another player sprite (the bow is kept across levels)."""
+		self._player = player
 
 	# .................................................................
 	#  Mouse events
@@ -112,8 +126,7 @@ class Bow(Weapon):
 					self._cooldown = max(0.0, self._cooldown - dt)
 			
 
-			for arrow in list(self.arrows):
-					arrow.step(dt,camera=camera)
+			self.projectiles.update(dt, camera)
 
 	# .................................................................
 	#  Helpers
@@ -129,8 +142,7 @@ class Bow(Weapon):
 				dir_vec = arcade.Vec2(1, 0)
 
 		start_pos = (self.center_x, self.center_y)
-		arrow = Bow.Arrow(start_pos, dir_vec, self.angle)
-		self.arrows.append(arrow)
+		self.projectiles.spawn(start_pos, dir_vec, self.angle)
 
 
 	def ready(self) -> bool:
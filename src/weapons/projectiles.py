@@ -0,0 +1,191 @@
+"""projectiles.py – live arrows of a bow, and a pool of spent ones.
+
+An arrow used to live until it happened to fly off the *left* of the map:
+arrows falling through the floor or shot to the right were stepped and
+collision-checked forever.  `ProjectileManager` owns every arrow of a bow:
+
+* arrows are culled when their lifetime runs out, when they leave the
+  level bounds (sides and bottom – gravity brings them back from the top)
+  or when they are further than `cull_distance` from the camera;
+* culled arrows – and arrows removed elsewhere, e.g. on a hit – go back
+  to a free list and are relaunched by the next shot instead of building
+  a new sprite (and its health bar).
+
+The live arrows stay in the bow's `arrows` SpriteList, as before.  With
+``batched`` set, they are stepped together by an `ArrowBatch` (NumPy)
+instead of one `Arrow.step` call each; only the arrows near the camera get
+their sprite updated, see `synced()`.
+"""
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING, Callable, List, Optional, Tuple
+
+import arcade
+import numpy as np
+
+from src.constants_proj import TILESIZE
+from src.map_builder.chunks import camera_rect
+from src.map_builder.tile_grid import TileGrid
+from src.weapons.arrow_batch import LEFT_LIMIT, ArrowBatch
+
+if TYPE_CHECKING:   # bow.py imports this module
+	from src.weapons.bow import Bow
+
+Bounds = Tuple[float, float, float, float]   # left, bottom, right, top (world px)
+
+CULL_DISTANCE: float = 2 * 1280   # px from the camera centre
+BOUNDS_MARGIN: float = TILESIZE
+
+
+class ProjectileManager:
+	"""Spawns, steps, culls and recycles the arrows of one bow."""
+
+	def __init__(
+		self,
+		arrows: "arcade.SpriteList[Bow.Arrow]",
+		factory: "Callable[[Tuple[float, float], arcade.Vec2, float], Bow.Arrow]",
+		bounds: Optional[Bounds] = None,
+		cull_distance: float = CULL_DISTANCE,
+		gravity: float = 0.0,
+	) -> None:
+		self.arrows = arrows
+		self._factory = factory
+		self.bounds = bounds              # set by GameView once the level is known
+		self.cull_distance = cull_distance
+		self.gravity = gravity            # batched stepping only (Arrow.step has its own)
+		self.grid: Optional[TileGrid] = None   # walls for the arrows nobody sees
+		self._owned: "List[Bow.Arrow]" = []
+		self._free: "List[Bow.Arrow]" = []
+		self._batch: Optional[ArrowBatch] = None
+
+	# ------------------------------------------------------------------
+	@property
+	def live_count(self) -> int:
+		return len(self.arrows)
+
+	@property
+	def pooled_count(self) -> int:
+		return len(self._free)
+
+	@property
+	def batched(self) -> bool:
+		return self._batch is not None
+
+	@batched.setter
+	def batched(self, enabled: bool) -> None:
+		if enabled == self.batched:
+			return
+		if not enabled:
+			assert self._batch is not None
+			self._batch.sync()                # every sprite up to date again
+			self._batch = None
+			return
+		self._batch = ArrowBatch()
+		for arrow in self.arrows:
+			self._batch.add(arrow)
+
+	def synced(self) -> "List[Bow.Arrow]":
+		"""Live arrows whose sprite matches the last step (collision checks)."""
+		if self._batch is None:
+			return list(self.arrows)
+		return [arrow for arrow in self._batch.synced() if arrow.sprite_lists]
+
+	# ------------------------------------------------------------------
+	def spawn(self, start: Tuple[float, float], direction: arcade.Vec2, angle: float) -> "Bow.Arrow":
+		"""Launch an arrow, reusing a spent one when there is any."""
+		self._collect_strays()
+		self._drop_stale_slots()
+		if self._free:
+			arrow = self._free.pop()
+			arrow.launch(start, direction, angle)
+		else:
+			arrow = self._factory(start, direction, angle)
+			self._owned.append(arrow)
+		self.arrows.append(arrow)
+		if self._batch is not None:
+			self._batch.add(arrow)
+		return arrow
+
+	def update(self, dt: float, camera: arcade.Camera2D) -> None:
+		"""Step every live arrow, then cull the ones that are done."""
+		if self._batch is not None:
+			self._update_batch(self._batch, dt, camera)
+			return
+		cam_x, cam_y = camera.position
+		for arrow in list(self.arrows):
+			arrow.step(dt, camera=camera)
+			if arrow.sprite_lists and (
+				self._out_of_bounds(arrow)
+				or math.hypot(arrow.center_x - cam_x, arrow.center_y - cam_y) > self.cull_distance
+			):
+				arrow.remove_from_sprite_lists()
+		self._collect_strays()
+
+	def release(self, arrow: "Bow.Arrow") -> None:
+		"""Take *arrow* out of play (hit something) and keep it for reuse."""
+		if arrow.sprite_lists:
+			arrow.remove_from_sprite_lists()
+		self._collect_strays()
+
+	def clear(self) -> None:
+		"""Every live arrow back to the pool (respawn, new level)."""
+		self.arrows.clear()
+		self._collect_strays()
+
+	# ------------------------------------------------------------------
+	def _update_batch(self, batch: ArrowBatch, dt: float, camera: arcade.Camera2D) -> None:
+		"""`update` with one vectorised step; same culling rules."""
+		self._drop_stale_slots()
+		n = len(batch)
+		if not n:
+			return
+		batch.step(dt, self.gravity)
+		x, y = batch.x[:n], batch.y[:n]
+		cam_x, cam_y = camera.position
+		done = (batch.life[:n] <= 0) | (x < LEFT_LIMIT)
+		done |= np.hypot(x - cam_x, y - cam_y) > self.cull_distance
+		if self.bounds is not None:
+			left, bottom, right, _ = self.bounds
+			done |= (x < left - BOUNDS_MARGIN) | (x > right + BOUNDS_MARGIN) | (y < bottom - BOUNDS_MARGIN)
+
+		left, bottom, right, top = camera_rect(camera)
+		m = BOUNDS_MARGIN
+		visible = batch.in_rect((left - m, bottom - m, right + m, top + m))
+		if self.grid is not None:
+			# the sprite checks of GameView only see synced arrows: walls
+			# stop the others here (point test, good enough off screen)
+			done |= ~visible & batch.in_solid(self.grid)
+
+		batch.sync(visible & ~done)
+		for i in np.flatnonzero(done).tolist():
+			batch.arrows[i].remove_from_sprite_lists()
+		batch.keep(~done)
+		self._collect_strays()
+
+	def _drop_stale_slots(self) -> None:
+		"""Forget batch slots of arrows removed since (hit, cleared)."""
+		batch = self._batch
+		if batch is None or len(batch) == len(self.arrows):
+			return
+		alive = np.fromiter((bool(arrow.sprite_lists) for arrow in batch.arrows), dtype=bool, count=len(batch))
+		batch.keep(alive)
+
+	def _out_of_bounds(self, arrow: "Bow.Arrow") -> bool:
+		if self.bounds is None:
+			return False
+		left, bottom, right, _ = self.bounds
+		return (
+			arrow.center_x < left - BOUNDS_MARGIN
+			or arrow.center_x > right + BOUNDS_MARGIN
+			or arrow.center_y < bottom - BOUNDS_MARGIN
+		)
+
+	def _collect_strays(self) -> None:
+		"""Pool the arrows that left the arrow list (culled, hit, cleared)."""
+		if len(self.arrows) + len(self._free) == len(self._owned):
+			return
+		free = set(map(id, self._free))
+		for arrow in self._owned:
+			if not arrow.sprite_lists and id(arrow) not in free:
+				self._free.append(arrow)
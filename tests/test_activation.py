@@ -0,0 +1,43 @@
+# tests/test_activation.py
+from __future__ import annotations
+
+import arcade
+
+from src.constants_proj import TILESIZE
+from src.entities.base_entity import Enemy
+from src.entities.blob import Blob
+from src.game.activation import ActivationRegions
+
+VIEW = (0.0, 0.0, 1280.0, 720.0)
+
+
+def monsters_at(*xs: float) -> arcade.SpriteList[Enemy]:
+    monsters: arcade.SpriteList[Enemy] = arcade.SpriteList(use_spatial_hash=True)
+    for x in xs:
+        monsters.append(Blob((x, 360)))
+    return monsters
+
+
+def test_monsters_sorted_by_distance_to_view(window: arcade.Window) -> None:
+    monsters = monsters_at(640, 1280 + 2 * TILESIZE, 1280 + 8 * TILESIZE, 1280 + 40 * TILESIZE)
+    near, edge, mid, far = monsters
+    regions = ActivationRegions(active_margin=4 * TILESIZE, lazy_margin=12 * TILESIZE, lazy_interval=1)
+    active, lazy = regions.select(monsters, VIEW)
+    assert set(active) == {near, edge}
+    assert lazy == [mid]
+    assert far not in active + lazy
+
+
+def test_lazy_band_ticks_every_interval(window: arcade.Window) -> None:
+    monsters = monsters_at(1280 + 8 * TILESIZE)
+    regions = ActivationRegions(lazy_interval=4)
+    ticks = sum(len(regions.select(monsters, VIEW)[1]) for _ in range(12))
+    assert ticks == 3
+
+
+def test_without_spatial_hash_every_monster_is_checked(window: arcade.Window) -> None:
+    monsters: arcade.SpriteList[Enemy] = arcade.SpriteList()
+    monsters.append(Blob((640, 360)))
+    monsters.append(Blob((99_999, 360)))
+    active, lazy = ActivationRegions().select(monsters, VIEW)
+    assert active == [monsters[0]] and lazy == []
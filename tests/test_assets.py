@@ -0,0 +1,60 @@
+# tests/test_assets.py
+from __future__ import annotations
+
+from pathlib import Path
+
+import arcade
+import pytest
+
+from src import texture_manager, textures
+from src.map_builder import level_builder
+from src.map_builder.level_builder import LevelBuilder
+from src.map_builder.switch import Switch
+from src.texture_manager import (
+    ASSETS,
+    LEVER_OFF_TEXTURE,
+    LEVER_ON_TEXTURE,
+    TEXTURE_DIR,
+    AssetRegistry,
+)
+
+
+def test_texture_loaded_once_and_shared_with_sprites(window: arcade.Window) -> None:
+    assets = AssetRegistry()
+    first = assets.texture(LEVER_ON_TEXTURE)
+    assert assets.texture(LEVER_ON_TEXTURE) is first
+    assert arcade.Sprite(LEVER_ON_TEXTURE).texture is first
+    assert (assets.hits, assets.misses) == (1, 1)
+
+
+def test_switches_share_lever_textures(window: arcade.Window) -> None:
+    a, b = Switch((0, 0)), Switch((64, 0))
+    assert a.textures[0] is b.textures[0] is ASSETS.texture(LEVER_OFF_TEXTURE)
+    assert a.textures[1] is b.textures[1] is ASSETS.texture(LEVER_ON_TEXTURE)
+
+
+def test_preload_warms_every_png_and_reports_memory(window: arcade.Window) -> None:
+    assets = AssetRegistry()
+    pngs = list(Path(TEXTURE_DIR).glob("*.png"))
+    assert assets.preload() == len(pngs)
+    assert assets.preload() == 0
+    stats = assets.stats()
+    assert stats["textures"] == len(pngs) and stats["misses"] == len(pngs)
+    assert stats["texture_bytes"] > 0
+
+
+def test_static_tiles_take_their_texture_from_the_registry(window: arcade.Window, monkeypatch: pytest.MonkeyPatch) -> None:
+    assets = AssetRegistry()
+    monkeypatch.setattr(level_builder, "ASSETS", assets)
+    level = LevelBuilder(use_cache=False).build_level("assets/maps/1.txt")
+    assert all(assets.has(textures.TEXTURES[glyph]) for glyph in "=*£")
+    assert level["walls"][0].texture in {assets.texture(textures.TEXTURES[glyph]) for glyph in "-=x"}
+
+
+def test_star_import_hands_out_paths_and_lookups_only() -> None:
+    names: dict[str, object] = {}
+    exec("from src.texture_manager import *", names)
+    exported = set(names) - {"__builtins__"}
+    assert exported == set(texture_manager.__all__)
+    assert {name for name in vars(texture_manager) if name.endswith(("_TEXTURE", "_SOUND"))} <= exported
+    assert not exported & {"ASSETS", "AssetRegistry", "decode_texture", "asset_files", "arcade", "Path"}
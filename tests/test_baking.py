@@ -0,0 +1,46 @@
+# tests/test_baking.py
+from __future__ import annotations
+
+import arcade
+
+from src.constants_proj import TILESIZE
+from src.game.baking import BakedBackdrop
+from src.game.culling import ChunkedLayer
+
+VIEW = (0.0, 0.0, 1000.0, 500.0)             # chunks (0, 0) and (1, 0) of 512 px
+
+
+def walls_at(*xs: float) -> arcade.SpriteList[arcade.Sprite]:
+    walls: arcade.SpriteList[arcade.Sprite] = arcade.SpriteList()
+    for x in xs:
+        walls.append(arcade.SpriteSolidColor(TILESIZE, TILESIZE, center_x=x, center_y=TILESIZE / 2))
+    return walls
+
+
+def test_chunks_baked_once_then_drawn_as_quads(window: arcade.Window) -> None:
+    walls = walls_at(32, 96, 600)
+    backdrop = BakedBackdrop([ChunkedLayer(walls, 8)], chunk_tiles=8, slots=4)
+    backdrop.draw(VIEW)
+    backdrop.draw(VIEW)
+    assert backdrop.bakes == 2 and len(backdrop.quads) == 2
+
+
+def test_chunk_rebaked_when_its_content_changes(window: arcade.Window) -> None:
+    walls = walls_at(32, 600)
+    gate = arcade.SpriteSolidColor(TILESIZE, TILESIZE, center_x=160, center_y=TILESIZE / 2)
+    backdrop = BakedBackdrop([ChunkedLayer(walls, 8)], chunk_tiles=8, slots=4)
+    backdrop.draw(VIEW)
+    walls.append(gate)                       # a gate closes
+    backdrop.draw(VIEW)
+    assert backdrop.bakes == 3
+    gate.remove_from_sprite_lists()          # … and opens again
+    backdrop.draw(VIEW)
+    assert backdrop.bakes == 4
+
+
+def test_slots_are_reused_for_new_chunks(window: arcade.Window) -> None:
+    walls = walls_at(*(512.0 * i + 32 for i in range(6)))
+    backdrop = BakedBackdrop([ChunkedLayer(walls, 8)], chunk_tiles=8, slots=2)
+    for i in range(6):
+        backdrop.draw((512.0 * i + 10, 0.0, 512.0 * i + 100, 100.0))
+    assert backdrop.bakes == 6 and len(backdrop.quads) == 2
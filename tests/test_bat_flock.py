@@ -0,0 +1,77 @@
+# tests/test_bat_flock.py
+from __future__ import annotations
+
+import math
+import random
+from statistics import mean
+
+import arcade
+import pytest
+
+from src.entities.bat import Bat
+from src.entities.bat_flock import BatFlock
+
+SPAWNS = [(200.0 * (i % 20), 200.0 * (i // 20)) for i in range(200)]
+
+
+def spread(bats: list[Bat]) -> float:
+    """Mean distance of the bats to their spawn point."""
+    return mean(math.hypot(b.center_x - sx, b.center_y - sy) for b, (sx, sy) in zip(bats, SPAWNS))
+
+
+def test_step_moves_towards_target_like_bat_step(window: arcade.Window) -> None:
+    reference, batched = Bat((0, 0), speed=2), Bat((0, 0), speed=2)
+    for bat in (reference, batched):
+        bat._target_x, bat._target_y = 30.0, 40.0
+    flock = BatFlock([batched], seed=1)
+    for _ in range(10):
+        reference.step(1 / 60)
+        flock.step()
+    assert batched.position == pytest.approx(reference.position)
+
+
+def test_same_seed_same_flight(window: arcade.Window) -> None:
+    runs = []
+    for _ in range(2):
+        random.seed(3)
+        bats = [Bat(pos) for pos in SPAWNS[:20]]
+        flock = BatFlock(bats, seed=42)
+        for _ in range(300):
+            flock.step()
+        runs.append([b.position for b in bats])
+    assert runs[0] == runs[1]
+
+
+def test_flock_motion_statistically_matches_bat_step(window: arcade.Window) -> None:
+    random.seed(0)
+    reference = [Bat(pos) for pos in SPAWNS]
+    batched = [Bat(pos) for pos in SPAWNS]
+    flock = BatFlock(batched, seed=0)
+    spreads_ref, spreads_flock = [], []
+    for frame in range(400):
+        for bat in reference:
+            bat.step(1 / 60)
+        flock.step()
+        if frame >= 100 and frame % 20 == 0:
+            spreads_ref.append(spread(reference))
+            spreads_flock.append(spread(batched))
+    # targets are drawn with r ~ U(0, radius): mean distance well inside the circle
+    assert mean(spreads_flock) == pytest.approx(mean(spreads_ref), rel=0.1)
+    assert max(spread(batched), spread(reference)) < 150
+
+
+def test_step_only_moves_the_given_bats(window: arcade.Window) -> None:
+    reference = Bat((0, 0), speed=2)
+    bats = [Bat((0, 0), speed=2) for _ in range(3)]
+    for bat in (reference, *bats):
+        bat._target_x, bat._target_y = 30.0, 40.0
+    flock = BatFlock(bats, seed=1)
+    idx = flock.indices([bats[1], arcade.Sprite(), bats[2]])
+    assert idx.tolist() == [1, 2]
+    for _ in range(10):
+        reference.step(1 / 60)
+        flock.step(idx)
+    assert bats[0].position == (0, 0) and flock.x[0] == 0.0
+    for bat in bats[1:]:
+        assert bat.position == pytest.approx(reference.position)
+    assert flock.x[1:].tolist() == pytest.approx([reference.center_x] * 2)
@@ -0,0 +1,54 @@
+# tests/test_blob.py
+from __future__ import annotations
+
+import arcade
+
+from src import helper
+from src.constants_proj import TILESIZE
+from src.entities.blob import Blob
+from src.map_builder.tile_grid import TileGrid
+
+ROWS = [
+    "          ",
+    "  o   x   ",
+    " ======== ",
+]
+
+
+def walls_of(rows: list[str]) -> arcade.SpriteList[arcade.Sprite]:
+    walls: arcade.SpriteList[arcade.Sprite] = arcade.SpriteList(use_spatial_hash=True)
+    for row, line in enumerate(reversed(rows)):
+        for col, glyph in enumerate(line):
+            if glyph in "=x":
+                walls.append(arcade.SpriteSolidColor(TILESIZE, TILESIZE,
+                                                     *helper.grid_to_world(col, row)))
+    return walls
+
+
+def patrol(blob: Blob, frames: int) -> tuple[float, float]:
+    xs = []
+    for _ in range(frames):
+        blob.update(1 / 60)
+        xs.append(blob.center_x)
+    return min(xs), max(xs)
+
+
+def test_blob_on_grid_patrols_between_ledge_and_wall(window: arcade.Window) -> None:
+    grid = TileGrid.from_rows(ROWS)
+    blob = Blob(helper.grid_to_world(2, 1), speed=4)
+    blob.set_environment(walls_of(ROWS), grid)
+    low, high = patrol(blob, 600)
+    half = (blob.right - blob.left) / 2
+    assert low - half >= TILESIZE                      # ledge: floor starts at col 1
+    assert high + half <= 6 * TILESIZE                 # wall at col 6
+    assert high - low > 3 * TILESIZE                   # it did walk both ways
+
+
+def test_grid_and_sprite_queries_agree(window: arcade.Window) -> None:
+    walls = walls_of(ROWS)
+    on_sprites = Blob(helper.grid_to_world(2, 1), speed=4)
+    on_sprites.set_environment(walls)
+    on_grid = Blob(helper.grid_to_world(2, 1), speed=4)
+    on_grid.set_environment(walls, TileGrid.from_rows(ROWS))
+    a, b = patrol(on_sprites, 600), patrol(on_grid, 600)
+    assert abs(a[0] - b[0]) <= TILESIZE / 2 and abs(a[1] - b[1]) <= TILESIZE / 2
@@ -0,0 +1,68 @@
+# tests/test_blob_patrol.py
+from __future__ import annotations
+
+import arcade
+
+from src import helper
+from src.entities.blob import Blob
+from src.entities.blob_patrol import BlobPatrol
+from src.map_builder.tile_grid import TileGrid
+
+ROWS = [
+    "                    ",
+    "  o  o  x   o o   o ",
+    " ========  ======== ",
+    "                    ",
+    " o    o      o      ",
+    "===========  ====== ",
+]
+
+
+def spawns(rows: list[str]) -> list[tuple[float, float]]:
+    return [helper.grid_to_world(col, row)
+            for row, line in enumerate(reversed(rows))
+            for col, glyph in enumerate(line) if glyph == "o"]
+
+
+def blobs_on(grid: TileGrid, speed: int = 3) -> list[Blob]:
+    blobs = [Blob(pos, speed=speed) for pos in spawns(ROWS)]
+    for blob in blobs:
+        blob.set_environment(arcade.SpriteList(), grid)
+    return blobs
+
+
+def state(blobs: list[Blob]) -> list[tuple[float, float, int, float]]:
+    return [(b.center_x, b.center_y, b._direction, b.scale_x) for b in blobs]
+
+
+def test_patrol_walks_exactly_like_blob_step(window: arcade.Window) -> None:
+    grid = TileGrid.from_rows(ROWS)
+    reference, batched = blobs_on(grid), blobs_on(grid)
+    patrol = BlobPatrol(batched)
+    for frame in range(400):
+        if frame == 150:                                # a gate closes on the lower floor
+            grid.set_solid(9, 1, True)
+        for blob in reference:
+            blob.step(1 / 60)
+        patrol.step()
+        assert state(batched) == state(reference), frame
+    assert len({b._direction for b in batched}) == 2     # some did turn around
+
+
+def test_step_only_moves_the_given_blobs(window: arcade.Window) -> None:
+    blobs = blobs_on(TileGrid.from_rows(ROWS))
+    patrol = BlobPatrol(blobs)
+    idx = patrol.indices([blobs[1], arcade.Sprite(), blobs[3]])
+    assert idx.tolist() == [1, 3]
+    before = state(blobs)
+    for _ in range(5):
+        patrol.step(idx)
+    after = state(blobs)
+    assert [i for i, (a, b) in enumerate(zip(before, after)) if a != b] == [1, 3]
+
+
+def test_blobs_without_a_grid_are_left_out(window: arcade.Window) -> None:
+    on_grid = blobs_on(TileGrid.from_rows(ROWS))[:2]
+    loose = Blob((0.0, 0.0))
+    patrol = BlobPatrol([*on_grid, loose])
+    assert len(patrol) == 2 and loose not in patrol and on_grid[0] in patrol
@@ -0,0 +1,100 @@
+# tests/test_culling.py
+from __future__ import annotations
+
+import arcade
+
+from src.constants_proj import TILESIZE
+from src.game.culling import ChunkedLayer, InView, visible_sprites
+from src.map_builder.chunks import CHUNK_TILES
+from src.map_builder.tracked_list import TrackedSpriteList
+
+SPAN = CHUNK_TILES * TILESIZE
+VIEW = (0.0, 0.0, 1280.0, 720.0)
+
+
+def tiles(*xs: float, tracked: bool = False) -> arcade.SpriteList[arcade.Sprite]:
+    kind = TrackedSpriteList if tracked else arcade.SpriteList
+    sprites: arcade.SpriteList[arcade.Sprite] = kind(use_spatial_hash=True)
+    for x in xs:
+        sprites.append(arcade.SpriteSolidColor(TILESIZE, TILESIZE, center_x=x, center_y=TILESIZE / 2))
+    return sprites
+
+
+def test_only_chunks_in_view_are_drawn(window: arcade.Window) -> None:
+    walls = tiles(100, SPAN + 100, 10 * SPAN, 20 * SPAN)
+    layer = ChunkedLayer(walls)
+    assert layer.draw(VIEW) == 2                   # chunks 0 and 1, not 10 / 20
+    assert len(layer) == 4
+
+
+def test_layer_follows_removed_and_restored_sprites(window: arcade.Window) -> None:
+    coins = tiles(100, 200, 10 * SPAN)
+    layer = ChunkedLayer(coins)
+    layer.refresh()
+    picked = coins[0]
+    picked.remove_from_sprite_lists()
+    assert len(layer) == 2
+    coins.append(picked)                            # respawn
+    layer.refresh()
+    assert len(layer) == 3
+    assert sum(len(lst) for lst in layer.in_view(VIEW)) == 2
+
+
+def test_visible_sprites_uses_view_bounds(window: arcade.Window) -> None:
+    sprites = tiles(-TILESIZE, 640, 1280 + TILESIZE / 4, 5000)
+    assert sorted(s.center_x for s in visible_sprites(sprites, VIEW)) == [640, 1280 + TILESIZE / 4]
+
+
+def test_sprites_taken_out_of_the_source_alone_leave_their_chunk(window: arcade.Window) -> None:
+    walls = tiles(100, 200, 10 * SPAN)
+    layer = ChunkedLayer(walls)
+    layer.refresh()
+    far = layer.chunks[(10, 0)]
+    gate, wall = walls[0], walls[1]
+    walls.remove(gate)                              # an opening gate: not removed from the chunk
+    layer.follow(gate)
+    assert len(layer) == 2 and gate not in layer.chunks[(0, 0)]
+    walls.append(gate)
+    layer.follow(gate)
+    assert len(layer) == 3 and gate in layer.chunks[(0, 0)]
+    walls.remove(wall)                              # nobody told: the next refresh catches up
+    layer.refresh()
+    assert len(layer) == 2 and layer.chunks[(10, 0)] is far and len(far) == 1
+
+
+def test_remove_and_add_in_the_same_frame_is_seen(window: arcade.Window) -> None:
+    coins = tiles(100, 200, tracked=True)
+    layer = ChunkedLayer(coins)
+    layer.refresh()
+    gone, new = coins[0], tiles(10 * SPAN)[0]
+    coins.remove(gone)                              # the count stays at 2
+    coins.append(new)
+    layer.draw(VIEW)
+    assert gone not in layer.chunks[(0, 0)] and new in layer.chunks[(10, 0)]
+    assert len(layer) == 2
+
+
+def test_followed_change_leaves_nothing_to_catch_up(window: arcade.Window) -> None:
+    walls = tiles(100, 200, tracked=True)
+    layer = ChunkedLayer(walls)
+    layer.refresh()
+    gate = walls[0]
+    walls.remove(gate)
+    layer.follow(gate)
+    assert layer._seen == walls.version             # type: ignore[attr-defined]
+    walls.remove(walls[0])                          # not followed
+    layer.follow(gate)
+    assert layer._seen != walls.version             # type: ignore[attr-defined]
+    layer.refresh()
+    assert len(layer) == 0
+
+
+def test_in_view_holds_the_visible_sprites(window: arcade.Window) -> None:
+    bats = tiles(100, 640, 5000)
+    shown: InView[arcade.Sprite] = InView()
+    shown.update(visible_sprites(bats, VIEW))
+    assert sorted(s.center_x for s in shown.sprites) == [100, 640]
+    bats[0].center_x, bats[2].center_x = 6000, 300  # one leaves the view, one comes in
+    bats[1].remove_from_sprite_lists()              # one is killed
+    shown.update(visible_sprites(bats, VIEW))
+    assert [s.center_x for s in shown.sprites] == [300]
@@ -0,0 +1,74 @@
+# tests/test_entity_store.py
+from __future__ import annotations
+
+import gc
+
+import arcade
+import numpy as np
+
+from src.entities.blob import Blob
+from src.game.entity_store import EntityStore
+from src.game.level_state import LevelSnapshot
+from src.game.objects import Object
+
+
+def test_store_clamps_and_reports_deaths() -> None:
+    store = EntityStore(capacity=2)
+    ids = np.array([store.alloc(30), store.alloc(10), store.alloc(50)])   # grows
+    dead = store.add_health(ids, -20)
+    assert dead.tolist() == [ids[1]]
+    assert store.health[ids].tolist() == [10, 0, 30]
+    assert store.add_health(ids, +100).size == 0
+    assert store.health[ids].tolist() == [30, 10, 50]
+
+
+def test_damage_spares_invincible_rows() -> None:
+    store = EntityStore()
+    ids = np.array([store.alloc(10), store.alloc(10), store.alloc(10)])
+    store.invincible[ids[0]] = True
+    store.timer[ids[1]] = 0.3                      # only the timer still running
+    store.damage(ids, 4)
+    assert store.health[ids].tolist() == [10, 10, 6]
+    store.timer[ids[1]] = 0.0
+    assert store.damage(ids, 6).tolist() == [ids[2]]
+    assert store.health[ids].tolist() == [10, 4, 0]
+
+
+def test_objects_are_views_on_their_row(window: arcade.Window) -> None:
+    blobs = [Blob((64.0 * i, 0.0)) for i in range(3)]
+    blobs[0].invincible = True
+    Object.add_health_all(blobs, -1)
+    assert [b.current_health for b in blobs] == [b.max_health - 1 for b in blobs]
+    blobs[1].current_health = 10 ** 6
+    assert blobs[1].current_health == blobs[1].max_health
+    assert blobs[0].invincible and not blobs[1].invincible
+
+
+def test_batch_damage_and_dead_sweep(window: arcade.Window) -> None:
+    blobs = [Blob((64.0 * i, 0.0)) for i in range(3)]
+    blobs[0].invincible = True
+    blobs[2].current_health = 5
+    assert Object.damage_all(blobs, 5) == [blobs[2]]
+    assert [b.current_health for b in blobs] == [blobs[0].max_health, blobs[1].max_health - 5, 0]
+    assert Object.dead_among(blobs) == [blobs[2]]
+    assert Object.damage_all([], 5) == [] and Object.dead_among([]) == []
+
+
+def test_snapshot_restores_store_rows(window: arcade.Window) -> None:
+    monsters: arcade.SpriteList[Blob] = arcade.SpriteList()
+    monsters.extend(Blob((64.0 * i, 0.0)) for i in range(2))
+    snapshot = LevelSnapshot(members=[monsters])
+    Object.add_health_all(monsters, -10 ** 6)
+    monsters[0].invincible = True
+    snapshot.restore()
+    assert all(m.current_health == m.max_health and not m.invincible for m in monsters)
+
+
+def test_rows_are_recycled(window: arcade.Window) -> None:
+    store = Object.store
+    eid = Blob((0.0, 0.0))._eid
+    gc.collect()
+    assert eid in store._free
+    size = store.size
+    Blob((0.0, 0.0))
+    assert store.size == size          # reused a free row
@@ -0,0 +1,58 @@
+# tests/test_gate_solidity.py
+from __future__ import annotations
+
+import arcade
+
+from src.constants_proj import TILESIZE
+from src.map_builder.gate_solidity import GateSolidity
+from src.map_builder.switch import Gate, Switch
+from src.map_builder.tile_grid import FULL, TileGrid
+
+
+def make_level(state: str = "closed") -> tuple[Gate, arcade.SpriteList[Gate], TileGrid, GateSolidity]:
+    gate = Gate((1.5 * TILESIZE, 0.5 * TILESIZE), state=state)
+    walls: arcade.SpriteList[Gate] = arcade.SpriteList()
+    grid = TileGrid.from_rows(["   "])
+    solidity = GateSolidity(walls, grid)
+    solidity.bind([gate])
+    return gate, walls, grid, solidity
+
+
+def test_bind_applies_current_state(window: arcade.Window) -> None:
+    gate, walls, grid, _ = make_level("closed")
+    assert gate in walls and grid.kind(1, 0) == FULL
+
+
+def test_toggle_updates_walls_and_grid(window: arcade.Window) -> None:
+    gate, walls, grid, _ = make_level("closed")
+    Switch((0, 0), {"state": "off"}, [gate]).trigger()
+    assert gate not in walls and not grid.solid_at(gate.center_x, gate.center_y)
+    gate.toggle()
+    assert gate in walls and grid.solid_at(gate.center_x, gate.center_y)
+
+
+def test_only_state_changes_are_published(window: arcade.Window) -> None:
+    gate, _, _, _ = make_level("closed")
+    seen: list[Gate] = []
+    gate.listeners.append(seen.append)
+    gate.set_state(closed=True)
+    gate.set_state(closed=False)
+    gate.set_state(closed=False)
+    assert seen == [gate]
+
+
+def test_unbind_stops_listening(window: arcade.Window) -> None:
+    gate, walls, _, solidity = make_level("closed")
+    solidity.unbind()
+    gate.toggle()
+    assert gate.listeners == [] and gate in walls
+
+
+def test_listeners_hear_of_wall_changes_only(window: arcade.Window) -> None:
+    gate, walls, _, solidity = make_level("closed")
+    seen: list[Gate] = []
+    solidity.listeners.append(seen.append)
+    solidity.refresh()                              # nothing to change
+    gate.toggle()
+    gate.toggle()
+    assert seen == [gate, gate] and gate in walls
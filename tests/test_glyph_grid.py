@@ -0,0 +1,96 @@
+# tests/test_glyph_grid.py
+from __future__ import annotations
+
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Set, Tuple
+
+import arcade
+import numpy as np
+import pytest
+
+from src import helper
+from src.map_builder import glyph_grid, level_cache
+from src.map_builder.level_builder import STATIC_GLYPHS, SPAWN_GLYPHS, LevelBuilder
+from src.map_builder.sprite_pool import SpritePool
+
+MAPS = sorted(Path("assets/maps").glob("*.txt"))
+GLYPHS = STATIC_GLYPHS + SPAWN_GLYPHS
+
+
+def grid_rows(path: Path) -> List[str]:
+    """The ASCII grid of a map file, as written (no header checks)."""
+    return path.read_text(encoding="utf-8").split("---", 1)[1].splitlines()
+
+
+def per_cell(rows: List[str]) -> Dict[str, Set[Tuple[int, int]]]:
+    """The old walk: one character at a time, row 0 = bottom."""
+    cells: Dict[str, Set[Tuple[int, int]]] = {}
+    for row_index, row in enumerate(reversed(rows)):
+        for col_index, symbol in enumerate(row):
+            if symbol in GLYPHS:
+                cells.setdefault(symbol, set()).add((col_index, row_index))
+    return cells
+
+
+def test_glyph_array_is_flipped_padded_and_unicode() -> None:
+    grid = glyph_grid.glyph_array(["£=", "S"])
+    assert grid.shape == (2, 2)
+    assert [chr(c) for c in grid[0]] == ["S", " "]          # bottom row, padded
+    assert [chr(c) for c in grid[1]] == ["£", "="]
+    assert glyph_grid.glyph_array([]).shape == (0, 0)
+
+
+def test_masks_and_cell_centers() -> None:
+    grid = glyph_grid.glyph_array(["x-x", "=*="])
+    assert glyph_grid.glyph_mask(grid, "=x").tolist() == [[True, False, True], [True, False, True]]
+    cells = glyph_grid.glyph_cells(grid, ("x", "*", "£"))
+    assert set(cells) == {"x", "*"}                          # absent glyphs are left out
+    cols, rows = cells["x"]
+    assert list(zip(cols.tolist(), rows.tolist())) == [(0, 1), (2, 1)]
+    xs, ys = glyph_grid.cell_centers(cols, rows)
+    assert list(zip(xs.tolist(), ys.tolist())) == [helper.grid_to_world(0, 1), helper.grid_to_world(2, 1)]
+    assert xs.dtype == np.float64
+
+
+@pytest.mark.parametrize("path", MAPS, ids=[p.name for p in MAPS])
+def test_glyph_cells_match_the_per_cell_walk(path: Path) -> None:
+    rows = grid_rows(path)
+    cells = glyph_grid.glyph_cells(glyph_grid.glyph_array(rows), GLYPHS)
+    found = {glyph: set(zip(cols.tolist(), rws.tolist())) for glyph, (cols, rws) in cells.items()}
+    assert found == per_cell(rows)
+
+
+def synthetic_map(folder: Path, side: int = 60) -> Path:
+    rnd = np.random.default_rng(7)
+    rows = ["".join(rnd.choice(list("==-x*£   "), side)) for _ in range(side)]
+    path = folder / "synthetic.txt"
+    path.write_text(f"width: {side}\nheight: {side}\n---\nS" + "\n".join(rows)[1:] + "\n", encoding="utf-8")
+    return path
+
+
+@pytest.mark.parametrize("name", ["1.txt", "synthetic"])
+def test_built_static_sprites_match_the_per_cell_walk(window: arcade.Window, tmp_path: Path, name: str) -> None:
+    path = synthetic_map(tmp_path) if name == "synthetic" else Path("assets/maps", name)
+    compiled = level_cache.load_compiled(path, use_cache=False)
+    expected = per_cell(compiled["rows"])
+
+    def centers(*glyphs: str) -> Counter[Tuple[float, float]]:
+        return Counter(helper.grid_to_world(c, r) for g in glyphs for c, r in expected.get(g, ()))
+
+    pool = SpritePool()
+    builder = LevelBuilder(use_cache=False, pool=pool)
+    for _ in range(2):                                       # fresh, then out of the pool
+        level = builder.build_level(str(path), compiled)
+        assert Counter(s.position for s in level["walls"]) == centers("-", "=", "x")
+        assert Counter(s.position for s in level["coins"]) == centers("*")
+        assert Counter(s.position for s in level["death"]) == centers("£")
+        assert level["walls"].spatial_hash is not None
+        if level["walls"]:
+            wall = level["walls"][0]
+            assert wall in arcade.get_sprites_at_point(wall.position, level["walls"])
+        statics = [s for name in ("walls", "coins", "death") for s in level[name]]
+        for name in ("walls", "coins", "death"):
+            level[name].clear()
+        pool.release(statics)
+    assert pool.reused == len(statics)
@@ -0,0 +1,49 @@
+# tests/test_health_bar.py
+from __future__ import annotations
+
+import arcade
+import pytest
+
+from src.constants_proj import SCALE_FACTOR
+from src.entities.blob import Blob
+from src.game.health_bar import HealthBarLayer
+
+
+def test_only_damaged_objects_get_a_bar(window: arcade.Window) -> None:
+    blobs = [Blob((64.0 * i, 0.0)) for i in range(4)]
+    blobs[1].current_health -= 10
+    blobs[3].current_health -= 10
+    layer = HealthBarLayer()
+    layer.sync(blobs)
+    assert len(layer) == 2
+    assert sum(s.visible for s in layer.frames) == 2 == sum(s.visible for s in layer.fills)
+    layer.draw()
+
+
+def test_bar_follows_owner_and_health(window: arcade.Window) -> None:
+    blob = Blob((100.0, 100.0))
+    blob.current_health = blob.max_health // 2
+    layer = HealthBarLayer()
+    layer.sync([blob])
+    frame, fill = layer.frames[0], layer.fills[0]
+    assert frame.center_x == 100.0
+    assert fill.width == pytest.approx(75 * 0.5 * SCALE_FACTOR)
+    assert fill.left == pytest.approx(100.0 - 38 * SCALE_FACTOR)
+
+    blob.center_x = 300.0
+    blob.current_health = blob.max_health // 5
+    layer.sync([blob])
+    assert frame.center_x == 300.0
+    assert fill.width == pytest.approx(75 * 0.2 * SCALE_FACTOR)
+
+
+def test_sprites_of_hidden_bars_are_reused(window: arcade.Window) -> None:
+    a, b = Blob((0.0, 0.0)), Blob((64.0, 0.0))
+    a.current_health -= 10
+    layer = HealthBarLayer()
+    layer.sync([a, b])
+    a.heal(10)
+    b.current_health -= 10
+    layer.sync([a, b])
+    assert len(layer) == 1 and len(layer.frames) == 1
+    assert layer.frames[0].center_x == 64.0
@@ -0,0 +1,32 @@
+# tests/test_hud.py
+from __future__ import annotations
+
+import arcade
+import numpy as np
+
+from src.game.hud import Hud
+
+
+def test_texts_change_only_with_their_value(window: arcade.Window) -> None:
+    hud = Hud(window)
+    hud.update(0, 100)
+    hud.update(0, 100)
+    assert hud.layouts == 2
+    hud.update(3, 100)
+    assert hud.layouts == 3
+    assert hud.score_text.text == "Score : 3"
+    assert hud.health_text.text == "Health : 100"
+
+
+def test_cached_hud_looks_like_the_texts(window: arcade.Window) -> None:
+    def shot(hud: Hud) -> np.ndarray:
+        window.clear(color=(40, 80, 120, 255))
+        hud.draw()
+        return np.asarray(arcade.get_image(0, 0, window.width, window.height)).astype(int)
+
+    plain, cached = Hud(window), Hud(window, cached=True)
+    for hud in (plain, cached):
+        hud.update(12, 80)
+    assert np.abs(shot(plain) - shot(cached)).max() <= 8
+    cached.update(12, 80)
+    assert not cached._dirty                      # nothing changed: no re-render
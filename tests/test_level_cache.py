@@ -0,0 +1,78 @@
+# tests/test_level_cache.py
+from __future__ import annotations
+
+import shutil
+from pathlib import Path
+from typing import Any, List
+
+import pytest
+
+from src.map_builder import level_cache
+from src.map_builder.level_cache import cache_path, load_compiled
+
+MAP = Path("assets/maps/1.txt")
+
+
+@pytest.fixture
+def level_file(tmp_path: Path) -> Path:
+    return Path(shutil.copy(MAP, tmp_path / "1.txt"))
+
+
+@pytest.fixture
+def compiles(monkeypatch: pytest.MonkeyPatch) -> List[Path]:
+    """Maps actually parsed (cache misses)."""
+    seen: List[Path] = []
+    compile_level = level_cache.compile_level
+
+    def spy(filename: Any, digest: str = "") -> level_cache.CompiledLevel:
+        seen.append(Path(filename))
+        return compile_level(filename, digest)
+
+    monkeypatch.setattr(level_cache, "compile_level", spy)
+    return seen
+
+
+def test_second_load_comes_from_the_cache(level_file: Path, compiles: List[Path]) -> None:
+    first = load_compiled(level_file)
+    assert cache_path(level_file).is_file()
+    assert load_compiled(level_file) == first
+    assert len(compiles) == 1
+
+
+def test_edited_map_is_recompiled(level_file: Path, compiles: List[Path]) -> None:
+    load_compiled(level_file)
+    text = level_file.read_text(encoding="utf-8")
+    level_file.write_text(text.replace("*", " ", 1), encoding="utf-8")
+    load_compiled(level_file)
+    assert len(compiles) == 2
+
+
+def test_format_version_bump_invalidates(level_file: Path, compiles: List[Path], monkeypatch: pytest.MonkeyPatch) -> None:
+    load_compiled(level_file)
+    monkeypatch.setattr(level_cache, "CACHE_VERSION", level_cache.CACHE_VERSION + 1)
+    assert load_compiled(level_file)["version"] == level_cache.CACHE_VERSION
+    assert len(compiles) == 2
+
+
+@pytest.mark.parametrize("damage", [
+    lambda data: data[: len(data) // 2],                     # truncated
+    lambda data: b"garbage",
+    lambda data: b"cno_such_module\nThing\n.",               # pickled class that is gone
+    lambda data: b"\x80\x05K\x01K\x02\x86\x94.",             # a tuple, not a dict
+])
+def test_damaged_cache_is_rebuilt(level_file: Path, compiles: List[Path], damage: Any) -> None:
+    first = load_compiled(level_file)
+    cache = cache_path(level_file)
+    cache.write_bytes(damage(cache.read_bytes()))
+    assert load_compiled(level_file) == first
+    assert len(compiles) == 2
+    assert load_compiled(level_file) == first                # and written back
+    assert len(compiles) == 2
+
+
+def test_unwritable_cache_still_loads(level_file: Path, compiles: List[Path]) -> None:
+    cache_path(level_file).mkdir()                           # the cache can not be replaced
+    assert load_compiled(level_file)["rows"]
+    assert load_compiled(level_file)["rows"]
+    assert len(compiles) == 2
+    assert sorted(p.name for p in level_file.parent.iterdir()) == ["1.txt", "1.txt.cache"]   # no .tmp left
@@ -0,0 +1,39 @@
+# tests/test_level_state.py
+from __future__ import annotations
+
+import arcade
+
+from src.game.level_state import LevelSnapshot
+from src.game.objects import Object
+from src.map_builder.level_builder import LevelBuilder
+
+MAP = "assets/maps/1.txt"
+
+
+def test_restore_rewinds_membership_positions_state_and_store(window: arcade.Window) -> None:
+    level = LevelBuilder().build_level(MAP)
+    monsters, platforms, gates, switches = level["monsters"], level["platforms"], level["gates"], level["switches"]
+    snapshot = LevelSnapshot(
+        members=(level["coins"], monsters),
+        sprites=(level["player"], platforms, gates, switches),
+    )
+    monster, platform, gate, switch = monsters[0], platforms[0], gates[0], switches[0]
+    start, was_open, health = platform.position, gate.is_open, monster.current_health
+    meta = switch._meta
+
+    Object.add_health_all([monster], -10 * health)
+    monster.remove_from_sprite_lists()                       # killed, as GameView does it
+    assert monster not in monsters
+    platform.center_x += 300
+    gate.toggle()
+    meta["state"] = "changed in place"
+    switch.added_later = True                                # type: ignore[attr-defined]
+
+    snapshot.restore()
+    assert monster in monsters and monster.current_health == health
+    assert platform.position == start
+    assert gate.is_open == was_open and gate.visible == (not was_open)
+    assert switch._meta is meta and meta.get("state") != "changed in place"
+    assert not hasattr(switch, "added_later")
+    snapshot.restore()                                       # the snapshot itself was not touched
+    assert meta.get("state") != "changed in place"
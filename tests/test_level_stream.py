@@ -0,0 +1,95 @@
+# tests/test_level_stream.py
+from __future__ import annotations
+
+from typing import Tuple
+
+import arcade
+
+from src.constants_proj import TILESIZE
+from src.game.objects import Object
+from src.map_builder.chunks import CHUNK_TILES, ChunkKey, Rect, chunk_of_point, chunk_rect
+from src.map_builder.level_builder import LevelBuilder
+
+MAP = "assets/maps/1.txt"
+SPAN = CHUNK_TILES * TILESIZE
+NOWHERE: Rect = (-10 * SPAN, -10 * SPAN, -9 * SPAN, -9 * SPAN)     # no chunk of the map
+
+
+def view(key: ChunkKey) -> Rect:
+    """View covering exactly chunk *key* (with radius 0)."""
+    left, bottom, right, top = chunk_rect(key)
+    return left, bottom, right - 1.0, top - 1.0
+
+
+def positions(sprites: arcade.SpriteList[arcade.Sprite]) -> set[Tuple[float, float]]:
+    return {s.position for s in sprites}
+
+
+def test_streamed_collision_mesh_follows_the_loaded_chunks(window: arcade.Window) -> None:
+    level, streamer = LevelBuilder(collision_mesh=True).build_streamed_level(MAP, radius=0)
+    collision = level["collision"]
+    assert collision is not level["walls"] and len(collision) == 0      # nothing meshed up front
+
+    streamer.update((0.0, 0.0, SPAN - 1.0, SPAN - 1.0))
+    assert 0 < len(collision) < len(level["walls"])
+    assert all(rect.left >= 0 and rect.right <= SPAN for rect in collision)
+    first = list(collision)
+
+    streamer.update((2 * SPAN, 0.0, 3 * SPAN - 1.0, SPAN - 1.0))
+    assert not any(rect in collision for rect in first)
+    streamer.update((0.0, 0.0, SPAN - 1.0, SPAN - 1.0))
+    assert list(collision) == first                     # meshed once, reused
+    streamer.clear()
+    assert len(collision) == 0
+
+
+def test_evicted_chunks_leave_the_lists_and_go_back_to_the_pool(window: arcade.Window) -> None:
+    builder = LevelBuilder()
+    level, streamer = builder.build_streamed_level(MAP, radius=0)
+    streamer.update(view((0, 0)))
+    assert streamer.loaded_chunks == {(0, 0)}
+    walls = list(level["walls"])
+    assert walls and all(chunk_of_point(*w.position) == (0, 0) for w in walls)
+    created = builder.pool.created
+
+    streamer.update(NOWHERE)
+    assert streamer.loaded_chunks == set()
+    assert len(level["walls"]) == 0 and not any(w.sprite_lists for w in walls)
+    assert builder.pool.free_count >= len(walls)
+
+    streamer.update(view((0, 0)))                       # same tiles, recycled sprites
+    assert positions(level["walls"]) == {w.position for w in walls}
+    assert builder.pool.created == created
+
+
+def test_consumed_cells_stay_consumed_across_eviction(window: arcade.Window) -> None:
+    level, streamer = LevelBuilder().build_streamed_level(MAP, radius=0)
+    streamer.update((0.0, 0.0, 1000 * SPAN, 100 * SPAN))  # the whole map
+    monster = level["monsters"][0]
+    monster_key = chunk_of_point(*monster.position)
+    coin = next(c for c in level["coins"] if chunk_of_point(*c.position) != monster_key)
+    coin_key = chunk_of_point(*coin.position)
+    coin_at, monster_at = coin.position, monster.position
+
+    streamer.update(view(coin_key))
+    coin.remove_from_sprite_lists()                     # picked up
+    streamer.update(view(monster_key))                  # reloaded: maybe another pooled sprite
+    monster = next(m for m in level["monsters"] if m.position == monster_at)
+    Object.add_health_all([monster], -10 * monster.current_health)
+    assert monster.current_health == 0
+    monster.remove_from_sprite_lists()                  # killed, as GameView does it
+    coins_left = positions(level["coins"])
+
+    for key in (coin_key, monster_key):                 # leave and come back
+        streamer.update(NOWHERE)
+        streamer.update(view(key))
+        assert coin_at not in positions(level["coins"])
+        assert monster_at not in positions(level["monsters"])
+    assert positions(level["coins"]) == coins_left
+
+    streamer.reset(view(coin_key))                      # a new attempt brings them back
+    streamer.update(view(monster_key))
+    streamer.update(view(coin_key))
+    assert coin_at in positions(level["coins"])
+    streamer.update(view(monster_key))
+    assert monster_at in positions(level["monsters"])
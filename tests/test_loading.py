@@ -0,0 +1,65 @@
+# tests/test_loading.py
+from __future__ import annotations
+
+import shutil
+import time
+from pathlib import Path
+
+import arcade
+import pytest
+from PIL import UnidentifiedImageError
+
+from src.game.loading import AssetLoader, LoadingView
+from src.texture_manager import COIN_TEXTURE, GAME_OVER_SOUND, LAVA_TEXTURE, AssetRegistry
+
+
+def finish(loader: AssetLoader, budget: int = 1) -> int:
+    """Pump *loader* until it is done; returns the number of pumps that filed something."""
+    pumps = 0
+    deadline = time.monotonic() + 10
+    while not loader.finished:
+        assert time.monotonic() < deadline
+        filed = loader.pump(budget)
+        assert filed <= budget
+        pumps += filed > 0
+    return pumps
+
+
+def test_loaded_textures_are_the_ones_sprites_get(window: arcade.Window, tmp_path: Path) -> None:
+    for name in (COIN_TEXTURE, LAVA_TEXTURE):
+        shutil.copy(name, tmp_path)
+    registry = AssetRegistry()
+    loader = AssetLoader(registry, directory=str(tmp_path), sounds=(GAME_OVER_SOUND,))
+    assert loader.total == 3
+    assert finish(loader) == 3                      # one asset per pump
+    assert loader.progress == 1.0
+
+    coin = (tmp_path / "coin.png").as_posix()
+    assert registry.texture(coin) is arcade.Sprite(coin).texture
+    assert window.ctx.default_atlas.has_texture(registry.texture(coin))
+    assert registry.sound(GAME_OVER_SOUND).get_length() > 0
+    assert registry.stats()["misses"] == 3 and registry.stats()["hits"] == 3
+
+
+def test_loader_skips_what_is_loaded_and_reraises_errors(window: arcade.Window, tmp_path: Path) -> None:
+    shutil.copy(COIN_TEXTURE, tmp_path)
+    (tmp_path / "broken.png").write_bytes(b"not a png")
+    registry = AssetRegistry()
+    registry.texture((tmp_path / "coin.png").as_posix())
+    loader = AssetLoader(registry, directory=str(tmp_path), sounds=())
+    assert loader.total == 1
+    with pytest.raises(UnidentifiedImageError):
+        finish(loader)
+
+
+def test_loading_view_shows_the_next_view_once_done(window: arcade.Window, tmp_path: Path) -> None:
+    shutil.copy(COIN_TEXTURE, tmp_path)
+    next_view = arcade.View()
+    view = LoadingView(lambda: next_view, AssetLoader(AssetRegistry(), directory=str(tmp_path), sounds=()))
+    window.show_view(view)
+    deadline = time.monotonic() + 10
+    while window.current_view is view:
+        assert time.monotonic() < deadline
+        view.on_draw()
+        view.on_update(1 / 60)
+    assert window.current_view is next_view
@@ -0,0 +1,97 @@
+# tests/test_platform_build.py
+from __future__ import annotations
+
+import pathlib
+import random
+
+import arcade
+import pytest
+import yaml
+
+from src.map_builder.platform_build import (
+    ARROWS_H,
+    ARROWS_V,
+    ELIGIBLE,
+    Chosen,
+    GridPos,
+    PlatformSpec,
+    _collect_arrow_series,
+    _label_blocks,
+    block_series,
+    fuse_series_for_block,
+    fuse_vertical_series_for_block,
+    spawn_platforms,
+)
+from src.map_builder.sprite_pool import SpritePool
+from src.texture_manager import GROUND_TEXTURE
+
+# ---------------------------------------------------------------------------
+#  Référence : l’ancien parcours bloc × séries × cellules
+# ---------------------------------------------------------------------------
+
+
+def reference_block_series(rows: list[str], width: int) -> list[tuple[list[GridPos], str, Chosen]]:
+    blocks = _label_blocks(rows, width)
+    series_h, series_v = _collect_arrow_series(rows, width)
+    found: list[tuple[list[GridPos], str, Chosen]] = []
+    for cells in blocks.values():
+        chosen = fuse_series_for_block(cells, series_h, axis="x")
+        axis = "x"
+        if chosen is None:
+            chosen = fuse_vertical_series_for_block(cells, series_v)
+            axis = "y"
+        if chosen is not None:
+            found.append((cells, axis, chosen))
+    return found
+
+
+def shipped_maps() -> list[pathlib.Path]:
+    root = pathlib.Path(__file__).resolve().parent.parent / "assets"
+    return sorted(root.rglob("*.txt"))
+
+
+def raw_grid(path: pathlib.Path) -> tuple[list[str], int]:
+    """Grille brute (sans la validation de hauteur de MapLoader)."""
+    header, grid = path.read_text(encoding="utf-8").split("---", 1)
+    width: int = yaml.safe_load(header)["width"]
+    rows = [line.ljust(width) for line in grid.splitlines()]
+    return rows, width
+
+
+# ---------------------------------------------------------------------------
+#  Tests
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("path", shipped_maps(), ids=lambda p: p.name)
+def test_block_series_matches_reference_on_shipped_maps(path: pathlib.Path) -> None:
+    """Les cartes livrées donnent exactement les mêmes plateformes."""
+    rows, width = raw_grid(path)
+    assert block_series(rows, width) == reference_block_series(rows, width)
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_block_series_matches_reference_on_random_grids(seed: int) -> None:
+    """Grilles aléatoires : mêmes blocs, même ordre, mêmes séries fusionnées."""
+    rnd = random.Random(seed)
+    width, height = rnd.randint(1, 30), rnd.randint(1, 30)
+    alphabet = sorted(ELIGIBLE) + sorted(ARROWS_H) * 2 + sorted(ARROWS_V) * 2 + [" "] * 4
+    rows = ["".join(rnd.choice(alphabet) for _ in range(width)) for _ in range(height)]
+    assert block_series(rows, width) == reference_block_series(rows, width)
+
+
+def test_pooled_tile_forgets_the_boundaries_of_its_other_axis(window: arcade.Window) -> None:
+    """Une tuile du pool passée de l'axe x à l'axe y n'a plus de bornes x."""
+    pool = SpritePool()
+    spec_x = PlatformSpec(texture=GROUND_TEXTURE, start_pos=(100.0, 100.0), axis="x",
+                          direction=True, boundary_a=50.0, boundary_b=150.0)
+    (tile,) = spawn_platforms([spec_x], pool)
+    pool.release([tile])
+    spec_y = PlatformSpec(texture=GROUND_TEXTURE, start_pos=(1000.0, 1000.0), axis="y",
+                          direction=True, boundary_a=900.0, boundary_b=1100.0)
+    (reused,) = spawn_platforms([spec_y], pool)
+    assert reused is tile
+    assert reused.boundary_left is None and reused.boundary_right is None
+    assert (reused.boundary_top, reused.boundary_bottom) == (900.0, 1100.0)
+    pool.release([reused])
+    assert spawn_platforms([spec_x], pool)[0].boundary_top is None
@@ -0,0 +1,79 @@
+# tests/test_prefetch.py
+from __future__ import annotations
+
+import shutil
+import threading
+from pathlib import Path
+from typing import Any, List
+
+import arcade
+import pytest
+
+from src.map_builder import level_cache
+from src.map_builder.level_builder import LevelBuilder
+from src.map_builder.prefetch import MAP_CHAIN, LevelPrefetcher, next_map
+
+
+@pytest.fixture
+def level_file(tmp_path: Path) -> str:
+    return str(shutil.copy("assets/maps/1.txt", tmp_path / "1.txt"))
+
+
+@pytest.fixture
+def loads(monkeypatch: pytest.MonkeyPatch) -> List[str]:
+    """Maps loaded through `level_cache.load_compiled`, from any thread."""
+    seen: List[str] = []
+    load_compiled = level_cache.load_compiled
+
+    def spy(filename: Any, use_cache: bool = True) -> level_cache.CompiledLevel:
+        seen.append(str(filename))
+        return load_compiled(filename, use_cache)
+
+    monkeypatch.setattr(level_cache, "load_compiled", spy)
+    return seen
+
+
+def test_next_map_follows_the_chain_and_wraps() -> None:
+    assert [next_map(name) for name in MAP_CHAIN] == [*MAP_CHAIN[1:], MAP_CHAIN[0]]
+    assert next_map("assets/maps/unknown.txt") == MAP_CHAIN[0]
+
+
+def test_prefetched_level_is_handed_over_once(level_file: str, loads: List[str]) -> None:
+    prefetcher = LevelPrefetcher(use_cache=False)
+    assert prefetcher.take(level_file) is None                  # never requested
+    prefetcher.request(level_file)
+    prefetcher.request(level_file)                              # already queued
+    compiled = prefetcher.take(level_file)
+    assert compiled is not None and compiled["rows"]
+    assert loads == [level_file]
+    assert prefetcher.take(level_file) is None                  # handed over already
+
+
+def test_failed_prefetch_falls_back_to_a_synchronous_load(
+    window: arcade.Window, level_file: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    load_compiled = level_cache.load_compiled
+    workers: List[str] = []
+
+    def flaky(filename: Any, use_cache: bool = True) -> level_cache.CompiledLevel:
+        if threading.current_thread() is not threading.main_thread():
+            workers.append(str(filename))
+            raise OSError("map being rewritten")
+        return load_compiled(filename, use_cache)
+
+    monkeypatch.setattr(level_cache, "load_compiled", flaky)
+    prefetcher = LevelPrefetcher(use_cache=False)
+    prefetcher.request(level_file)
+    compiled = prefetcher.take(level_file)                      # no worker error raised here
+    assert compiled is None and workers == [level_file]
+    level = LevelBuilder(use_cache=False).build_level(level_file, compiled)   # as GameView.setup
+    assert len(level["player"]) == 1
+
+
+def test_missing_map_still_fails_where_a_synchronous_load_would(tmp_path: Path) -> None:
+    missing = str(tmp_path / "missing.txt")
+    prefetcher = LevelPrefetcher()
+    prefetcher.request(missing)
+    assert prefetcher.take(missing) is None
+    with pytest.raises(FileNotFoundError):
+        level_cache.load_compiled(missing)
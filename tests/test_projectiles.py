@@ -0,0 +1,100 @@
+# tests/test_projectiles.py
+from __future__ import annotations
+
+import arcade
+import pytest
+
+from src.game.player import Player
+from src.map_builder.tile_grid import TileGrid
+from src.weapons.bow import ARROW_LIFETIME, Bow
+
+
+def make_bow(window: arcade.Window) -> tuple[Bow, Player, arcade.Camera2D]:
+    camera = arcade.Camera2D(viewport=arcade.LBWH(0, 0, 1280, 720))
+    player = Player(pos_x=100, pos_y=200)
+    return Bow(player, camera), player, camera
+
+
+def test_arrow_removed_when_lifetime_is_over(window: arcade.Window) -> None:
+    bow, player, camera = make_bow(window)
+    bow.on_mouse_press(100, 700, arcade.MOUSE_BUTTON_LEFT, 0)       # straight up
+    for _ in range(int(ARROW_LIFETIME * 60) + 1):
+        bow.updating(player, camera, 1 / 60)
+    assert bow.projectiles.live_count == 0
+    assert bow.projectiles.pooled_count == 1
+
+
+def test_arrow_culled_outside_level_bounds(window: arcade.Window) -> None:
+    bow, player, camera = make_bow(window)
+    bow.projectiles.bounds = (0, 0, 1280, 720)
+    bow.on_mouse_press(1200, 200, arcade.MOUSE_BUTTON_LEFT, 0)
+    for _ in range(120):                          # 2 s: well past the right edge
+        bow.updating(player, camera, 1 / 60)
+    assert len(bow.arrows) == 0
+
+
+def test_repeated_shots_reuse_pooled_arrows(window: arcade.Window) -> None:
+    bow, player, camera = make_bow(window)
+    bow.projectiles.bounds = (0, 0, 1280, 720)
+    first = None
+    for _ in range(20):
+        bow.on_mouse_press(500, 200, arcade.MOUSE_BUTTON_LEFT, 0)
+        first = first or bow.arrows[0]
+        for _ in range(int(ARROW_LIFETIME * 60) + 1):
+            bow.updating(player, camera, 1 / 60)
+    assert bow.projectiles.live_count == 0
+    assert bow.projectiles.pooled_count == 1
+
+    bow.on_mouse_press(500, 200, arcade.MOUSE_BUTTON_LEFT, 0)
+    assert bow.arrows[0] is first
+
+
+def test_release_after_hit_recycles_arrow(window: arcade.Window) -> None:
+    bow, player, camera = make_bow(window)
+    bow.on_mouse_press(500, 200, arcade.MOUSE_BUTTON_LEFT, 0)
+    arrow = bow.arrows[0]
+    bow.projectiles.release(arrow)
+    assert (bow.projectiles.live_count, bow.projectiles.pooled_count) == (0, 1)
+
+
+def test_batched_step_matches_arrow_step(window: arcade.Window) -> None:
+    reference, player, camera = make_bow(window)
+    batched, _, _ = make_bow(window)
+    batched.projectiles.batched = True
+    for x, y in [(600, 500), (300, 650), (900, 150)]:
+        reference.projectiles.spawn((100, 200), arcade.Vec2(x - 100, y - 200), 0)
+        batched.projectiles.spawn((100, 200), arcade.Vec2(x - 100, y - 200), 0)
+    for _ in range(30):
+        reference.updating(player, camera, 1 / 60)
+        batched.updating(player, camera, 1 / 60)
+    assert len(batched.projectiles.synced()) == 3
+    for ref, arrow in zip(reference.arrows, batched.arrows):
+        assert arrow.position == pytest.approx(ref.position)
+        assert arrow.angle == pytest.approx(ref.angle)
+        assert (arrow.prev_x, arrow.prev_y) == pytest.approx((ref.prev_x, ref.prev_y))
+        assert arrow._life == pytest.approx(ref._life)
+
+
+def test_batched_arrows_off_screen_are_not_synced(window: arcade.Window) -> None:
+    bow, player, camera = make_bow(window)
+    bow.projectiles.batched = True
+    bow.projectiles.spawn((100, 200), arcade.Vec2(1, 0), 0)
+    for _ in range(120):                          # 1800 px to the right
+        bow.updating(player, camera, 1 / 60)
+    assert bow.projectiles.live_count == 1
+    assert bow.projectiles.synced() == []
+
+    bow.projectiles.batched = False               # state written back on the way out
+    assert bow.arrows[0].center_x > 1280
+
+
+def test_batched_arrows_stop_in_off_screen_walls(window: arcade.Window) -> None:
+    bow, player, camera = make_bow(window)
+    bow.projectiles.batched = True
+    bow.projectiles.gravity = 0                   # straight line at y = 32
+    bow.projectiles.grid = TileGrid.from_rows([" " * 30 + "x"])
+    bow.projectiles.spawn((100, 32), arcade.Vec2(1, 0), 0)
+    for _ in range(150):                          # wall at x = 1920: reached in ~2 s
+        bow.updating(player, camera, 1 / 60)
+    assert bow.projectiles.live_count == 0
+    assert bow.projectiles.pooled_count == 1
@@ -0,0 +1,43 @@
+# tests/test_startup.py
+from __future__ import annotations
+
+import time
+from typing import List
+
+from src.game.startup import StartupReport
+
+
+def test_phases_are_timed_in_order() -> None:
+    report = StartupReport()
+    report.start(time.perf_counter())
+    with report.phase("imports"):
+        pass
+    with report.phase("window"):
+        time.sleep(0.01)
+    assert [name for name, _ in report.phases] == ["imports", "window"]
+    assert report.phases[1][1] >= 0.01
+    assert "window" in report.format()
+
+
+def test_disabled_report_keeps_nothing() -> None:
+    report = StartupReport()
+    for _ in range(3):
+        with report.phase("level build"):
+            pass
+    report.record("asset loading", 1.0)
+    assert report.phases == []
+
+
+def test_only_the_first_frame_closes_the_report() -> None:
+    seen: List[float] = []
+    report = StartupReport()
+    report.on_first_frame = lambda r: seen.append(r.first_frame or 0.0)
+    report.frame_drawn()
+    assert seen == []                               # not started: timed, not reported
+    report = StartupReport()
+    report.on_first_frame = lambda r: seen.append(r.first_frame or 0.0)
+    report.start(time.perf_counter() - 1.0)
+    report.frame_drawn()
+    report.frame_drawn()
+    assert len(seen) == 1 and seen[0] >= 1.0
+    assert "time to first frame" in report.format()
@@ -0,0 +1,52 @@
+# tests/test_sweep.py
+from __future__ import annotations
+
+import arcade
+import pytest
+
+from src.constants_proj import TILESIZE
+from src.game.sweep import segment_entry, segment_t, swept_hits
+from src.map_builder.tile_grid import TileGrid
+from src.weapons.bow import Bow
+
+Y = 2.5 * TILESIZE                                  # flight height, middle of row 2
+
+
+def arrow_from(x0: float, x1: float) -> Bow.Arrow:
+    """An arrow that went from x0 to x1 (at height Y) in its last step."""
+    arrow = Bow.Arrow((x0, Y), arcade.Vec2(1, 0), 0.0)
+    arrow.position = (x1, Y)
+    return arrow
+
+
+def monsters(*xs: float, width: float = 4) -> arcade.SpriteList[arcade.SpriteSolidColor]:
+    sprites: arcade.SpriteList[arcade.SpriteSolidColor] = arcade.SpriteList(use_spatial_hash=True)
+    sprites.extend(arcade.SpriteSolidColor(int(width), TILESIZE, x, Y) for x in xs)
+    return sprites
+
+
+def test_segment_entry() -> None:
+    box = (10.0, -5.0, 20.0, 5.0)
+    assert segment_entry(0, 0, 40, 0, box) == pytest.approx(0.25)
+    assert segment_entry(15, 0, 40, 0, box) == 0.0                   # starts inside
+    assert segment_entry(0, 10, 40, 10, box) is None                 # passes above
+    assert segment_entry(0, 0, 5, 0, box) is None                    # stops short
+    assert segment_entry(0, -20, 30, 10, box) == pytest.approx(0.5)  # diagonal, through a corner
+    assert segment_t(0, 0, 40, 20, 10, 5) == pytest.approx(0.25)
+
+
+def test_fast_arrow_hits_a_thin_monster_it_jumped_over(window: arcade.Window) -> None:
+    arrow, thin = arrow_from(0.0, 400.0), monsters(200.0)
+    assert arcade.check_for_collision_with_list(arrow, thin) == []   # overlap test: tunnelled
+    assert swept_hits(arrow, (0.0, Y), thin) == [thin[0]]
+
+
+def test_hits_come_nearest_first_and_stop_at_the_wall(window: arcade.Window) -> None:
+    grid = TileGrid.from_rows(["      ", "   =  ", "      ", "      "])  # wall at col 3, row 2
+    arrow = arrow_from(0.0, 5 * TILESIZE)
+    targets = monsters(2.5 * TILESIZE, 1.0 * TILESIZE, 4.5 * TILESIZE)
+    wall = grid.raycast(0.0, Y, *arrow.position)
+    assert wall is not None
+    reach = segment_t(0.0, Y, *arrow.position, *wall[:2])
+    assert swept_hits(arrow, (0.0, Y), targets, reach) == [targets[1], targets[0]]
+    assert swept_hits(arrow, (0.0, Y), targets) == [targets[1], targets[0], targets[2]]
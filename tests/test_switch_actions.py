@@ -0,0 +1,63 @@
+# tests/test_switch_actions.py
+from __future__ import annotations
+
+import arcade
+
+from src.map_builder.level_cache import compile_actions
+from src.map_builder.switch import Gate, Switch
+
+GATE_INDEX = {(14, 2): 0, (18, 5): 1}
+
+
+def make_gates(*states: str) -> list[Gate]:
+    return [Gate((64.0 * i, 0.0), state=state) for i, state in enumerate(states)]
+
+
+def test_compile_actions_resolves_gates_and_verbs() -> None:
+    table = compile_actions(
+        [
+            {"action": "open-gate", "x": 14, "y": 2},
+            {"action": "close_gate", "x": 18, "y": 5},
+            {"action": "open-gate", "x": 99, "y": 99},       # no such gate
+            {"action": "disable"},
+        ],
+        GATE_INDEX,
+    )
+    assert table == {"gates": [0, 1], "closed": [False, True], "disable": True}
+
+
+def test_switch_runs_the_table_of_the_state_it_enters(window: arcade.Window) -> None:
+    gates = make_gates("closed", "open")
+    on = compile_actions([{"action": "close-gate", "x": 14, "y": 2},
+                          {"action": "open-gate", "x": 18, "y": 5}], GATE_INDEX)
+    off = compile_actions([{"action": "open-gate", "x": 14, "y": 2},
+                           {"action": "close-gate", "x": 18, "y": 5}], GATE_INDEX)
+    switch = Switch((0, 0), {"state": True}, gates, actions=(on, off))   # YAML `on`
+    assert switch.is_on
+
+    switch.trigger()                                    # → off
+    assert [g.is_open for g in gates] == [True, False]
+    switch.trigger()                                    # → on
+    assert [g.is_open for g in gates] == [False, True]
+
+
+def test_gate_driven_by_several_switches(window: arcade.Window) -> None:
+    gates = make_gates("closed")
+    opens = compile_actions([{"action": "open-gate", "x": 14, "y": 2}], GATE_INDEX)
+    closes = compile_actions([{"action": "close-gate", "x": 14, "y": 2}], GATE_INDEX)
+    a = Switch((0, 0), {}, gates, actions=(opens, closes))
+    b = Switch((0, 0), {}, gates, actions=(closes, opens))
+    a.trigger()
+    assert gates[0].is_open
+    b.trigger()
+    assert not gates[0].is_open
+
+
+def test_disable_action_locks_the_switch(window: arcade.Window) -> None:
+    gates = make_gates("closed")
+    on = compile_actions([{"action": "open-gate", "x": 14, "y": 2}, {"action": "disable"}], GATE_INDEX)
+    off = compile_actions([], GATE_INDEX)
+    switch = Switch((0, 0), {}, gates, actions=(on, off))
+    switch.trigger()
+    switch.trigger()
+    assert switch.is_on and not switch.enabled and gates[0].is_open
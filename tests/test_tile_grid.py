@@ -0,0 +1,134 @@
+# tests/test_tile_grid.py
+from __future__ import annotations
+
+import math
+import random
+
+import arcade
+import pytest
+
+from src.constants_proj import TILESIZE
+from src.game.tile_physics import TileGridPhysicsEngine
+from src.map_builder.tile_grid import EMPTY, FULL, HALF, TileGrid
+
+ROWS = [
+    "x  ",
+    "   ",
+    "=-=",
+]
+
+
+def test_from_rows_bottom_row_first() -> None:
+    grid = TileGrid.from_rows(ROWS)
+    assert (grid.width, grid.height) == (3, 3)
+    assert [grid.kind(col, 0) for col in range(3)] == [FULL, HALF, FULL]
+    assert grid.kind(0, 2) == FULL
+    assert grid.kind(-1, 0) == EMPTY and grid.kind(0, 3) == EMPTY
+
+
+def test_half_tile_only_solid_in_its_upper_half() -> None:
+    grid = TileGrid.from_rows(ROWS)
+    x = 1.5 * TILESIZE
+    assert not grid.solid_at(x, 0.25 * TILESIZE)
+    assert grid.solid_at(x, 0.75 * TILESIZE)
+    # a box in the lower half of the '-' cell touches nothing
+    assert grid.overlapping(TILESIZE + 1, 1, 2 * TILESIZE - 1, TILESIZE / 2) == []
+
+
+def test_touching_boxes_do_not_overlap() -> None:
+    grid = TileGrid.from_rows(ROWS)
+    assert grid.overlapping(0, TILESIZE, TILESIZE, 2 * TILESIZE) == []
+    assert len(grid.overlapping(0, TILESIZE - 1, TILESIZE, 2 * TILESIZE)) == 1
+
+
+def test_set_solid_restores_map_value() -> None:
+    grid = TileGrid.from_rows(ROWS)
+    grid.set_solid(1, 0, True)
+    assert grid.kind(1, 0) == FULL and grid.cells[0, 1] == FULL
+    grid.set_solid(1, 0, False)
+    assert grid.kind(1, 0) == HALF
+
+
+def test_fast_fall_does_not_tunnel_through_floor() -> None:
+    grid = TileGrid.from_rows(["===="])
+    player = arcade.SpriteSolidColor(40, 40, center_x=2 * TILESIZE, center_y=3 * TILESIZE)
+    player.change_y = -3 * TILESIZE                # would end below the floor
+    engine = TileGridPhysicsEngine(player, grid, gravity_constant=1)
+    engine.update()
+    assert player.bottom == pytest.approx(TILESIZE)
+    assert player.change_y == 0
+
+
+# ---------------------------------------------------------------------------
+#  Raycast (swept arrows)
+# ---------------------------------------------------------------------------
+
+
+def test_raycast_stops_at_first_wall_edge() -> None:
+    grid = TileGrid.from_rows(["  x x"])
+    hit = grid.raycast(10, 32, 5 * TILESIZE, 32)
+    assert hit is not None
+    assert hit[2] == (2, 0)
+    assert hit[0] == pytest.approx(2 * TILESIZE)
+
+
+def test_raycast_half_tile() -> None:
+    grid = TileGrid.from_rows(["-"])
+    assert grid.raycast(-10, 10, TILESIZE + 10, 10) is None        # under the slab
+    hit = grid.raycast(32, 5, 32, 60)                                 # from below
+    assert hit is not None and hit[1] == pytest.approx(TILESIZE / 2)
+
+
+def test_raycast_does_not_tunnel() -> None:
+    """A segment many tiles long still stops at a one-tile wall."""
+    grid = TileGrid.from_rows(["     x     "])
+    hit = grid.raycast(0, 40, 11 * TILESIZE, 20)
+    assert hit is not None and hit[2] == (5, 0)
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_raycast_matches_sampling(seed: int) -> None:
+    rnd = random.Random(seed)
+    rows = ["".join(rnd.choice("  =-") for _ in range(8)) for _ in range(8)]
+    grid = TileGrid.from_rows(rows)
+    size = 8 * TILESIZE
+    x0, y0, x1, y1 = (rnd.uniform(1, size - 1) for _ in range(4))
+    samples = 4000
+    first = next(
+        (i / samples for i in range(samples + 1)
+         if grid.solid_at(x0 + (x1 - x0) * i / samples, y0 + (y1 - y0) * i / samples)),
+        None,
+    )
+    hit = grid.raycast(x0, y0, x1, y1)
+    if first is None:
+        assert hit is None
+    else:
+        assert hit is not None
+        t_hit = math.hypot(hit[0] - x0, hit[1] - y0) / math.hypot(x1 - x0, y1 - y0)
+        assert t_hit == pytest.approx(first, abs=2 / samples)
+
+
+# ---------------------------------------------------------------------------
+#  Walk spans (blobs)
+# ---------------------------------------------------------------------------
+
+
+def test_walk_span_stops_at_ledges_and_walls() -> None:
+    grid = TileGrid.from_rows([
+        "    x   ",
+        " ====== ",
+    ])
+    span = grid.walk_span(2.5 * TILESIZE, TILESIZE, 2 * TILESIZE)
+    assert span == (1 * TILESIZE, 4 * TILESIZE)         # ledge left, wall right
+    assert grid.walk_span(0.5 * TILESIZE, TILESIZE, 2 * TILESIZE) is None
+
+
+def test_walk_span_follows_gates() -> None:
+    grid = TileGrid.from_rows([
+        "      ",
+        "======",
+    ])
+    version = grid.version
+    grid.set_solid(3, 1, True)                           # closed gate
+    assert grid.version != version
+    assert grid.walk_span(TILESIZE, TILESIZE, 2 * TILESIZE) == (0, 3 * TILESIZE)